@@ -38,6 +38,8 @@ if "bpy" in locals():
     importlib.reload(pdt_bix)
     importlib.reload(pdt_etof)
     importlib.reload(pdt_tangent)
+    importlib.reload(pdt_timing)
+    importlib.reload(pdt_trace)
     importlib.reload(pdt_trig_waves)
 else:
     from . import pdt_design
@@ -49,6 +51,8 @@ else:
     from . import pdt_bix
     from . import pdt_etof
     from . import pdt_tangent
+    from . import pdt_timing
+    from . import pdt_trace
     from . import pdt_trig_waves
 
 import bpy
@@ -57,6 +61,7 @@ from pathlib import Path
 from bpy.types import (
     AddonPreferences,
     PropertyGroup, Scene,
+    Text,
     WindowManager,
     Object,
 )
@@ -109,9 +114,12 @@ from .pdt_msg_strings import (
     PDT_DES_TPOINT,
     PDT_DES_EXPCOLL,
     PDT_DES_TANMODE,
+    PDT_DES_INTMODE,
+    PDT_DES_SCRIPT,
 )
 from .pdt_command import command_run
 from .pdt_functions import scale_set
+from .pdt_trace import trace_update
 
 
 # Declare enum items variables
@@ -131,6 +139,7 @@ class PDTPreferences(AddonPreferences):
         name="Enable console debug output from PDT scripts",
         default=False,
         description="NOTE: Does not enable debugging globally in Blender (only in PDT scripts)",
+        update=trace_update,
     )
 
     pdt_ui_width: IntProperty(
@@ -143,6 +152,28 @@ class PDTPreferences(AddonPreferences):
         name="Input Rounding", default=5, description="Rounding Factor for Inputs"
     )
 
+    pdt_xall_processes: IntProperty(
+        name="Intersect All Processes",
+        default=1,
+        min=1,
+        max=64,
+        description="Worker processes used by Intersect All on large selections (1 = off)",
+    )
+
+    pdt_timing: BoolProperty(
+        name="Time PDT Commands",
+        default=False,
+        description="Record per stage timings of PDT commands, shown in the PDT Command Timing panel",
+    )
+
+    pdt_profile_commands: IntProperty(
+        name="Commands to Profile",
+        default=10,
+        min=1,
+        max=1000,
+        description="Number of commands captured by Profile Next Commands",
+    )
+
     def draw(self, context):
         layout = self.layout
 
@@ -150,8 +181,14 @@ class PDTPreferences(AddonPreferences):
         row1 = box.row()
         row2 = box.row()
         row1.prop(self, "debug")
+        row1.operator("pdt.trace_dump", icon="TEXT")
         row2.prop(self, "pdt_ui_width")
         row2.prop(self, "pdt_input_round")
+        row3 = box.row()
+        row3.prop(self, "pdt_xall_processes")
+        row4 = box.row()
+        row4.prop(self, "pdt_timing")
+        row4.prop(self, "pdt_profile_commands")
 
 
 def enumlist_objects(self, context):
@@ -349,6 +386,17 @@ class PDTSceneProperties(PropertyGroup):
 
     extend: BoolProperty(name="Trim/Extend All", default=False, description=PDT_DES_TRIM)
 
+    intersect_mode: EnumProperty(
+        items=(
+            ("EDGES", "Edges", "Cut Selected Edges where they cross each other"),
+            ("OBJECTS", "Objects", "Cut Selected Edges where they cross other Selected Objects"),
+            ("PLANE", "Plane", "Cut Selected Edges where they cross in the Working Plane"),
+        ),
+        name="Intersect Mode",
+        default="EDGES",
+        description=PDT_DES_INTMODE,
+    )
+
     lib_objects: EnumProperty(items=enumlist_objects, name="Objects", description=PDT_DES_LIBOBS)
     lib_collections: EnumProperty(
         items=enumlist_collections, name="Collections", description=PDT_DES_LIBCOLS
@@ -385,6 +433,7 @@ class PDTSceneProperties(PropertyGroup):
     command: StringProperty(
         name="Command", default="CA0,0,0", update=command_run, description=PDT_DES_VALIDLET,
     )
+    command_script: PointerProperty(type=Text, name="Command Script", description=PDT_DES_SCRIPT)
     maths_output: FloatProperty(
         name="Maths output", default=0, description=PDT_DES_OUTPUT,
     )
@@ -501,6 +550,8 @@ classes = (
     PDTSceneProperties,
     pdt_bix.PDT_OT_LineOnBisection,
     pdt_command.PDT_OT_CommandReRun,
+    pdt_command.PDT_OT_CommandScript,
+    pdt_command.PDT_OT_CommandScriptFile,
     pdt_design.PDT_OT_PlacementAbs,
     pdt_design.PDT_OT_PlacementDelta,
     pdt_design.PDT_OT_PlacementDis,
@@ -527,6 +578,7 @@ classes = (
     pdt_menus.PDT_PT_PanelPivotPoint,
     pdt_menus.PDT_PT_PanelPartsLibrary,
     pdt_menus.PDT_PT_PanelTrig,
+    pdt_menus.PDT_PT_PanelTiming,
     pdt_pivot_point.PDT_OT_ModalDrawOperator,
     pdt_pivot_point.PDT_OT_ViewPlaneRotate,
     pdt_pivot_point.PDT_OT_ViewPlaneScale,
@@ -543,6 +595,9 @@ classes = (
     pdt_tangent.PDT_OT_TangentSet3,
     pdt_tangent.PDT_OT_TangentSet4,
     pdt_tangent.PDT_OT_TangentExpandMenu,
+    pdt_timing.PDT_OT_TimingProfile,
+    pdt_timing.PDT_OT_TimingReset,
+    pdt_trace.PDT_OT_TraceDump,
     pdt_trig_waves.PDT_OT_WaveGenerator,
     pdt_view.PDT_OT_ViewRot,
     pdt_view.PDT_OT_ViewRotL,
@@ -576,6 +631,8 @@ def register():
 
     Scene.pdt_pg = PointerProperty(type=PDTSceneProperties)
 
+    bpy.app.handlers.load_post.append(pdt_xall.clear_resolved_edges)
+
 
 def unregister():
     """Unregister Classes and Delete Scene Variables.
@@ -594,6 +651,10 @@ def unregister():
     if pdt_wm in window_manager:
         del window_manager[pdt_wm]
 
+    if pdt_xall.clear_resolved_edges in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(pdt_xall.clear_resolved_edges)
+    pdt_xall.clear_resolved_edges()
+
     for cls in reversed(classes):
         unregister_class(cls)
 
@@ -0,0 +1,481 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# <pep8 compliant>
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Benchmarks for the PDT edge tools, run with Blender in background mode:
+#
+#   blender -b --factory-startup --python benchmarks/pdt_benchmark.py -- \
+#       --sizes 1000 10000 100000 --repeat 3 --output bench.json
+#
+# PDT is loaded from the folder given by --addon (default: this clone), so two
+# releases can be timed on the same machine and their JSON files compared with
+#
+#   python benchmarks/pdt_benchmark.py --compare old.json new.json
+#
+# Edge soups are generated from a fixed seed, so every run times the same geometry.
+#
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import time
+
+# Module name PDT is registered under while benchmarking.
+ADDON_NAME = "precision_drawing_tools"
+
+SOUPS = ("random", "grid", "hatch")
+
+FUNCTIONS = (
+    "pdt_xall.get_intersection_dictionary",
+    "pdt_xall.update_mesh",
+    "pdt_bix.add_line_to_bisection",
+    "pdt_etof.extend_vertex",
+)
+
+
+def random_soup(num_edges, rng):
+    """Return Random Short Segments in a Square.
+
+    Note:
+        The square grows with the number of edges so that each edge crosses only a
+        few others, whatever the size of the soup.
+
+    Args:
+        num_edges: Number of Edges
+        rng: random.Random instance
+
+    Returns:
+        List of ((x, y, z), (x, y, z)) End Points.
+    """
+
+    side = num_edges ** 0.5
+    edges = []
+    for _ in range(num_edges):
+        x, y = rng.uniform(0.0, side), rng.uniform(0.0, side)
+        dx, dy = rng.uniform(-1.0, 1.0), rng.uniform(-1.0, 1.0)
+        edges.append(((x, y, 0.0), (x + dx, y + dy, 0.0)))
+    return edges
+
+
+def grid_soup(num_edges, rng):
+    """Return a Regular Grid of Crosses.
+
+    Note:
+        One horizontal and one vertical segment at each grid point, each pair
+        crossing once at the grid point and touching nothing else.
+
+    Args:
+        num_edges: Number of Edges
+        rng: random.Random instance, unused
+
+    Returns:
+        List of ((x, y, z), (x, y, z)) End Points.
+    """
+
+    columns = max(1, int((num_edges / 2) ** 0.5))
+    edges = []
+    for index in range(num_edges // 2):
+        x, y = float(index % columns), float(index // columns)
+        edges.append(((x - 0.4, y + 0.1, 0.0), (x + 0.4, y + 0.1, 0.0)))
+        edges.append(((x + 0.1, y - 0.4, 0.0), (x + 0.1, y + 0.4, 0.0)))
+    return edges
+
+
+def hatch_soup(num_edges, rng):
+    """Return a Hatch Pattern of Near-Parallel Lines.
+
+    Note:
+        Long, closely spaced lines with slightly jittered ends, the bounding boxes of
+        neighbouring lines overlap heavily but only some of the lines cross.
+
+    Args:
+        num_edges: Number of Edges
+        rng: random.Random instance
+
+    Returns:
+        List of ((x, y, z), (x, y, z)) End Points.
+    """
+
+    length = max(10.0, num_edges / 10.0)
+    edges = []
+    for index in range(num_edges):
+        y = index * 0.1
+        edges.append(
+            ((0.0, y + rng.uniform(-0.1, 0.1), 0.0), (length, y + rng.uniform(-0.1, 0.1), 0.0))
+        )
+    return edges
+
+
+def make_soup(name, num_edges, seed):
+    """Return an Edge Soup.
+
+    Args:
+        name: One of SOUPS
+        num_edges: Number of Edges
+        seed: Random Seed
+
+    Returns:
+        List of ((x, y, z), (x, y, z)) End Points.
+    """
+
+    makers = {"random": random_soup, "grid": grid_soup, "hatch": hatch_soup}
+    return makers[name](num_edges, random.Random(seed))
+
+
+def soup_bmesh(edges):
+    """Return a BMesh holding an Edge Soup, all Edges Selected.
+
+    Args:
+        edges: List of ((x, y, z), (x, y, z)) End Points
+
+    Returns:
+        BMesh.
+    """
+
+    import bmesh
+
+    bm = bmesh.new()
+    for co_a, co_b in edges:
+        edge = bm.edges.new((bm.verts.new(co_a), bm.verts.new(co_b)))
+        edge.select = True
+    bm.verts.index_update()
+    bm.edges.index_update()
+    bm.verts.ensure_lookup_table()
+    bm.edges.ensure_lookup_table()
+    return bm
+
+
+def edit_object(bm):
+    """Link a Mesh Object made from bm and put it in Edit Mode.
+
+    Args:
+        bm: BMesh to use
+
+    Returns:
+        The new Object.
+    """
+
+    import bpy
+
+    mesh = bpy.data.meshes.new("pdt_benchmark")
+    bm.to_mesh(mesh)
+    bm.free()
+    obj = bpy.data.objects.new("pdt_benchmark", mesh)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    obj.select_set(True)
+    bpy.ops.object.mode_set(mode="EDIT")
+    return obj
+
+
+def remove_object(obj):
+    """Leave Edit Mode and Delete an Object made by edit_object.
+
+    Args:
+        obj: Object to delete
+
+    Returns:
+        Nothing.
+    """
+
+    import bpy
+
+    bpy.ops.object.mode_set(mode="OBJECT")
+    mesh = obj.data
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
+
+
+def deselect_all(bm):
+    """Deselect every Element of bm.
+
+    Args:
+        bm: BMesh
+
+    Returns:
+        Nothing.
+    """
+
+    for elements in (bm.faces, bm.edges, bm.verts):
+        for element in elements:
+            element.select = False
+
+
+def setup_xall_dictionary(pdt, edges):
+    """Prepare a Call of get_intersection_dictionary on the whole Soup.
+
+    Args:
+        pdt: The PDT package
+        edges: List of ((x, y, z), (x, y, z)) End Points
+
+    Returns:
+        Function to time and Function to clean up afterwards.
+    """
+
+    bm = soup_bmesh(edges)
+    edge_indices = [edge.index for edge in bm.edges]
+
+    def call():
+        return len(pdt.pdt_xall.get_intersection_dictionary(bm, edge_indices))
+
+    return call, bm.free
+
+
+def setup_xall_update(pdt, edges):
+    """Prepare a Call of update_mesh, Intersections found as Intersect All does.
+
+    Args:
+        pdt: The PDT package
+        edges: List of ((x, y, z), (x, y, z)) End Points
+
+    Returns:
+        Function to time and Function to clean up afterwards.
+    """
+
+    bm = soup_bmesh(edges)
+    edge_indices = [edge.index for edge in bm.edges]
+    int_dict = pdt.pdt_xall.get_intersection_dictionary(bm, edge_indices)
+    pdt.pdt_xall.unselect_nonintersecting(bm, int_dict.keys(), edge_indices)
+
+    def call():
+        pdt.pdt_xall.update_mesh(bm, int_dict)
+        return len(int_dict)
+
+    return call, bm.free
+
+
+def setup_bisection(pdt, edges):
+    """Prepare a Call of add_line_to_bisection, two extra Edges selected in the Soup.
+
+    Args:
+        pdt: The PDT package
+        edges: List of ((x, y, z), (x, y, z)) End Points
+
+    Returns:
+        Function to time and Function to clean up afterwards.
+    """
+
+    import bpy
+    import bmesh
+
+    bm = soup_bmesh(edges)
+    deselect_all(bm)
+    corner = bm.verts.new((-10.0, -10.0, 0.0))
+    for co in ((-5.0, -10.0, 0.0), (-10.0, -5.0, 0.0)):
+        bm.edges.new((corner, bm.verts.new(co))).select = True
+    obj = edit_object(bm)
+
+    def call():
+        pdt.pdt_bix.add_line_to_bisection(bpy.context)
+        return len(bmesh.from_edit_mesh(obj.data).edges)
+
+    return call, lambda: remove_object(obj)
+
+
+def setup_extend(pdt, edges):
+    """Prepare a Call of extend_vertex, an extra Edge and Face selected in the Soup.
+
+    Args:
+        pdt: The PDT package
+        edges: List of ((x, y, z), (x, y, z)) End Points
+
+    Returns:
+        Function to time and Function to clean up afterwards.
+    """
+
+    import bpy
+    import bmesh
+
+    bm = soup_bmesh(edges)
+    deselect_all(bm)
+    face_verts = [
+        bm.verts.new(co)
+        for co in ((-10.0, -1.0, -1.0), (-10.0, 1.0, -1.0), (-10.0, 1.0, 1.0), (-10.0, -1.0, 1.0))
+    ]
+    bm.faces.new(face_verts).select = True
+    bm.edges.new((bm.verts.new((-5.0, 0.0, 0.0)), bm.verts.new((-4.0, 0.0, 0.0)))).select = True
+    obj = edit_object(bm)
+
+    def call():
+        pdt.pdt_etof.extend_vertex(bpy.context)
+        return len(bmesh.from_edit_mesh(obj.data).edges)
+
+    return call, lambda: remove_object(obj)
+
+
+SETUPS = {
+    "pdt_xall.get_intersection_dictionary": setup_xall_dictionary,
+    "pdt_xall.update_mesh": setup_xall_update,
+    "pdt_bix.add_line_to_bisection": setup_bisection,
+    "pdt_etof.extend_vertex": setup_extend,
+}
+
+
+def load_pdt(path):
+    """Import and Register PDT from a Folder.
+
+    Note:
+        PDT is registered as an add-on under ADDON_NAME, so that its preferences can
+        be read as they would be in a normal session.
+
+    Args:
+        path: Folder holding PDT's __init__.py
+
+    Returns:
+        The PDT package.
+    """
+
+    import bpy
+
+    spec = importlib.util.spec_from_file_location(
+        ADDON_NAME, os.path.join(path, "__init__.py"), submodule_search_locations=[path]
+    )
+    pdt = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_NAME] = pdt
+    spec.loader.exec_module(pdt)
+    pdt.register()
+    if ADDON_NAME not in bpy.context.preferences.addons:
+        bpy.context.preferences.addons.new().module = ADDON_NAME
+    return pdt
+
+
+def run_case(pdt, function, soup, size, repeat, seed):
+    """Time one Function on one Soup.
+
+    Note:
+        Geometry is rebuilt before every run and setup is not timed.
+
+    Args:
+        pdt: The PDT package
+        function: One of FUNCTIONS
+        soup: One of SOUPS
+        size: Number of Edges in the Soup
+        repeat: Number of Timed Runs
+        seed: Random Seed
+
+    Returns:
+        Dictionary of Results.
+    """
+
+    edges = make_soup(soup, size, seed)
+    times = []
+    output = None
+    for _ in range(repeat):
+        call, cleanup = SETUPS[function](pdt, edges)
+        start = time.perf_counter()
+        output = call()
+        times.append(time.perf_counter() - start)
+        cleanup()
+    return {
+        "function": function,
+        "soup": soup,
+        "edges": size,
+        "output": output,
+        "min": min(times),
+        "mean": sum(times) / len(times),
+        "times": times,
+    }
+
+
+def run(args):
+    """Run the Benchmarks selected by args and Write the Results.
+
+    Args:
+        args: Parsed Command Line
+
+    Returns:
+        Nothing.
+    """
+
+    import bpy
+
+    pdt = load_pdt(os.path.abspath(args.addon))
+    results = []
+    for function in args.functions:
+        for soup in args.soups:
+            for size in args.sizes:
+                result = run_case(pdt, function, soup, size, args.repeat, args.seed)
+                print(f"{function:40} {soup:8} {size:>8} {result['min']:.6f}s")
+                results.append(result)
+
+    report = {
+        "pdt_version": ".".join(str(part) for part in pdt.bl_info["version"]),
+        "blender_version": bpy.app.version_string,
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+
+def compare(old_path, new_path):
+    """Print the Change in Minimum Time between two Result Files.
+
+    Args:
+        old_path: Earlier JSON Results
+        new_path: Later JSON Results
+
+    Returns:
+        Nothing.
+    """
+
+    with open(old_path) as old_file, open(new_path) as new_file:
+        old, new = json.load(old_file), json.load(new_file)
+
+    def by_case(report):
+        return {(r["function"], r["soup"], r["edges"]): r for r in report["results"]}
+
+    old_cases, new_cases = by_case(old), by_case(new)
+    print(f"PDT {old['pdt_version']} -> {new['pdt_version']}")
+    for case in sorted(set(old_cases) & set(new_cases)):
+        before, after = old_cases[case]["min"], new_cases[case]["min"]
+        ratio = before / after if after else float("inf")
+        print(f"{case[0]:40} {case[1]:8} {case[2]:>8} {before:.6f}s {after:.6f}s x{ratio:.2f}")
+
+
+def parse_args(argv):
+    """Parse the Command Line.
+
+    Args:
+        argv: Arguments, after "--" when run by Blender
+
+    Returns:
+        argparse.Namespace.
+    """
+
+    folder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Benchmark PDT's edge tools.")
+    parser.add_argument("--addon", default=folder, help="folder holding PDT")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--soups", nargs="+", choices=SOUPS, default=list(SOUPS))
+    parser.add_argument("--functions", nargs="+", choices=FUNCTIONS, default=list(FUNCTIONS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON file to write, default stdout")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two JSON files and exit"
+    )
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    ARGV = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    ARGS = parse_args(ARGV)
+    if ARGS.compare:
+        compare(*ARGS.compare)
+    else:
+        run(ARGS)
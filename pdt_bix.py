@@ -16,7 +16,7 @@ from .pdt_msg_strings import (
     PDT_ERR_NCEDGES,
     PDT_ERR_EDOB_MODE,
 )
-from .pdt_functions import debug, oops
+from .pdt_functions import debug, edit_bmesh, error_popup, refresh_edit_mesh
 
 
 def add_line_to_bisection(context):
@@ -33,7 +33,7 @@ def add_line_to_bisection(context):
     if all([bool(obj), obj.type == "MESH", obj.mode == "EDIT"]):
         pg = context.scene.pdt_pg
         obj_data = obj.data
-        bm = bmesh.from_edit_mesh(obj_data)
+        bm = edit_bmesh(obj_data)
 
         bm.verts.ensure_lookup_table()
         bm.edges.ensure_lookup_table()
@@ -42,11 +42,11 @@ def add_line_to_bisection(context):
 
         if not len(edges) == 2:
             pg.error = f"{PDT_ERR_2CPNPE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
 
         [[vector_a, vector_b], [vector_c, vector_d]] = [[v.co for v in e.verts] for e in edges]
-        debug(f"vectors found:\n {vector_a}\n {vector_b}\n {vector_c}\n {vector_d}")
+        debug("vectors found:\n %s\n %s\n %s\n %s", vector_a, vector_b, vector_c, vector_d)
 
         dist1 = (vector_a - vector_b).length
         dist2 = (vector_c - vector_d).length
@@ -56,7 +56,7 @@ def add_line_to_bisection(context):
 
         if not cm.test_coplanar(edge1, edge2):
             pg.error = PDT_ERR_NCEDGES
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
 
         # get intersect_point and pick farthest vertex from (projected) intersections
@@ -85,10 +85,10 @@ def add_line_to_bisection(context):
         bm.edges.new((vec1, vec2))
         bm.edges.new((vec2, vec3))
         bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
-        bmesh.update_edit_mesh(obj_data)
+        refresh_edit_mesh(obj_data)
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
 
 
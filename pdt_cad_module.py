@@ -8,6 +8,8 @@
 # ----------------------------------------------------------
 #
 import bmesh
+import numpy as np
+from itertools import chain
 from mathutils import Vector
 from mathutils.geometry import intersect_line_line, intersect_point_line
 from .pdt_functions import debug
@@ -100,13 +102,12 @@ def closest_idx(intersect_point, edge):
     """
 
     if isinstance(edge, bmesh.types.BMEdge):
-        edge_verts = edge.verts
-        vector_a = edge_verts[0].co
-        vector_b = edge_verts[1].co
-        distance_test = (vector_a - intersect_point).length <= (vector_b - intersect_point).length
-        return edge_verts[0].index if distance_test else edge_verts[1].index
+        table = EdgeTable.from_coords(
+            [v.co for v in edge.verts], [v.index for v in edge.verts]
+        )
+        return int(table.closest_idx(np.asarray(intersect_point), 0))
 
-    debug(f"Received {edge}, check expected input in docstring ")
+    debug("Received %s, check expected input in docstring ", edge)
     return None
 
 
@@ -129,7 +130,7 @@ def closest_vector(intersect_point, edge):
         distance_test = (vector_a - intersect_point).length <= (vector_b - intersect_point).length
         return vector_a if distance_test else vector_b
 
-    debug(f"Received {edge}, check expected input in docstring ")
+    debug("Received %s, check expected input in docstring ", edge)
     return None
 
 
@@ -207,8 +208,9 @@ def num_edges_point_lies_on(intersect_point, edges):
         Number of Intersecting Edges (Integer).
     """
 
-    res = [point_on_edge(intersect_point, edge) for edge in [edges[:2], edges[2:]]]
-    return len([i for i in res if i])
+    table = EdgeTable.from_coords(edges)
+    points = np.asarray(intersect_point, dtype=np.float64).reshape(1, 3)
+    return int(table.num_edges_point_lies_on(points, np.arange(len(table))[None])[0])
 
 
 def find_intersecting_edges(bm, intersect_point, idx1, idx2):
@@ -225,8 +227,10 @@ def find_intersecting_edges(bm, intersect_point, idx1, idx2):
     if not intersect_point:
         return []
     idxs = [idx1, idx2]
-    edges = [coords_tuple_from_edge_idx(bm, idx) for idx in idxs]
-    return [idx for edge, idx in zip(edges, idxs) if point_on_edge(intersect_point, edge)]
+    table = EdgeTable.from_bmesh(bm, idxs)
+    points = np.asarray(intersect_point, dtype=np.float64)
+    on_edge = table.point_on_edge(points, table.rows(idxs))
+    return [idx for idx, hit in zip(idxs, on_edge.tolist()) if hit]
 
 
 def vert_idxs_from_edge_idx(bm, idx):
@@ -242,3 +246,222 @@ def vert_idxs_from_edge_idx(bm, idx):
 
     edge = bm.edges[idx]
     return edge.verts[0].index, edge.verts[1].index
+
+
+class EdgeTable:
+    """Array Snapshot of Mesh Edges.
+
+    Note:
+        Holds the vertex indices and coordinates of a set of edges, read once in bulk,
+        with their lengths and directions. Edges are addressed by their row in the
+        table, rows() converts edge indices to rows. The query methods are batched
+        versions of point_on_edge, closest_idx and num_edges_point_lies_on, each call
+        works on whole arrays of points rather than building Vectors per point.
+
+        The table is a snapshot, it must be rebuilt after the mesh is edited.
+
+    Attributes:
+        edge_indices: Integer array (n,) of the indices of the edges, ascending
+        vert_indices: Integer array (n, 2) of the vertex indices of each edge
+        coords: Float array (n, 2, 3) of the end points of each edge
+        vectors: Float array (n, 3) from the first to the second vertex of each edge
+        lengths: Float array (n,) of the length of each edge
+        directions: Float array (n, 3) of unit vectors along each edge, zero for zero
+            length edges
+    """
+
+    def __init__(self, edge_indices, vert_indices, coords):
+        """Build the Table from Arrays.
+
+        Args:
+            edge_indices: Integer array (n,) of edge indices, ascending
+            vert_indices: Integer array (n, 2) of vertex indices
+            coords: Float array (n, 2, 3) of end points
+
+        Returns:
+            Nothing.
+        """
+
+        self.edge_indices = np.asarray(edge_indices, dtype=np.int32).reshape(-1)
+        self.vert_indices = np.asarray(vert_indices, dtype=np.int32).reshape(-1, 2)
+        self.coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2, 3)
+        self.vectors = self.coords[:, 1] - self.coords[:, 0]
+        self.lengths = np.linalg.norm(self.vectors, axis=1)
+        self.directions = np.divide(
+            self.vectors,
+            self.lengths[:, None],
+            out=np.zeros_like(self.vectors),
+            where=self.lengths[:, None] > 0.0,
+        )
+
+    @classmethod
+    def from_bmesh(cls, bm, edge_indices=None):
+        """Build the Table from a Bmesh.
+
+        Note:
+            Bmesh sequences have no foreach_get, the edges are read in a single pass
+            straight into flat arrays instead.
+
+        Args:
+            bm: Object's Bmesh
+            edge_indices: Optional list of Edge Indices, all edges if not given
+
+        Returns:
+            EdgeTable.
+        """
+
+        bm.edges.ensure_lookup_table()
+        if edge_indices is None:
+            edge_indices = range(len(bm.edges))
+        edge_indices = sorted(edge_indices)
+        edges = [bm.edges[idx] for idx in edge_indices]
+        vert_indices = np.fromiter(
+            chain.from_iterable((e.verts[0].index, e.verts[1].index) for e in edges),
+            dtype=np.int32,
+            count=2 * len(edges),
+        )
+        coords = np.fromiter(
+            chain.from_iterable(chain(e.verts[0].co, e.verts[1].co) for e in edges),
+            dtype=np.float64,
+            count=6 * len(edges),
+        )
+        return cls(edge_indices, vert_indices, coords)
+
+    @classmethod
+    def from_mesh(cls, mesh):
+        """Build the Table from Mesh Data with foreach_get.
+
+        Args:
+            mesh: Mesh data block, not in Edit Mode
+
+        Returns:
+            EdgeTable.
+        """
+
+        vert_co = np.empty(3 * len(mesh.vertices), dtype=np.float32)
+        mesh.vertices.foreach_get("co", vert_co)
+        vert_indices = np.empty(2 * len(mesh.edges), dtype=np.int32)
+        mesh.edges.foreach_get("vertices", vert_indices)
+        vert_indices = vert_indices.reshape(-1, 2)
+        coords = vert_co.reshape(-1, 3).astype(np.float64)[vert_indices]
+        return cls(np.arange(len(mesh.edges)), vert_indices, coords)
+
+    @classmethod
+    def from_coords(cls, coords, vert_indices=None):
+        """Build the Table from Edge End Points.
+
+        Note:
+            Edges are numbered in order, vertices are numbered by their position in
+            coords unless vert_indices is given.
+
+        Args:
+            coords: End points (n, 2, 3), or a flat list of 2 * n vectors
+            vert_indices: Optional vertex indices (n, 2)
+
+        Returns:
+            EdgeTable.
+        """
+
+        coords = np.asarray(coords, dtype=np.float64).reshape(-1, 2, 3)
+        if vert_indices is None:
+            vert_indices = np.arange(2 * len(coords))
+        return cls(np.arange(len(coords)), vert_indices, coords)
+
+    def __len__(self):
+        """Return the Number of Edges in the Table."""
+
+        return len(self.edge_indices)
+
+    def rows(self, edge_indices):
+        """Return the Rows of Edges in the Table.
+
+        Note:
+            Raises KeyError, listing them, if any of the Edges is not in the Table.
+
+        Args:
+            edge_indices: Edge Indices, any array shape
+
+        Returns:
+            Integer array of the same shape.
+        """
+
+        edge_indices = np.asarray(edge_indices, dtype=np.int64)
+        wanted = edge_indices.reshape(-1)
+        rows = np.searchsorted(self.edge_indices, wanted)
+        found = rows < len(self.edge_indices)
+        found[found] = self.edge_indices[rows[found]] == wanted[found]
+        if not found.all():
+            missing = np.unique(wanted[~found]).tolist()
+            raise KeyError(f"Edges not in EdgeTable: {missing}")
+        return rows.reshape(edge_indices.shape)
+
+    def project(self, points, rows):
+        """Project Points onto the Lines through Edges.
+
+        Args:
+            points: Float array (..., 3) of points
+            rows: Integer array (...) of table rows, one per point
+
+        Returns:
+            Float array (...) of the parameter along each edge, 0 at its first vertex
+            and 1 at its second, and Float array (..., 3) of the projected points.
+        """
+
+        start = self.coords[rows, 0]
+        vector = self.vectors[rows]
+        squared = self.lengths[rows] ** 2
+        param = np.divide(
+            np.einsum("...i,...i->...", points - start, vector),
+            squared,
+            out=np.zeros(np.shape(squared)),
+            where=squared > 0.0,
+        )
+        return param, start + param[..., None] * vector
+
+    def point_on_edge(self, points, rows):
+        """Batched point_on_edge.
+
+        Args:
+            points: Float array (..., 3) of points
+            rows: Integer array (...) of table rows, one per point
+
+        Returns:
+            Boolean array (...), True where the point lies on its edge.
+        """
+
+        param, projected = self.project(points, rows)
+        on_line = np.linalg.norm(projected - points, axis=-1) < 1.0e-5
+        return on_line & (param >= 0.0) & (param <= 1.0)
+
+    def closest_idx(self, points, rows):
+        """Batched closest_idx.
+
+        Note:
+            If both vertices are equally far from a point, the first is returned.
+
+        Args:
+            points: Float array (..., 3) of points
+            rows: Integer array (...) of table rows, one per point
+
+        Returns:
+            Integer array (...) of the index of the vertex closest to each point.
+        """
+
+        ends = self.coords[rows]
+        distance_a = np.linalg.norm(ends[..., 0, :] - points, axis=-1)
+        distance_b = np.linalg.norm(ends[..., 1, :] - points, axis=-1)
+        verts = self.vert_indices[rows]
+        return np.where(distance_a <= distance_b, verts[..., 0], verts[..., 1])
+
+    def num_edges_point_lies_on(self, points, rows):
+        """Batched num_edges_point_lies_on.
+
+        Args:
+            points: Float array (m, 3) of points
+            rows: Integer array (m, k) of table rows, k edges per point
+
+        Returns:
+            Integer array (m,) of the number of those edges each point lies on.
+        """
+
+        return np.count_nonzero(self.point_on_edge(points[:, None, :], rows), axis=1)
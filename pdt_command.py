@@ -6,14 +6,22 @@
 #
 import bpy
 import bmesh
-import math
+import os
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+from bpy.props import StringProperty
 from bpy.types import Operator
-from mathutils import Vector
+from bpy_extras.io_utils import ImportHelper
 from .pdt_functions import (
+    CommandContext,
     debug,
+    deselect_all,
+    error_popup,
     intersection,
+    move_objects,
     obj_check,
-    oops,
+    refresh_edit_mesh,
+    script_run,
     update_sel,
     view_coords,
     view_dir,
@@ -38,6 +46,7 @@ from .pdt_msg_strings import (
     PDT_ERR_FACE_SEL,
     PDT_ERR_FILEDIT,
     PDT_ERR_NON_VALID,
+    PDT_ERR_REPEAT,
     PDT_ERR_NO_SEL_GEOM,
     PDT_ERR_SEL_1_EDGE,
     PDT_ERR_SEL_1_EDGEM,
@@ -50,6 +59,8 @@ from .pdt_msg_strings import (
     PDT_ERR_NO_ACT_OBJ,
     PDT_ERR_VERT_MODE,
 )
+from .pdt_maths import evaluate
+from .pdt_timing import command as time_command, stage, timed
 from .pdt_bix import add_line_to_bisection
 from .pdt_etof import extend_vertex
 from .pdt_xall import intersect_all
@@ -64,6 +75,18 @@ PDT_IntersectionError = pdt_exception.IntersectionError
 PDT_NoObjectError = pdt_exception.NoObjectError
 PDT_FeatureError = pdt_exception.FeatureError
 
+# Commands named in full rather than by Operation & Mode letters.
+#
+NAMED_COMMANDS = {"?", "HELP", "J2V", "AD2", "AD3", "OTC", "TAP", "BIS", "ETF", "INTALL"}
+# Number of compiled Commands kept for re-use.
+#
+COMMAND_CACHE_SIZE = 256
+# Text the errors of a Command Script are written to.
+#
+PDT_SCRIPT_REPORT = "PDT Script Report"
+
+_last_maths_result = {"ans": 0.0}
+
 
 class PDT_OT_CommandReRun(Operator):
     """Repeat Current Displayed Command"""
@@ -85,6 +108,56 @@ class PDT_OT_CommandReRun(Operator):
         return {"FINISHED"}
 
 
+class PDT_OT_CommandScript(Operator):
+    """Run the Command Script Text as one Undo Step"""
+
+    bl_idname = "pdt.command_script"
+    bl_label = "Run Command Script"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.pdt_pg.command_script is not None
+
+    def execute(self, context):
+        """Run each line of the Command Script Text as a PDT Command.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        text = context.scene.pdt_pg.command_script
+        lines = [line.body for line in text.lines]
+        return report_command_script(self, context, text.name, lines)
+
+
+class PDT_OT_CommandScriptFile(Operator, ImportHelper):
+    """Run a Command Script File as one Undo Step"""
+
+    bl_idname = "pdt.command_script_file"
+    bl_label = "Run Command Script File"
+    bl_options = {"REGISTER", "UNDO"}
+
+    filter_glob: StringProperty(default="*.txt;*.pdt", options={"HIDDEN"})
+
+    def execute(self, context):
+        """Run each line of the selected File as a PDT Command.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        with open(self.filepath, encoding="utf-8") as script:
+            lines = script.read().splitlines()
+        return report_command_script(self, context, os.path.basename(self.filepath), lines)
+
+
 def command_run(self, context):
     """Run Command String as input into Command Line.
 
@@ -132,16 +205,135 @@ def command_run(self, context):
         Nothing.
     """
 
+    run_command(context, context.scene.pdt_pg.command.strip())
+
+
+def run_command(context, command):
+    """Run one Command, timed by pdt_timing.
+
+    Args:
+        context: Blender bpy.context instance.
+        command: The Command Line input, stripped
+
+    Returns:
+        Nothing.
+    """
+
+    with time_command(command_key(command)), stage("geometry"):
+        command_execute(context, command)
+
+
+def run_command_script(context, lines):
+    """Run Command Lines as one batch.
+
+    Note:
+        Blank lines and lines starting with # are skipped. The Commands share one
+        Bmesh, the Mesh is updated once at the end and errors are collected
+        rather than shown in popups.
+
+    Args:
+        context: Blender bpy.context instance.
+        lines: Command Lines
+
+    Returns:
+        Number of Commands run and a list of (line number, command, error) tuples.
+    """
+
+    pg = context.scene.pdt_pg
+    errors = []
+    count = 0
+    with script_run():
+        for number, line in enumerate(lines, 1):
+            command = line.strip()
+            if not command or command.startswith("#"):
+                continue
+            count += 1
+            pg.error = ""
+            try:
+                run_command(context, command)
+            except Exception as err:
+                if not pg.error:
+                    pg.error = str(err) or type(err).__name__
+            if pg.error:
+                errors.append((number, command, pg.error))
+    return count, errors
+
+
+def report_command_script(operator, context, name, lines):
+    """Run a Command Script for an Operator and report its errors.
+
+    Note:
+        Errors are written, one per line, to the "PDT Script Report" Text.
+
+    Args:
+        operator: The Operator running the script
+        context: Blender bpy.context instance.
+        name: Name of the script for the report
+        lines: Command Lines
+
+    Returns:
+        Status Set.
+    """
+
+    count, errors = run_command_script(context, lines)
+    report = bpy.data.texts.get(PDT_SCRIPT_REPORT) or bpy.data.texts.new(PDT_SCRIPT_REPORT)
+    report.clear()
+    report.write(f"{name}: {count} command(s), {len(errors)} error(s)\n")
+    for number, command, error in errors:
+        report.write(f"line {number}: {command}: {error}\n")
+    if errors:
+        operator.report(
+            {"WARNING"}, f"{len(errors)} of {count} commands failed, see {PDT_SCRIPT_REPORT}"
+        )
+    else:
+        operator.report({"INFO"}, f"Ran {count} commands from {name}")
+    return {"FINISHED"}
+
+
+def command_key(command):
+    """Return the Timing key of a Command.
+
+    Note:
+        Coordinate Commands are keyed by Operation and Mode, e.g. "Gd", named
+        Commands such as "INTALL", or "PCEN", by their name.
+
+    Args:
+        command: The Command Line input
+
+    Returns:
+        Key string.
+    """
+
+    upper = command.upper()
+    if upper in NAMED_COMMANDS or upper[1:] in {"NML", "CEN", "INT"}:
+        return upper
+    return upper[:1] + command[1:2].lower()
+
+
+def command_execute(context, command):
+    """Execute a Command Line input, see command_run.
+
+    Note:
+        Runs inside command_run's timing, time not spent parsing, building vectors,
+        or updating the Mesh is counted as the "geometry" Stage.
+
+    Args:
+        context: Blender bpy.context instance.
+        command: The Command Line input, stripped
+
+    Returns:
+        Nothing.
+    """
+
     scene = context.scene
     pg = scene.pdt_pg
-    command = pg.command.strip()
 
     # Check Object Type & Mode First
     obj = context.view_layer.objects.active
     if obj is not None and command[0].upper() not in {"M", "?", "HELP"}:
         if obj.mode not in {"OBJECT", "EDIT"} or obj.type not in {"MESH", "EMPTY"}:
             pg.error = PDT_OBJ_MODE_ERROR
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_ObjectModeError
 
     # Special Cases of Command.
@@ -186,44 +378,29 @@ def command_run(self, context):
         placement_intersect(context, command.upper()[0])
         return
 
-    # Check Command Length
-    if len(command) < 3:
-        pg.error = PDT_ERR_CHARS_NUM
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        return
-
-    # Check First Letter
-    operation = command[0].upper()
-    if operation not in {"C", "D", "E", "F", "G", "N", "M", "P", "V", "S"}:
-        pg.error = PDT_ERR_BADFLETTER
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-        return
-
-    # Check Second Letter.
-    mode = command[1].lower()
-    if (
-            (operation == "F" and mode not in {"v", "e", "i"})
-            or (operation in {"D", "E"} and mode not in {"d", "i", "n"}) #new
-            or (operation == "M" and mode not in {"a", "d", "i", "p", "o", "x", "y", "z"})
-            or (operation not in {"D", "E", "F", "M"} and mode not in {"a", "d", "i", "p", "n"}) #new
-        ):
-        pg.error = f"'{mode}' {PDT_ERR_NON_VALID} '{operation}'"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+    # Validate & Parse the command line, repeated commands come from the cache
+    decimal_places = context.preferences.addons[__package__].preferences.pdt_input_round
+    compiled = compile_command(command, pg.plane, decimal_places)
+    if compiled.error:
+        pg.error = compiled.error
+        error_popup(context)
         return
+    operation = compiled.operation
+    mode = compiled.mode
 
     # --------------
     # Maths Operation
     if operation == "M":
         try:
-            command_maths(context, mode, pg, command[2:], mode)
+            command_maths(context, mode, pg, compiled.expression, mode)
             return
         except PDT_MathsError:
             return
 
     # -----------------------------------------------------
-    # Not a Maths Operation, so let's parse the command line
+    # Not a Maths Operation, so let's check the selection
     try:
-        pg, values, obj, obj_loc, bm, verts = command_parse(context)
+        pg, values, cmd, verts = command_parse(context, compiled)
     except PDT_SelectionError:
         return
 
@@ -231,7 +408,7 @@ def command_run(self, context):
     # Cursor or Pivot Point
     if operation in {"C", "P"}:
         try:
-            move_cursor_pivot(context, pg, operation, mode, obj, verts, values)
+            move_cursor_pivot(context, pg, operation, mode, cmd, verts, values)
         except PDT_CommandFailure:
             return
 
@@ -239,7 +416,7 @@ def command_run(self, context):
     # Move Vertices or Objects
     if operation == "G":
         try:
-            move_entities(context, pg, operation, mode, obj, bm, verts, values)
+            move_entities(context, pg, operation, mode, cmd, verts, values)
         except PDT_CommandFailure:
             return
 
@@ -247,7 +424,7 @@ def command_run(self, context):
     # Add New Vertex
     if operation == "N":
         try:
-            add_new_vertex(context, pg, operation, mode, obj, bm, verts, values)
+            add_new_vertex(context, pg, operation, mode, cmd, verts, values)
         except PDT_CommandFailure:
             return
 
@@ -255,7 +432,7 @@ def command_run(self, context):
     # Split Edges
     if operation == "S":
         try:
-            split_edges(context, pg, operation, mode, obj, obj_loc, bm, values)
+            split_edges(context, pg, operation, mode, cmd, values)
         except PDT_CommandFailure:
             return
 
@@ -264,7 +441,7 @@ def command_run(self, context):
     # Extrude Vertices
     if operation == "V":
         try:
-            extrude_vertices(context, pg, operation, mode, obj, obj_loc, bm, verts, values)
+            extrude_vertices(context, pg, operation, mode, cmd, verts, values)
         except PDT_CommandFailure:
             return
 
@@ -272,7 +449,7 @@ def command_run(self, context):
     # Extrude Geometry
     if operation == "E":
         try:
-            extrude_geometry(context, pg, operation, mode, obj, bm, values)
+            extrude_geometry(context, pg, operation, mode, cmd, values, compiled.count)
         except PDT_CommandFailure:
             return
 
@@ -280,7 +457,7 @@ def command_run(self, context):
     # Duplicate Geometry
     if operation == "D":
         try:
-            duplicate_geometry(context, pg, operation, mode, obj, bm, values)
+            duplicate_geometry(context, pg, operation, mode, cmd, values, compiled.count)
         except PDT_CommandFailure:
             return
 
@@ -288,7 +465,7 @@ def command_run(self, context):
     # Fillet Geometry
     if operation == "F":
         try:
-            fillet_geometry(context, pg, mode, obj, bm, verts, values)
+            fillet_geometry(context, pg, mode, cmd, verts, values)
         except PDT_CommandFailure:
             return
 
@@ -325,6 +502,7 @@ def pdt_help(self, context):
     label(text="i: Directional (Polar) Coordinates e.g. 2.6,45")
     label(text="p: Percent e.g. 67.5")
     label(text="n: Work in View Normal Axis")
+    label(text="*N: Repeat Duplicate or Extrude N times, e.g. dd0.5,0,0*20")
     label(text="")
     label(text="- Fillet Options:")
     label(text="v: Fillet Vertices")
@@ -334,6 +512,7 @@ def pdt_help(self, context):
     label(text="x, y, z: Send result to X, Y and Z input fields in PDT Design")
     label(text="d, a, p: Send result to Distance, Angle or Percent input field in PDT Design")
     label(text="o: Send Maths Calculation to Output")
+    label(text="Maths Variables: d, a, p, x, y, z & ans (last result)")
     label(text="")
     label(text="Note that commands are case-insensitive: ED = Ed = eD = ed")
     label(text="")
@@ -342,6 +521,9 @@ def pdt_help(self, context):
     label(text="ed0.5,,0.6")
     label(text="'- Extrude Geometry Delta 0.5 in X, 0 in Y, 0.6 in Z")
     label(text="")
+    label(text="dd0.5,0,0*20")
+    label(text="'- Duplicate Geometry 20 times, each copy 0.5 in X from the last")
+    label(text="")
     label(text="fe0.1,4,0.5")
     label(text="'- Fillet Edges")
     label(text="'- Radius: 0.1 (float) -- the radius (or offset) of the bevel/fillet")
@@ -355,6 +537,10 @@ def pdt_help(self, context):
 def command_maths(context, mode, pg, expression, output_target):
     """Evaluates Maths Input.
 
+    Note:
+        Expressions are checked and compiled by pdt_maths, they may use the math
+        module's functions and the variables d, a, p, x, y, z & ans (last result).
+
     Args:
         context: Blender bpy.context instance.
         mode: The Operation Mode, e.g. a for Absolute
@@ -366,14 +552,22 @@ def command_maths(context, mode, pg, expression, output_target):
         Nothing.
     """
 
-    namespace = {}
-    namespace.update(vars(math))
+    variables = {
+        "d": pg.distance,
+        "a": pg.angle,
+        "p": pg.percent,
+        "x": pg.cartesian_coords.x,
+        "y": pg.cartesian_coords.y,
+        "z": pg.cartesian_coords.z,
+        "ans": _last_maths_result["ans"],
+    }
     try:
-        maths_result = eval(expression, namespace, namespace)
-    except:
+        maths_result = evaluate(expression, variables)
+    except PDT_MathsError:
         pg.error = PDT_ERR_BADMATHS
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         raise PDT_MathsError
+    _last_maths_result["ans"] = maths_result
 
     decimal_places = context.preferences.addons[__package__].preferences.pdt_input_round
     if output_target == "x":
@@ -393,54 +587,126 @@ def command_maths(context, mode, pg, expression, output_target):
         pg.maths_output = round(maths_result, decimal_places)
 
 
-def command_parse(context):
-    """Parse Command Input.
+class CompiledCommand(NamedTuple):
+    """A Command Line input, validated and split into its parts.
+
+    Note:
+        error is empty for a valid Command, otherwise it holds the message to show.
+        count is the number of copies made by a Duplicate or Extrude "*N" repeat.
+    """
+
+    text: str
+    operation: str
+    mode: str
+    values: Tuple[float, ...]
+    expression: str
+    error: str
+    count: int = 1
+
+
+@lru_cache(maxsize=COMMAND_CACHE_SIZE)
+def compile_command(command, plane, decimal_places):
+    """Compile a Coordinate, or Maths Command into a CompiledCommand.
+
+    Note:
+        Checks the Operation & Mode letters, replaces values that are not numbers
+        by 0, re-arranges View Normal ("n") values for the Working Plane and rounds
+        the values to the system rounding. Results are cached by their arguments, so
+        a repeated Command is only compiled once.
 
     Args:
-        context: Blender bpy.context instance.
+        command: The Command Line input, stripped
+        plane: Working Plane, used by View Normal Mode
+        decimal_places: System Rounding for Input values
 
     Returns:
-        pg: PDT Parameters Group - our variables
-        values_out: The Output Values as a list of numbers
-        obj: The Active Object
-        obj_loc: The object's location in 3D space
-        bm: The object's Bmesh
-        verts: The object's selected vertices, or selected history vertices.
+        CompiledCommand.
     """
-    scene = context.scene
-    pg = scene.pdt_pg
-    command = pg.command.strip()
+
+    def failed(error):
+        return CompiledCommand(command, "", "", (), "", error)
+
+    # Check Command Length
+    if len(command) < 3:
+        return failed(PDT_ERR_CHARS_NUM)
+
+    # Check First Letter
     operation = command[0].upper()
+    if operation not in {"C", "D", "E", "F", "G", "N", "M", "P", "V", "S"}:
+        return failed(PDT_ERR_BADFLETTER)
+
+    # Check Second Letter.
     mode = command[1].lower()
-    values = command[2:].split(",")
-    mode_sel = pg.select
-    obj = context.view_layer.objects.active
-    ind = 0
-    for v in values:
+    if (
+            (operation == "F" and mode not in {"v", "e", "i"})
+            or (operation in {"D", "E"} and mode not in {"d", "i", "n"}) #new
+            or (operation == "M" and mode not in {"a", "d", "i", "p", "o", "x", "y", "z"})
+            or (operation not in {"D", "E", "F", "M"} and mode not in {"a", "d", "i", "p", "n"}) #new
+        ):
+        return failed(f"'{mode}' {PDT_ERR_NON_VALID} '{operation}'")
+
+    if operation == "M":
+        return CompiledCommand(command, operation, mode, (), command[2:], "")
+
+    # Repeat Count, e.g. dd0.5,0,0*20
+    body = command[2:]
+    count = 1
+    if "*" in body:
+        body, _, repeat = body.rpartition("*")
         try:
-            _ = float(v)
-            good = True
+            count = int(repeat)
         except ValueError:
-            values[ind] = "0.0"
-        ind = ind + 1
+            count = 0
+        if count < 1 or operation not in {"D", "E"}:
+            return failed(PDT_ERR_REPEAT)
+
+    values = []
+    for value in body.split(","):
+        try:
+            values.append(float(value))
+        except ValueError:
+            values.append(0.0)
     if mode == "n":
         # View relative mode
-        if pg.plane == "XZ":
+        if plane == "XZ":
             values = [0.0, values[0], 0.0]
-        elif pg.plane == "YZ":
+        elif plane == "YZ":
             values = [values[0], 0.0, 0.0]
-        elif pg.plane == "XY":
+        elif plane == "XY":
             values = [0.0, 0.0, values[0]]
         else:
-            if "-" in values[0]:
-                values = [0.0, 0.0, values[0][1:]]
-            else:
-                values = [0.0, 0.0, f"-{values[0]}"]
+            values = [0.0, 0.0, -values[0]]
     # Apply System Rounding
-    decimal_places = context.preferences.addons[__package__].preferences.pdt_input_round
-    values_out = [str(round(float(v), decimal_places)) for v in values]
-    bm = "No Bmesh"
-    obj_loc = Vector((0,0,0))
+    values = tuple(round(value, decimal_places) for value in values)
+    return CompiledCommand(command, operation, mode, values, "", "", count)
+
+
+@timed("parse")
+def command_parse(context, compiled):
+    """Parse Command Input.
+
+    Note:
+        Builds the CommandContext shared by all Stages of the Command, the Bmesh and
+        the selection are only gathered here if the Command needs them.
+
+    Args:
+        context: Blender bpy.context instance.
+        compiled: The CompiledCommand from compile_command
+
+    Returns:
+        pg: PDT Parameters Group - our variables
+        values_out: The Output Values as a tuple of numbers
+        cmd: CommandContext of the Command
+        verts: The object's selected vertices, or selected history vertices.
+    """
+    scene = context.scene
+    pg = scene.pdt_pg
+    operation = compiled.operation
+    mode = compiled.mode
+    values_out = compiled.values
+    mode_sel = pg.select
+    cmd = CommandContext(context)
+    obj = cmd.obj
     verts = []
 
     if mode_sel == 'REL' and operation not in {"C", "P"}:
@@ -453,42 +719,36 @@ def command_parse(context):
             pg.select = 'SEL'
             mode_sel = 'SEL'
         if obj is not None:
-            if obj.mode == "EDIT":
-                bm = bmesh.from_edit_mesh(obj.data)
-                obj_loc = obj.matrix_world.decompose()[0]
-                verts = []
-            else:
-                if operation != "G":
-                    pg.error = PDT_OBJ_MODE_ERROR
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                    raise PDT_ObjectModeError
+            if obj.mode != "EDIT" and operation != "G":
+                pg.error = PDT_OBJ_MODE_ERROR
+                error_popup(context)
+                raise PDT_ObjectModeError
         else:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_NoObjectError
 
     if mode_sel == 'SEL' and mode not in {"a"}:
         # All other options except Cursor or Pivot by Absolute
         # These options require no object, etc.
-        bm, good = obj_check(obj, scene, operation)
+        bm, good = obj_check(obj, scene, operation, cmd)
         if good and obj.mode == 'EDIT':
-            obj_loc = obj.matrix_world.decompose()[0]
             if len(bm.select_history) == 0 or operation == "G":
-                verts = [v for v in bm.verts if v.select]
+                verts = cmd.sel_verts
                 if len(verts) == 0:
                     pg.error = PDT_ERR_NO_SEL_GEOM
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                    error_popup(context)
                     raise PDT_SelectionError
             else:
                 verts = bm.select_history
 
-    debug(f"command: {operation}{mode}{values_out}")
-    debug(f"obj: {obj}, bm: {bm}, obj_loc: {obj_loc}")
+    debug("command: %s%s%s", operation, mode, values_out)
+    debug("obj: %s, obj_loc: %s", obj, cmd.obj_loc)
 
-    return pg, values_out, obj, obj_loc, bm, verts
+    return pg, values_out, cmd, verts
 
 
-def move_cursor_pivot(context, pg, operation, mode, obj, verts, values):
+def move_cursor_pivot(context, pg, operation, mode, cmd, verts, values):
     """Moves Cursor & Pivot Point.
 
     Args:
@@ -496,7 +756,7 @@ def move_cursor_pivot(context, pg, operation, mode, obj, verts, values):
         pg: PDT Parameters Group - our variables
         operation: The Operation e.g. Create New Vertex
         mode: The Operation Mode, e.g. a for Absolute
-        obj: The Active Object
+        cmd: CommandContext of the Command
         verts: The object's selected vertices, or selected history vertices
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
 
@@ -504,31 +764,31 @@ def move_cursor_pivot(context, pg, operation, mode, obj, verts, values):
         Nothing.
     """
 
+    obj = cmd.obj
+
     # Absolute/Global Coordinates, or Delta/Relative Coordinates
     if mode in {"a", "d", "n"}:
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
     # Direction/Polar Coordinates
     elif mode == "i":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 2)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 2)
         except:
             raise PDT_InvalidVector
     # Percent Options
     else:
         # Must be Percent
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 1)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 1)
         except:
             raise PDT_InvalidVector
 
     scene = context.scene
     mode_sel = pg.select
-    obj_loc = Vector((0,0,0))
-    if obj is not None:
-        obj_loc = obj.matrix_world.decompose()[0]
+    obj_loc = cmd.obj_loc
 
     if mode == "a":
         if operation == "C":
@@ -537,9 +797,9 @@ def move_cursor_pivot(context, pg, operation, mode, obj, verts, values):
             pg.pivot_loc = vector_delta
     elif mode in {"d", "i", "n"}:
         if pg.plane == "LO" and mode in  {"d", "n"}:
-            vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z)
+            vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z, cmd.frame)
         elif pg.plane == "LO" and mode == "i":
-            vector_delta = view_dir(pg.distance, pg.angle)
+            vector_delta = view_dir(pg.distance, pg.angle, cmd.frame)
         if mode_sel == "REL":
             if operation == "C":
                 scene.cursor.location = scene.cursor.location + vector_delta
@@ -570,16 +830,19 @@ def move_cursor_pivot(context, pg, operation, mode, obj, verts, values):
                 pg.pivot_loc = vector_delta
 
 
-def move_entities(context, pg, operation, mode, obj, bm, verts, values):
+def move_entities(context, pg, operation, mode, cmd, verts, values):
     """Moves Entities.
 
+    Note:
+        In Object Mode all selected Objects are moved together by move_objects,
+        Delta moves are added to each Object's own location.
+
     Args:
         context: Blender bpy.context instance.
         pg: PDT Parameters Group - our variables
         operation: The Operation e.g. Create New Vertex
         mode: The Operation Mode, e.g. a for Absolute
-        obj: The Active Object
-        bm: The object's Bmesh
+        cmd: CommandContext of the Command
         verts: The object's selected vertices, or selected history vertices
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
 
@@ -587,128 +850,127 @@ def move_entities(context, pg, operation, mode, obj, bm, verts, values):
         Nothing.
     """
 
-    obj_loc = obj.matrix_world.decompose()[0]
+    obj = cmd.obj
+    obj_loc = cmd.obj_loc
+    bm = cmd.bm
 
     # Absolute/Global Coordinates
     if mode == "a":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
         if obj.mode == "EDIT":
-            for v in [v for v in bm.verts if v.select]:
+            for v in cmd.sel_verts:
                 v.co = vector_delta - obj_loc
             bmesh.ops.remove_doubles(
-                bm, verts=[v for v in bm.verts if v.select], dist=0.0001
+                bm, verts=cmd.sel_verts, dist=0.0001
             )
         if obj.mode == "OBJECT":
-            for ob in context.view_layer.objects.selected:
-                ob.location = vector_delta
+            move_objects(context.view_layer.objects.selected, location=vector_delta)
 
     elif mode in {"d", "i", "n"}:
         if mode in {"d", "n"}:
             # Delta/Relative Coordinates
             try:
-                vector_delta = vector_build(context, pg, obj, operation, values, 3)
+                vector_delta = vector_build(context, pg, cmd, operation, values, 3)
             except:
                 raise PDT_InvalidVector
         else:
             # Direction/Polar Coordinates
             try:
-                vector_delta = vector_build(context, pg, obj, operation, values, 2)
+                vector_delta = vector_build(context, pg, cmd, operation, values, 2)
             except:
                 raise PDT_InvalidVector
 
         if pg.plane == "LO" and mode in {"d", "n"}:
-            vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z)
+            vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z, cmd.frame)
         elif pg.plane == "LO" and mode == "i":
-            vector_delta = view_dir(pg.distance, pg.angle)
+            vector_delta = view_dir(pg.distance, pg.angle, cmd.frame)
 
         if obj.mode == "EDIT":
             bmesh.ops.translate(
-                bm, verts=[v for v in bm.verts if v.select], vec=vector_delta
+                bm, verts=cmd.sel_verts, vec=vector_delta
             )
         if obj.mode == "OBJECT":
-            for ob in context.view_layer.objects.selected:
-                ob.location = obj_loc + vector_delta
+            move_objects(context.view_layer.objects.selected, delta=vector_delta)
     # Percent Options Only Other Choice
     else:
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 1)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 1)
         except:
             raise PDT_InvalidVector
         if obj.mode == 'EDIT':
             verts[-1].co = vector_delta
         if obj.mode == "OBJECT":
-            obj.location = vector_delta
+            move_objects([obj], location=vector_delta)
     if obj.mode == 'EDIT':
-        bmesh.update_edit_mesh(obj.data)
+        refresh_edit_mesh(obj.data)
         bm.select_history.clear()
 
 
-def add_new_vertex(context, pg, operation, mode, obj, bm, verts, values):
+def add_new_vertex(context, pg, operation, mode, cmd, verts, values):
     """Add New Vertex.
 
     Args:
         context: Blender bpy.context instance.
-        pg, operation, mode, obj, bm, verts, values
+        pg, operation, mode, cmd, verts, values
 
     Returns:
         Nothing.
     """
 
-    obj_loc = obj.matrix_world.decompose()[0]
+    obj = cmd.obj
+    obj_loc = cmd.obj_loc
+    bm = cmd.bm
 
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_ADDVEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         raise PDT_SelectionError
     if mode not in {"a"}:
         if not isinstance(verts[0], bmesh.types.BMVert):
             pg.error = PDT_ERR_VERT_MODE
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_FeatureError
     # Absolute/Global Coordinates
     if mode == "a":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
         new_vertex = bm.verts.new(vector_delta - obj_loc)
     # Delta/Relative Coordinates
     elif mode in  {"d", "n"}:
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
         if pg.plane == "LO":
-            vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z)
+            vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z, cmd.frame)
         new_vertex = bm.verts.new(verts[-1].co + vector_delta)
     # Direction/Polar Coordinates
     elif mode == "i":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 2)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 2)
         except:
             raise PDT_InvalidVector
         if pg.plane == "LO":
-            vector_delta = view_dir(pg.distance, pg.angle)
+            vector_delta = view_dir(pg.distance, pg.angle, cmd.frame)
         new_vertex = bm.verts.new(verts[-1].co + vector_delta)
     # Percent Options Only Other Choice
     else:
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 1)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 1)
         except:
             raise PDT_InvalidVector
         new_vertex = bm.verts.new(vector_delta)
 
-    for v in [v for v in bm.verts if v.select]:
-        v.select_set(False)
-    new_vertex.select_set(True)
-    bmesh.update_edit_mesh(obj.data)
-    bm.select_history.clear()
+    update_sel(bm, [new_vertex], [], [])
+    refresh_edit_mesh(obj.data)
 
 
-def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
+def split_edges(context, pg, operation, mode, cmd, values):
     """Split Edges.
 
     Args:
@@ -716,9 +978,7 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
         pg: PDT Parameters Group - our variables
         operation: The Operation e.g. Create New Vertex
         mode: The Operation Mode, e.g. a for Absolute
-        obj: The Active Object
-        obj_loc: The object's location in 3D space
-        bm: The object's Bmesh
+        cmd: CommandContext of the Command
         verts: The object's selected vertices, or selected history vertices
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
 
@@ -726,20 +986,24 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
         Nothing.
     """
 
+    obj = cmd.obj
+    obj_loc = cmd.obj_loc
+    bm = cmd.bm
+
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_SPLITEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
     # Absolute/Global Coordinates
     if mode == "a":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
-        edges = [e for e in bm.edges if e.select]
+        edges = cmd.sel_edges
         if len(edges) != 1:
             pg.error = f"{PDT_ERR_SEL_1_EDGE} {len(edges)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
         geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
         new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
@@ -748,18 +1012,18 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
     # Delta/Relative Coordinates
     elif mode == "d":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
-        edges = [e for e in bm.edges if e.select]
-        faces = [f for f in bm.faces if f.select]
+        edges = cmd.sel_edges
+        faces = cmd.sel_faces
         if len(faces) != 0:
             pg.error = PDT_ERR_FACE_SEL
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
         if len(edges) < 1:
             pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(edges)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
         geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
         new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
@@ -767,18 +1031,18 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
     # Directional/Polar Coordinates
     elif mode == "i":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 2)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 2)
         except:
             raise PDT_InvalidVector
-        edges = [e for e in bm.edges if e.select]
-        faces = [f for f in bm.faces if f.select]
+        edges = cmd.sel_edges
+        faces = cmd.sel_faces
         if len(faces) != 0:
             pg.error = PDT_ERR_FACE_SEL
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
         if len(edges) < 1:
             pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(edges)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
         geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
         new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
@@ -786,33 +1050,52 @@ def split_edges(context, pg, operation, mode, obj, obj_loc, bm, values):
     # Percent Options
     elif mode == "p":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 1)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 1)
         except:
             raise PDT_InvalidVector
-        edges = [e for e in bm.edges if e.select]
-        faces = [f for f in bm.faces if f.select]
+        edges = cmd.sel_edges
+        faces = cmd.sel_faces
         if len(faces) != 0:
             pg.error = PDT_ERR_FACE_SEL
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
         if len(edges) != 1:
             pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(edges)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
         geom = bmesh.ops.subdivide_edges(bm, edges=edges, cuts=1)
         new_verts = [v for v in geom["geom_split"] if isinstance(v, bmesh.types.BMVert)]
         new_vertex = new_verts[0]
         new_vertex.co = vector_delta
 
-    for v in [v for v in bm.verts if v.select]:
-        v.select_set(False)
-    for v in new_verts:
-        v.select_set(False)
-    bmesh.update_edit_mesh(obj.data)
-    bm.select_history.clear()
+    deselect_all(bm)
+    refresh_edit_mesh(obj.data)
+
+
+def extrude_verts_delta(bm, verts, vector_delta):
+    """Extrude each Vertex by vector_delta on its own Edge.
 
+    Note:
+        All Vertices are extruded by one bmesh.ops.extrude_vert_indiv call and
+        moved by one translate, the new Vertices are left Selected.
+
+    Args:
+        bm: The object's Bmesh
+        verts: Vertices to Extrude
+        vector_delta: Offset of the new Vertices
 
-def extrude_vertices(context, pg, operation, mode, obj, obj_loc, bm, verts, values):
+    Returns:
+        Nothing.
+    """
+
+    # Vertices from the Selection History may be listed more than once
+    ret = bmesh.ops.extrude_vert_indiv(bm, verts=list(dict.fromkeys(verts)))
+    new_verts = ret["verts"]
+    bmesh.ops.translate(bm, verts=new_verts, vec=vector_delta)
+    update_sel(bm, new_verts, [], [])
+
+
+def extrude_vertices(context, pg, operation, mode, cmd, verts, values):
     """Extrude Vertices.
 
     Args:
@@ -820,9 +1103,7 @@ def extrude_vertices(context, pg, operation, mode, obj, obj_loc, bm, verts, valu
         pg: PDT Parameters Group - our variables
         operation: The Operation e.g. Create New Vertex
         mode: The Operation Mode, e.g. a for Absolute
-        obj: The Active Object
-        obj_loc: The object's location in 3D space
-        bm: The object's Bmesh
+        cmd: CommandContext of the Command
         verts: The object's selected vertices, or selected history vertices
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
 
@@ -830,191 +1111,229 @@ def extrude_vertices(context, pg, operation, mode, obj, obj_loc, bm, verts, valu
         Nothing.
     """
 
+    obj = cmd.obj
+    obj_loc = cmd.obj_loc
+    bm = cmd.bm
+
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_EXTEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
     # Absolute/Global Coordinates
     if mode == "a":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
         new_vertex = bm.verts.new(vector_delta - obj_loc)
-        verts = [v for v in bm.verts if v.select].copy()
+        verts = cmd.sel_verts
         for v in verts:
             bm.edges.new([v, new_vertex])
-            v.select_set(False)
-        new_vertex.select_set(True)
-        bmesh.ops.remove_doubles(
-            bm, verts=[v for v in bm.verts if v.select], dist=0.0001
-        )
+        update_sel(bm, [new_vertex], [], [])
+        bmesh.ops.remove_doubles(bm, verts=[new_vertex], dist=0.0001)
     # Delta/Relative Coordinates
     elif mode in {"d", "n"}:
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
         if pg.plane == "LO":
-            vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z)
-        for v in verts:
-            new_vertex = bm.verts.new(v.co)
-            new_vertex.co = new_vertex.co + vector_delta
-            bm.edges.new([v, new_vertex])
-            v.select_set(False)
-            new_vertex.select_set(True)
+            vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z, cmd.frame)
+        extrude_verts_delta(bm, verts, vector_delta)
     # Direction/Polar Coordinates
     elif mode == "i":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 2)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 2)
         except:
             raise PDT_InvalidVector
         if pg.plane == "LO":
-            vector_delta = view_dir(pg.distance, pg.angle)
-        for v in verts:
-            new_vertex = bm.verts.new(v.co)
-            new_vertex.co = new_vertex.co + vector_delta
-            bm.edges.new([v, new_vertex])
-            v.select_set(False)
-            new_vertex.select_set(True)
+            vector_delta = view_dir(pg.distance, pg.angle, cmd.frame)
+        extrude_verts_delta(bm, verts, vector_delta)
     # Percent Options
     elif mode == "p":
         extend_all  = pg.extend
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 1)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 1)
         except:
             raise PDT_InvalidVector
-        verts = [v for v in bm.verts if v.select].copy()
+        verts = cmd.sel_verts
         new_vertex = bm.verts.new(vector_delta)
         if extend_all:
-            for v in [v for v in bm.verts if v.select]:
+            for v in verts:
                 bm.edges.new([v, new_vertex])
-                v.select_set(False)
+            update_sel(bm, [new_vertex], [], [])
         else:
             bm.edges.new([verts[-1], new_vertex])
-        new_vertex.select_set(True)
+            new_vertex.select_set(True)
 
-    bmesh.update_edit_mesh(obj.data)
+    refresh_edit_mesh(obj.data)
 
 
-def extrude_geometry(context, pg, operation, mode, obj, bm, values):
+def extrude_geometry(context, pg, operation, mode, cmd, values, count=1):
     """Extrude Geometry.
 
+    Note:
+        With a repeat count the selection is extruded count times, each step
+        extruding the last. The mesh is updated once, with the last step selected.
+
     Args:
         context: Blender bpy.context instance.
         pg: PDT Parameters Group - our variables
         operation: The Operation e.g. Create New Vertex
         mode: The Operation Mode, e.g. a for Absolute
-        obj: The Active Object
-        bm: The object's Bmesh
+        cmd: CommandContext of the Command
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
+        count: Number of times to Extrude
 
     Returns:
         Nothing.
     """
 
+    obj = cmd.obj
+    bm = cmd.bm
+
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_EXTEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
     # Delta/Relative Coordinates
     if mode in {"d", "n"}:
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
     # Direction/Polar Coordinates
     elif mode == "i":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 2)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 2)
         except:
             raise PDT_InvalidVector
 
-    ret = bmesh.ops.extrude_face_region(
-        bm,
-        geom=(
-            [f for f in bm.faces if f.select]
-            + [e for e in bm.edges if e.select]
-            + [v for v in bm.verts if v.select]
-        ),
-        use_select_history=True,
-    )
-    geom_extr = ret["geom"]
+    if pg.plane == "LO" and mode in {"d", "n"}:
+        vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z, cmd.frame)
+    elif pg.plane == "LO" and mode == "i":
+        vector_delta = view_dir(pg.distance, pg.angle, cmd.frame)
+
+    geom_extr = cmd.sel_geom
+    for _ in range(count):
+        ret = bmesh.ops.extrude_face_region(bm, geom=geom_extr, use_select_history=True)
+        geom_extr = ret["geom"]
+        del ret
+        bmesh.ops.translate(
+            bm,
+            verts=[v for v in geom_extr if isinstance(v, bmesh.types.BMVert)],
+            vec=vector_delta,
+        )
     verts_extr = [v for v in geom_extr if isinstance(v, bmesh.types.BMVert)]
     edges_extr = [e for e in geom_extr if isinstance(e, bmesh.types.BMEdge)]
     faces_extr = [f for f in geom_extr if isinstance(f, bmesh.types.BMFace)]
-    del ret
-
-    if pg.plane == "LO" and mode in {"d", "n"}:
-        vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z)
-    elif pg.plane == "LO" and mode == "i":
-        vector_delta = view_dir(pg.distance, pg.angle)
 
-    bmesh.ops.translate(bm, verts=verts_extr, vec=vector_delta)
     update_sel(bm, verts_extr, edges_extr, faces_extr)
-    bmesh.update_edit_mesh(obj.data)
+    refresh_edit_mesh(obj.data)
     bm.select_history.clear()
 
 
-def duplicate_geometry(context, pg, operation, mode, obj, bm, values):
+def duplicate_copies(bm, geom, vector_delta, count):
+    """Duplicate Geometry count times, each copy vector_delta from the one before.
+
+    Note:
+        Copies are made by doubling: each bmesh.ops.duplicate call copies a run of
+        the copies made so far, which is then moved along in one translate. Making
+        count copies needs about log2(count) calls, rather than count.
+
+    Args:
+        bm: The object's Bmesh
+        geom: Geometry to Duplicate
+        vector_delta: Offset of each copy from the one before
+        count: Number of copies
+
+    Returns:
+        List of the Geometry of all copies.
+    """
+
+    def copy(source, steps, history=False):
+        geom_dupe = bmesh.ops.duplicate(bm, geom=source, use_select_history=history)["geom"]
+        bmesh.ops.translate(
+            bm,
+            verts=[v for v in geom_dupe if isinstance(v, bmesh.types.BMVert)],
+            vec=vector_delta * steps,
+        )
+        return geom_dupe
+
+    # Runs of copies as (first copy number, number of copies, geometry)
+    runs = [(1, 1, copy(geom, 1, history=True))]
+    made = 1
+    while made < count:
+        if count - made >= made:
+            # Copy every copy made so far in one go
+            source = [elem for _, _, run_geom in runs for elem in run_geom]
+            runs.append((made + 1, made, copy(source, made)))
+            made *= 2
+            continue
+        # Fill the remainder from the largest runs that fit, run lengths are 1, 1,
+        # then powers of 2, so this always adds up to count exactly
+        for first, length, run_geom in sorted(runs, key=lambda run: -run[1]):
+            if length <= count - made:
+                runs.append((made + 1, length, copy(run_geom, made + 1 - first)))
+                made += length
+    return [elem for _, _, run_geom in runs for elem in run_geom]
+
+
+def duplicate_geometry(context, pg, operation, mode, cmd, values, count=1):
     """Duplicate Geometry.
 
+    Note:
+        With a repeat count, count copies are made in a row, each one vector_delta
+        from the one before. The mesh is updated once, with all copies selected.
+
     Args:
         context: Blender bpy.context instance.
         pg: PDT Parameters Group - our variables
         operation: The Operation e.g. Create New Vertex
         mode: The Operation Mode, e.g. a for Absolute
-        obj: The Active Object
-        bm: The object's Bmesh
+        cmd: CommandContext of the Command
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
+        count: Number of copies to make
 
     Returns:
         Nothing.
     """
 
+    obj = cmd.obj
+    bm = cmd.bm
+
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_DUPEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
     # Delta/Relative Coordinates
     if mode in {"d", "n"}:
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 3)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 3)
         except:
             raise PDT_InvalidVector
     # Direction/Polar Coordinates
     elif mode == "i":
         try:
-            vector_delta = vector_build(context, pg, obj, operation, values, 2)
+            vector_delta = vector_build(context, pg, cmd, operation, values, 2)
         except:
             raise PDT_InvalidVector
 
-    ret = bmesh.ops.duplicate(
-        bm,
-        geom=(
-            [f for f in bm.faces if f.select]
-            + [e for e in bm.edges if e.select]
-            + [v for v in bm.verts if v.select]
-        ),
-        use_select_history=True,
-    )
-    geom_dupe = ret["geom"]
+    if pg.plane == "LO" and mode in  {"d", "n"}:
+        vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z, cmd.frame)
+    elif pg.plane == "LO" and mode == "i":
+        vector_delta = view_dir(pg.distance, pg.angle, cmd.frame)
+
+    geom_dupe = duplicate_copies(bm, cmd.sel_geom, vector_delta, count)
     verts_dupe = [v for v in geom_dupe if isinstance(v, bmesh.types.BMVert)]
     edges_dupe = [e for e in geom_dupe if isinstance(e, bmesh.types.BMEdge)]
     faces_dupe = [f for f in geom_dupe if isinstance(f, bmesh.types.BMFace)]
-    del ret
 
-    if pg.plane == "LO" and mode in  {"d", "n"}:
-        vector_delta = view_coords(vector_delta.x, vector_delta.y, vector_delta.z)
-    elif pg.plane == "LO" and mode == "i":
-        vector_delta = view_dir(pg.distance, pg.angle)
-
-    bmesh.ops.translate(bm, verts=verts_dupe, vec=vector_delta)
     update_sel(bm, verts_dupe, edges_dupe, faces_dupe)
-    bmesh.update_edit_mesh(obj.data)
+    refresh_edit_mesh(obj.data)
 
 
-def fillet_geometry(context, pg, mode, obj, bm, verts, values):
+def fillet_geometry(context, pg, mode, cmd, verts, values):
     """Fillet Geometry.
 
     Args:
@@ -1022,8 +1341,7 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
         pg: PDT Parameters Group - our variables
         operation: The Operation e.g. Create New Vertex
         mode: The Operation Mode, e.g. a for Absolute
-        obj: The Active Object
-        bm: The object's Bmesh
+        cmd: CommandContext of the Command
         verts: The object's selected vertices, or selected history vertices
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
 
@@ -1031,9 +1349,12 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
         Nothing.
     """
 
+    obj = cmd.obj
+    bm = cmd.bm
+
     if not obj.mode == "EDIT":
         pg.error = PDT_ERR_FILEDIT
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
     if mode in {"i", "v"}:
         affect = 'VERTICES'
@@ -1042,19 +1363,19 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
         affect = 'EDGES'
     # Note that passing an empty parameter results in that parameter being seen as "0"
     # _offset <= 0 is ignored since a bevel/fillet radius must be > 0 to make sense
-    _offset = float(values[0])
+    _offset = values[0]
     # Force _segments to an integer (bug fix T95442)
-    _segments = int(float(values[1]))
+    _segments = int(values[1])
     if _segments < 1:
         _segments = 1   # This is a single, flat segment (ignores profile)
-    _profile = float(values[2])
+    _profile = values[2]
     if _profile < 0.0 or _profile > 1.0:
         _profile = 0.5  # This is a circular profile
     if mode == "i":
         # Fillet & Intersect Two Edges
         # Always use Current Selection
-        verts = [v for v in bm.verts if v.select]
-        edges = [e for e in bm.edges if e.select]
+        verts = cmd.sel_verts
+        edges = cmd.sel_edges
         if len(edges) == 2 and len(verts) == 4:
             plane = pg.plane
             v_active = edges[0].verts[0]
@@ -1069,7 +1390,7 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
                                               )
             if not done:
                 pg.error = f"{PDT_ERR_INT_LINES} {plane}  {PDT_LAB_PLANE}"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                error_popup(context)
                 raise PDT_IntersectionError
             if (v_active.co - vector_delta).length < (v_other.co - vector_delta).length:
                 v_active.co = vector_delta
@@ -1086,7 +1407,7 @@ def fillet_geometry(context, pg, mode, obj, bm, verts, values):
             bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
         else:
             pg.error = f"{PDT_ERR_SEL_4_VERTS} {len(verts)} Vert(s), {len(edges)} Edge(s))"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
 
     bpy.ops.mesh.bevel(
@@ -6,6 +6,7 @@
 #
 import bmesh
 import numpy as np
+from itertools import combinations
 from math import sqrt, tan, pi
 from mathutils import Vector
 from mathutils.geometry import intersect_point_line
@@ -14,15 +15,22 @@ from .pdt_functions import (
     oops,
     get_percent,
     dis_ang,
+    edit_bmesh,
+    error_popup,
     check_selection,
     arc_centre,
+    fit_circle,
     intersection,
+    plane_line_intersections,
+    refresh_edit_mesh,
     view_coords_i,
     view_coords,
-    view_dir,
+    view_coords_array,
     set_axis,
+    update_sel,
 )
 
+from .pdt_timing import timed
 from . import pdt_exception
 PDT_SelectionError = pdt_exception.SelectionError
 PDT_InvalidVector = pdt_exception.InvalidVector
@@ -43,7 +51,7 @@ from .pdt_msg_strings import (
     PDT_ERR_EDOB_MODE,
     PDT_ERR_NO_ACT_OBJ,
     PDT_ERR_VERT_MODE,
-    PDT_ERR_SEL_3_VERTS,
+    PDT_ERR_SEL_3_VERTM,
     PDT_ERR_SEL_3_OBJS,
     PDT_ERR_EDIT_MODE,
     PDT_ERR_NON_VALID,
@@ -65,13 +73,14 @@ from .pdt_msg_strings import (
 )
 
 
-def vector_build(context, pg, obj, operation, values, num_values):
+@timed("vector")
+def vector_build(context, pg, cmd, operation, values, num_values):
     """Build Movement Vector from Input Fields.
 
     Args:
         context: Blender bpy.context instance.
         pg: PDT Parameters Group - our variables
-        obj: The Active Object
+        cmd: CommandContext of the Command
         operation: The Operation e.g. Create New Vertex
         values: The parameters passed e.g. 1,4,3 for Cartesian Coordinates
         num_values: The number of values passed - determines the function
@@ -87,13 +96,13 @@ def vector_build(context, pg, obj, operation, values, num_values):
 
     # Cartesian 3D coordinates
     if num_values == 3 and len(values) == 3:
-        output_vector = Vector((float(values[0]), float(values[1]), float(values[2])))
+        output_vector = Vector(values)
     # Polar 2D coordinates
     elif num_values == 2 and len(values) == 2:
         output_vector = dis_ang(values, flip_angle, plane, scene)
     # Percentage of imaginary line between two 3D coordinates
     elif num_values == 1 and len(values) == 1:
-        output_vector = get_percent(obj, flip_percent, float(values[0]), operation, scene)
+        output_vector = get_percent(cmd.obj, flip_percent, values[0], operation, scene, cmd)
     else:
         if num_values == 3:
             pg.error = PDT_ERR_BAD3VALS
@@ -101,7 +110,7 @@ def vector_build(context, pg, obj, operation, values, num_values):
             pg.error = PDT_ERR_BAD2VALS
         else:
             pg.error = PDT_ERR_BAD1VALS
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         raise PDT_InvalidVector
     return output_vector
 
@@ -125,25 +134,25 @@ def placement_normal(context, operation):
     if obj.mode == "EDIT":
         if obj is None:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_ObjectModeError
         obj_loc = obj.matrix_world.decompose()[0]
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = edit_bmesh(obj.data)
         if len(bm.select_history) == 3:
             vector_a, vector_b, vector_c = check_selection(3, bm, obj)
             if vector_a is None:
                 pg.error = PDT_ERR_VERT_MODE
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                error_popup(context)
                 raise PDT_FeatureError
         else:
             pg.error = f"{PDT_ERR_SEL_3_VERTIO} {len(bm.select_history)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
     elif obj.mode == "OBJECT":
         objs = context.view_layer.objects.selected
         if len(objs) != 3:
             pg.error = f"{PDT_ERR_SEL_3_OBJS} {len(objs)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
         objs_s = [ob for ob in objs if ob.name != obj.name]
         vector_a = obj.matrix_world.decompose()[0]
@@ -170,20 +179,17 @@ def placement_normal(context, operation):
             else:
                 bm.select_history[-1].co = vector_delta
                 bm.select_history.clear()
-            bmesh.update_edit_mesh(obj.data)
+            refresh_edit_mesh(obj.data)
         elif obj.mode == "OBJECT":
             context.view_layer.objects.active.location = vector_delta
     elif operation == "N":
         if obj.mode == "EDIT":
             vertex_new = bm.verts.new(vector_delta)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            vertex_new.select_set(True)
+            update_sel(bm, [vertex_new], [], [])
+            refresh_edit_mesh(obj.data)
         else:
             pg.error = f"{PDT_ERR_EDIT_MODE} {obj.mode})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
     elif operation == "V" and obj.mode == "EDIT":
         vector_new = vector_delta
@@ -193,19 +199,19 @@ def placement_normal(context, operation):
                 bm.edges.new([v, vertex_new])
         else:
             bm.edges.new([bm.select_history[-1], vertex_new])
-        for v in [v for v in bm.verts if v.select]:
-            v.select_set(False)
-        vertex_new.select_set(True)
-        bmesh.update_edit_mesh(obj.data)
-        bm.select_history.clear()
+        update_sel(bm, [vertex_new], [], [])
+        refresh_edit_mesh(obj.data)
     else:
         pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_NOR}"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
 
 
 def placement_arc_centre(context, operation):
     """Manipulates Geometry, or Objects to an Arc Centre defined by 3 points on an Imaginary Arc.
 
+    Note:
+        In Edit Mode a circle is fitted to all selected vertices, 3 or more.
+
     Args:
         context: Blender bpy.context instance.
         operation: The Operation e.g. Create New Vertex
@@ -222,23 +228,20 @@ def placement_arc_centre(context, operation):
     if obj.mode == "EDIT":
         if obj is None:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_ObjectModeError
         obj = context.view_layer.objects.active
         obj_loc = obj.matrix_world.decompose()[0]
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = edit_bmesh(obj.data)
         verts = [v for v in bm.verts if v.select]
-        if len(verts) != 3:
-            pg.error = f"{PDT_ERR_SEL_3_VERTS} {len(verts)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        if len(verts) < 3:
+            pg.error = f"{PDT_ERR_SEL_3_VERTM} {len(verts)})"
+            error_popup(context)
             raise PDT_SelectionError
-        vector_a = verts[0].co
-        vector_b = verts[1].co
-        vector_c = verts[2].co
-        vector_delta, radius = arc_centre(vector_a, vector_b, vector_c)
+        vector_delta, radius, _rms = fit_circle([v.co for v in verts])
         if str(radius) == "inf":
             pg.error = PDT_ERR_STRIGHT_LINE
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_InfRadius
         pg.distance = radius
         if operation == "C":
@@ -248,12 +251,8 @@ def placement_arc_centre(context, operation):
         elif operation == "N":
             vector_new = vector_delta
             vertex_new = bm.verts.new(vector_new)
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            vertex_new.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
-            vertex_new.select_set(True)
+            update_sel(bm, [vertex_new], [], [])
+            refresh_edit_mesh(obj.data)
         elif operation == "G":
             if extend_all:
                 for v in [v for v in bm.verts if v.select]:
@@ -263,28 +262,26 @@ def placement_arc_centre(context, operation):
             else:
                 bm.select_history[-1].co = vector_delta
                 bm.select_history.clear()
-            bmesh.update_edit_mesh(obj.data)
+            refresh_edit_mesh(obj.data)
         elif operation == "V":
             vertex_new = bm.verts.new(vector_delta)
             if extend_all:
                 for v in [v for v in bm.verts if v.select]:
                     bm.edges.new([v, vertex_new])
-                    v.select_set(False)
-                vertex_new.select_set(True)
-                bm.select_history.clear()
-                bmesh.ops.remove_doubles(bm, verts=[v for v in bm.verts if v.select], dist=0.0001)
-                bmesh.update_edit_mesh(obj.data)
+                update_sel(bm, [vertex_new], [], [])
+                bmesh.ops.remove_doubles(bm, verts=[vertex_new], dist=0.0001)
+                refresh_edit_mesh(obj.data)
             else:
                 bm.edges.new([bm.select_history[-1], vertex_new])
-                bmesh.update_edit_mesh(obj.data)
+                refresh_edit_mesh(obj.data)
                 bm.select_history.clear()
         else:
             pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_ARCCENTRE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
     elif obj.mode == "OBJECT":
         if len(context.view_layer.objects.selected) != 3:
             pg.error = f"{PDT_ERR_SEL_3_OBJS} {len(context.view_layer.objects.selected)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
         vector_a = context.view_layer.objects.selected[0].matrix_world.decompose()[0]
         vector_b = context.view_layer.objects.selected[1].matrix_world.decompose()[0]
@@ -299,12 +296,16 @@ def placement_arc_centre(context, operation):
             context.view_layer.objects.active.location = vector_delta
         else:
             pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_ARCCENTRE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
 
 
 def placement_intersect(context, operation):
     """Manipulates Geometry, or Objects by Convergence Intersection between 4 points, or 2 Edges.
 
+    Note:
+        With more than 2 Edges selected, New Vertex places a Vertex wherever a pair
+        of them converges. Pairs that share a Vertex are skipped.
+
     Args:
         context: Blender bpy.context instance.
         operation: The Operation e.g. Create New Vertex
@@ -320,13 +321,32 @@ def placement_intersect(context, operation):
     if obj.mode == "EDIT":
         if obj is None:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_NoObjectError
         obj_loc = obj.matrix_world.decompose()[0]
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = edit_bmesh(obj.data)
         edges = [e for e in bm.edges if e.select]
         extend_all = pg.extend
 
+        if operation == "N" and len(edges) > 2:
+            pairs = [
+                (edge_a, edge_b)
+                for edge_a, edge_b in combinations(edges, 2)
+                if not set(edge_a.verts) & set(edge_b.verts)
+            ]
+            coords = np.array(
+                [[v.co for edge in pair for v in edge.verts] for pair in pairs], dtype=np.float64
+            ).reshape(-1, 4, 3)
+            points, converged = plane_line_intersections(coords, plane)
+            if not converged.any():
+                pg.error = f"{PDT_ERR_INT_LINES} {plane}  {PDT_LAB_PLANE}"
+                error_popup(context)
+                raise PDT_IntersectionError
+            vertices_new = [bm.verts.new(point) for point in points[converged].tolist()]
+            update_sel(bm, vertices_new, [], [])
+            refresh_edit_mesh(obj.data)
+            return
+
         if len(edges) == 2:
             vertex_a = edges[0].verts[0]
             vertex_b = edges[0].verts[1]
@@ -341,7 +361,7 @@ def placement_intersect(context, operation):
                     + str(len(edges))
                     + " Edges)"
                 )
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                error_popup(context)
                 raise PDT_SelectionError
             vertex_a = bm.select_history[-1]
             vertex_b = bm.select_history[-2]
@@ -351,7 +371,7 @@ def placement_intersect(context, operation):
         vector_delta, done = intersection(vertex_a.co, vertex_b.co, vertex_c.co, vertex_d.co, plane)
         if not done:
             pg.error = f"{PDT_ERR_INT_LINES} {plane}  {PDT_LAB_PLANE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_IntersectionError
 
         if operation == "C":
@@ -361,15 +381,8 @@ def placement_intersect(context, operation):
         elif operation == "N":
             vector_new = vector_delta
             vertex_new = bm.verts.new(vector_new)
-            for v in [v for v in bm.verts if v.select]:
-                v.select_set(False)
-            for f in bm.faces:
-                f.select_set(False)
-            for e in bm.edges:
-                e.select_set(False)
-            vertex_new.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
-            bm.select_history.clear()
+            update_sel(bm, [vertex_new], [], [])
+            refresh_edit_mesh(obj.data)
         elif operation in {"G", "V"}:
             vertex_new = None
             process = False
@@ -410,31 +423,20 @@ def placement_intersect(context, operation):
 
             if not process and not extend_all:
                 pg.error = PDT_ERR_INT_NO_ALL
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
-                bmesh.update_edit_mesh(obj.data)
+                error_popup(context)
+                refresh_edit_mesh(obj.data)
                 return
-            for v in bm.verts:
-                v.select_set(False)
-            for f in bm.faces:
-                f.select_set(False)
-            for e in bm.edges:
-                e.select_set(False)
-
-            if vertex_new is not None:
-                vertex_new.select_set(True)
-            for v in bm.select_history:
-                if v is not None:
-                    v.select_set(True)
-            bmesh.update_edit_mesh(obj.data)
+            update_sel(bm, [vertex_new] if vertex_new is not None else [], [], [])
+            refresh_edit_mesh(obj.data)
         else:
             pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_INTERSECT}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_InvalidOperation
 
     elif obj.mode == "OBJECT":
         if len(context.view_layer.objects.selected) != 4:
             pg.error = f"{PDT_ERR_SEL_4_OBJS} {len(context.view_layer.objects.selected)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
         order = pg.object_order.split(",")
         objs = sorted(context.view_layer.objects.selected, key=lambda x: x.name)
@@ -457,7 +459,7 @@ def placement_intersect(context, operation):
         vector_delta, done = intersection(vector_a, vector_b, vector_c, vector_d, plane)
         if not done:
             pg.error = f"{PDT_ERR_INT_LINES} {plane}  {PDT_LAB_PLANE}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_IntersectionError
         if operation == "C":
             scene.cursor.location = vector_delta
@@ -469,7 +471,7 @@ def placement_intersect(context, operation):
             context.window_manager.popup_menu(oops, title="Info", icon="INFO")
         else:
             pg.error = f"{operation} {PDT_ERR_NON_VALID} {PDT_LAB_INTERSECT}"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
         return
     else:
         return
@@ -494,25 +496,25 @@ def join_two_vertices(context):
     pg = scene.pdt_pg
     obj = context.view_layer.objects.active
     if all([bool(obj), obj.type == "MESH", obj.mode == "EDIT"]):
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = edit_bmesh(obj.data)
         verts = [v for v in bm.verts if v.select]
         if len(verts) == 2:
             try:
                 bm.edges.new([verts[-1], verts[-2]])
-                bmesh.update_edit_mesh(obj.data)
+                refresh_edit_mesh(obj.data)
                 bm.select_history.clear()
                 return
             except ValueError:
                 pg.error = PDT_ERR_CONNECTED
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                error_popup(context)
                 raise PDT_VerticesConnected
         else:
             pg.error = f"{PDT_ERR_SEL_2_VERTS} {len(verts)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         raise PDT_ObjectModeError
 
 
@@ -538,31 +540,31 @@ def set_angle_distance_two(context):
     obj = context.view_layer.objects.active
     if obj is None:
         pg.error = PDT_ERR_NO_ACT_OBJ
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
     if obj.mode == "EDIT":
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = edit_bmesh(obj.data)
         verts = [v for v in bm.verts if v.select]
         if len(verts) == 2:
             if len(bm.select_history) == 2:
                 vector_a, vector_b = check_selection(2, bm, obj)
                 if vector_a is None:
                     pg.error = PDT_ERR_VERT_MODE
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                    error_popup(context)
                     raise PDT_FeatureError
             else:
                 pg.error = f"{PDT_ERR_SEL_2_VERTIO} {len(bm.select_history)})"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                error_popup(context)
                 raise PDT_SelectionError
         else:
             pg.error = f"{PDT_ERR_SEL_2_VERTIO} {len(verts)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
     elif obj.mode == "OBJECT":
         objs = context.view_layer.objects.selected
         if len(objs) < 2:
             pg.error = f"{PDT_ERR_SEL_2_OBJS} {len(objs)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
         objs_s = [ob for ob in objs if ob.name != obj.name]
         vector_a = obj.matrix_world.decompose()[0]
@@ -617,31 +619,31 @@ def set_angle_distance_three(context):
     obj = context.view_layer.objects.active
     if obj is None:
         pg.error = PDT_ERR_NO_ACT_OBJ
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         raise PDT_NoObjectError
     if obj.mode == "EDIT":
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = edit_bmesh(obj.data)
         verts = [v for v in bm.verts if v.select]
         if len(verts) == 3:
             if len(bm.select_history) == 3:
                 vector_a, vector_b, vector_c = check_selection(3, bm, obj)
                 if vector_a is None:
                     pg.error = PDT_ERR_VERT_MODE
-                    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                    error_popup(context)
                     raise PDT_FeatureError
             else:
                 pg.error = f"{PDT_ERR_SEL_3_VERTIO} {len(bm.select_history)})"
-                context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                error_popup(context)
                 raise PDT_SelectionError
         else:
             pg.error = f"{PDT_ERR_SEL_3_VERTIO} {len(verts)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
     elif obj.mode == "OBJECT":
         objs = context.view_layer.objects.selected
         if len(objs) < 3:
             pg.error = PDT_ERR_SEL_3_OBJS + str(len(objs))
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
         objs_s = [ob for ob in objs if ob.name != obj.name]
         vector_a = obj.matrix_world.decompose()[0]
@@ -687,17 +689,17 @@ def origin_to_cursor(context):
     obj = context.view_layer.objects.active
     if obj is None:
         pg.error = PDT_ERR_NO_ACT_OBJ
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
     obj_loc = obj.matrix_world.decompose()[0]
     cur_loc = scene.cursor.location
     diff_v = obj_loc - cur_loc
     if obj.mode == "EDIT":
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = edit_bmesh(obj.data)
         for v in bm.verts:
             v.co = v.co + diff_v
         obj.location = cur_loc
-        bmesh.update_edit_mesh(obj.data)
+        refresh_edit_mesh(obj.data)
         bm.select_history.clear()
     elif obj.mode == "OBJECT":
         for v in obj.data.vertices:
@@ -705,7 +707,7 @@ def origin_to_cursor(context):
         obj.location = cur_loc
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE} {obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         raise PDT_ObjectModeError
 
 
@@ -736,36 +738,42 @@ def taper(context):
     if all([bool(obj), obj.type == "MESH", obj.mode == "EDIT"]):
         if ang_v > 80 or ang_v < -80:
             pg.error = f"{PDT_ERR_TAPER_ANG} {ang_v})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_InvalidAngle
         if obj is None:
             pg.error = PDT_ERR_NO_ACT_OBJ
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_NoObjectError
         _, a2, a3 = set_axis(tap_ax)
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = edit_bmesh(obj.data)
         if len(bm.select_history) >= 1:
             rotate_vertex = bm.select_history[-1]
             view_vector = view_coords(rotate_vertex.co.x, rotate_vertex.co.y, rotate_vertex.co.z)
         else:
             pg.error = f"{PDT_ERR_TAPER_SEL} {len(bm.select_history)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             raise PDT_SelectionError
-        for v in [v for v in bm.verts if v.select]:
-            if pg.plane == "LO":
-                v_loc = view_coords(v.co.x, v.co.y, v.co.z)
-                dis_v = sqrt((view_vector.x - v_loc.x) ** 2 + (view_vector.y - v_loc.y) ** 2)
-                x_loc = dis_v * tan(ang_v * pi / 180)
-                view_matrix = view_dir(x_loc, 0)
-                v.co = v.co - view_matrix
-            else:
+        verts = [v for v in bm.verts if v.select]
+        if pg.plane == "LO":
+            # All selected vertices are moved in view space at once, view_dir(x_loc, 0) is
+            # the view's X axis scaled by x_loc.
+            coords = np.array([v.co for v in verts], dtype=np.float64).reshape(-1, 3)
+            v_locs = view_coords_array(coords)
+            dis_v = np.hypot(view_vector.x - v_locs[:, 0], view_vector.y - v_locs[:, 1])
+            offsets = np.zeros_like(coords)
+            offsets[:, 0] = dis_v * tan(ang_v * pi / 180)
+            new_coords = coords - view_coords_array(offsets)
+            for v, new_co in zip(verts, new_coords.tolist()):
+                v.co = new_co
+        else:
+            for v in verts:
                 dis_v = sqrt(
                     (rotate_vertex.co[a3] - v.co[a3]) ** 2 + (rotate_vertex.co[a2] - v.co[a2]) ** 2
                 )
                 v.co[a2] = v.co[a2] - (dis_v * tan(ang_v * pi / 180))
-        bmesh.update_edit_mesh(obj.data)
+        refresh_edit_mesh(obj.data)
         bm.select_history.clear()
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         raise PDT_ObjectModeError
@@ -9,14 +9,13 @@
 #
 #
 import bpy
-import bmesh
 from mathutils.geometry import intersect_line_plane
 from .pdt_msg_strings import (
     PDT_ERR_NOINT,
     PDT_ERR_EDOB_MODE,
     PDT_ERR_SEL_1_E_1_F,
 )
-from .pdt_functions import oops
+from .pdt_functions import edit_bmesh, error_popup, refresh_edit_mesh
 
 
 def failure_message(context):
@@ -31,7 +30,7 @@ def failure_message(context):
 
     pg = context.scene.pdt_pg
     pg.error = f"{PDT_ERR_SEL_1_E_1_F}"
-    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+    error_popup(context)
 
 
 def failure_message_on_plane(context):
@@ -46,7 +45,7 @@ def failure_message_on_plane(context):
 
     pg = context.scene.pdt_pg
     pg.error = f"{PDT_ERR_NOINT}"
-    context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+    error_popup(context)
 
 def extend_vertex(context):
     """Computes Edge Extension to Face.
@@ -63,7 +62,7 @@ def extend_vertex(context):
 
     if all([bool(obj), obj.type == "MESH", obj.mode == "EDIT"]):
         object_data = obj.data
-        bm = bmesh.from_edit_mesh(object_data)
+        bm = edit_bmesh(object_data)
         verts = bm.verts
         faces = bm.faces
 
@@ -99,13 +98,13 @@ def extend_vertex(context):
 
             vertex_reference = v1_ref if (a_len < b_len) else v2_ref
             bm.edges.new([vertex_reference, new_vertex])
-            bmesh.update_edit_mesh(object_data, loop_triangles=True)
+            refresh_edit_mesh(object_data, loop_triangles=True)
 
         else:
             failure_message_on_plane(context)
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
 
 
@@ -8,10 +8,9 @@
 
 import bpy
 import bmesh
-import bgl
 import gpu
 import numpy as np
-from mathutils import Vector, Quaternion
+from mathutils import Matrix, Vector, Quaternion
 from gpu_extras.batch import batch_for_shader
 from math import cos, sin, pi
 from .pdt_msg_strings import (
@@ -21,55 +20,34 @@ from .pdt_msg_strings import (
     PDT_ERR_NO_ACT_OBJ,
     PDT_ERR_SEL_1_EDGEM,
 )
+from .pdt_timing import stage
+from .pdt_trace import trace
 from . import pdt_exception
 PDT_ShaderError = pdt_exception.ShaderError
 
 
-def debug(msg, prefix=""):
+def debug(msg, *args, prefix=""):
     """Print a debug message to the console if PDT's or Blender's debug flags are set.
 
     Note:
         The printed message will be of the form:
 
-        {prefix}{caller file name:line number}| {msg}
+        {prefix}{caller file name:line number}| {msg % args}
+
+        Formatting is deferred to pdt_trace, so pass values as args rather than
+        building an f-string, the call then costs a flag test when debugging is off.
 
     Args:
-        msg: Incoming message to display
+        msg: Incoming message to display, or %-style format string for args
+        args: Values for the format string
         prefix: Always Blank
 
     Returns:
         Nothing.
     """
 
-    pdt_debug = bpy.context.preferences.addons[__package__].preferences.debug
-    if  bpy.app.debug or bpy.app.debug_python or pdt_debug:
-        import traceback
-
-        def extract_filename(fullpath):
-            """Return only the filename part of fullpath (excluding its path).
-
-            Args:
-                fullpath: Filename's full path
-
-            Returns:
-                filename.
-            """
-            # Expected to end up being a string containing only the filename
-            # (i.e. excluding its preceding '/' separated path)
-            filename = fullpath.split('/')[-1]
-            #print(filename)
-            # something went wrong
-            if len(filename) < 1:
-                return fullpath
-            # since this is a string, just return it
-            return filename
-
-        # stack frame corresponding to the line where debug(msg) was called
-        #print(traceback.extract_stack()[-2])
-        laststack = traceback.extract_stack()[-2]
-        #print(laststack[0])
-        # laststack[0] is the caller's full file name, laststack[1] is the line number
-        print(f"{prefix}{extract_filename(laststack[0])}:{laststack[1]}| {msg}")
+    trace(msg, *args, prefix=prefix, depth=2)
+
 
 def oops(self, context):
     """Error Routine.
@@ -175,17 +153,255 @@ def check_selection(num, bm, obj):
             vector_d = bm.select_history[-4].co
             return vector_a, vector_b, vector_c, vector_d
     else:
-        for f in bm.faces:
-            f.select_set(False)
-        for e in bm.edges:
-            e.select_set(False)
-        for v in bm.verts:
-            v.select_set(False)
+        deselect_all(bm)
         bmesh.update_edit_mesh(obj.data)
-        bm.select_history.clear()
     return None
 
 
+class ScriptRun:
+    """State shared by the Commands of a running Command Script.
+
+    Note:
+        While a script runs, its Commands share one Bmesh handle per Mesh, Edit Mode
+        Mesh updates are deferred to the end of the script and errors are left in
+        pg.error for the script's report rather than shown in popups.
+    """
+
+    def __init__(self):
+        """Start Idle.
+
+        Returns:
+            Nothing.
+        """
+
+        self.active = False
+        self.bmeshes = {}
+        self.updates = {}
+
+    def __enter__(self):
+        self.active = True
+        return self
+
+    def __exit__(self, *exc):
+        self.active = False
+        for mesh, loop_triangles, destructive in self.updates.values():
+            if mesh.is_editmode:
+                bmesh.update_edit_mesh(
+                    mesh, loop_triangles=loop_triangles, destructive=destructive
+                )
+        self.bmeshes.clear()
+        self.updates.clear()
+        return False
+
+
+_script_run = ScriptRun()
+
+
+def script_run():
+    """Return the Command Script state, use it as a Context Manager to run a script.
+
+    Returns:
+        ScriptRun.
+    """
+
+    return _script_run
+
+
+def edit_bmesh(mesh):
+    """Return the Bmesh of an Edit Mode Mesh, shared by all Commands of a running script.
+
+    Args:
+        mesh: Object's Mesh data
+
+    Returns:
+        Bmesh.
+    """
+
+    if not _script_run.active:
+        return bmesh.from_edit_mesh(mesh)
+    key = mesh.as_pointer()
+    bm = _script_run.bmeshes.get(key)
+    if bm is None or not bm.is_valid:
+        bm = bmesh.from_edit_mesh(mesh)
+        _script_run.bmeshes[key] = bm
+    return bm
+
+
+class CommandContext:
+    """State of the Active Object shared by the Stages of one Command.
+
+    Note:
+        Built once per Command by command_parse. The Bmesh, the selected Vertices,
+        Edges & Faces and the View Frame are looked up on first use and then kept,
+        so each Bmesh scan happens at most once per Command. The selection lists are
+        a snapshot, a Stage that changes the selection must not read them afterwards.
+    """
+
+    def __init__(self, context):
+        """Snapshot the Active Object.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Nothing.
+        """
+
+        self.context = context
+        self.obj = context.view_layer.objects.active
+        if self.obj is not None:
+            self.matrix_world = self.obj.matrix_world.copy()
+        else:
+            self.matrix_world = Matrix.Identity(4)
+        self.obj_loc = self.matrix_world.translation.copy()
+        self._bm = None
+        self._sel_verts = None
+        self._sel_edges = None
+        self._sel_faces = None
+        self._frame = None
+
+    @property
+    def bm(self):
+        """Bmesh of the Active Object, None unless it is in Edit Mode."""
+        if self._bm is None and self.obj is not None and self.obj.mode == "EDIT":
+            self._bm = edit_bmesh(self.obj.data)
+        return self._bm
+
+    @property
+    def sel_verts(self):
+        """Selected Vertices."""
+        if self._sel_verts is None:
+            self._sel_verts = [v for v in self.bm.verts if v.select]
+        return self._sel_verts
+
+    @property
+    def sel_edges(self):
+        """Selected Edges."""
+        if self._sel_edges is None:
+            self._sel_edges = [e for e in self.bm.edges if e.select]
+        return self._sel_edges
+
+    @property
+    def sel_faces(self):
+        """Selected Faces."""
+        if self._sel_faces is None:
+            self._sel_faces = [f for f in self.bm.faces if f.select]
+        return self._sel_faces
+
+    @property
+    def sel_geom(self):
+        """Selected Faces, Edges & Vertices, as bmesh.ops geom input."""
+        return self.sel_faces + self.sel_edges + self.sel_verts
+
+    @property
+    def frame(self):
+        """View Frame of the 3D View the Command was issued from."""
+        if self._frame is None:
+            self._frame = view_frame(self.context)
+        return self._frame
+
+
+def refresh_edit_mesh(mesh, loop_triangles=True, destructive=True):
+    """Write a Bmesh back to its Edit Mode Mesh, timed as the "update" Stage.
+
+    Note:
+        While a Command Script runs, the update is deferred to the end of the script.
+
+    Args:
+        mesh: Object's Mesh data
+        loop_triangles: Recalculate the Mesh's triangulation
+        destructive: Geometry was added, or removed
+
+    Returns:
+        Nothing.
+    """
+
+    if _script_run.active:
+        key = mesh.as_pointer()
+        _mesh, pending_triangles, pending_destructive = _script_run.updates.get(
+            key, (mesh, False, False)
+        )
+        _script_run.updates[key] = (
+            mesh,
+            pending_triangles or loop_triangles,
+            pending_destructive or destructive,
+        )
+        return
+    with stage("update"):
+        bmesh.update_edit_mesh(mesh, loop_triangles=loop_triangles, destructive=destructive)
+
+
+def error_popup(context):
+    """Show pg.error in a popup, unless a Command Script is collecting errors.
+
+    Args:
+        context: Blender bpy.context instance.
+
+    Returns:
+        Nothing.
+    """
+
+    if not _script_run.active:
+        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+
+
+def deselect_all(bm):
+    """Clears the Vertex, Edge and Face Selection of a Bmesh in one pass.
+
+    Note:
+        Only the elements that are selected are cleared, the selection is then
+        flushed for the current select mode. Selection History is cleared as well.
+
+    Args:
+        bm: Object Bmesh
+
+    Returns:
+        Nothing.
+    """
+
+    for elements in (bm.faces, bm.edges, bm.verts):
+        for element in [e for e in elements if e.select]:
+            element.select = False
+    bm.select_flush_mode()
+    bm.select_history.clear()
+
+
+def select_elements(verts=(), edges=(), faces=()):
+    """Marks only the given Vertices, Edges and Faces as Selected.
+
+    Args:
+        verts: Vertices to Select
+        edges: Edges to Select
+        faces: Faces to Select
+
+    Returns:
+        Nothing.
+    """
+
+    for elements in (verts, edges, faces):
+        for element in elements:
+            element.select_set(True)
+
+
+def mesh_select_all(mesh, state):
+    """Sets the Selection of every Vertex, Edge and Face of an Object Mode Mesh.
+
+    Note:
+        Uses flat boolean arrays through foreach_set, the Mesh must not be in Edit Mode.
+
+    Args:
+        mesh: Object's Mesh data
+        state: True to Select, False to Deselect
+
+    Returns:
+        Nothing.
+    """
+
+    for elements in (mesh.vertices, mesh.edges, mesh.polygons):
+        elements.foreach_set("select", np.full(len(elements), state, dtype=bool))
+    mesh.update()
+
+
 def update_sel(bm, verts, edges, faces):
     """Updates Vertex, Edge and Face Selections following a function.
 
@@ -198,44 +414,171 @@ def update_sel(bm, verts, edges, faces):
     Returns:
         Nothing.
     """
-    for f in bm.faces:
-        f.select_set(False)
-    for e in bm.edges:
-        e.select_set(False)
-    for v in bm.verts:
-        v.select_set(False)
-    for v in verts:
-        v.select_set(True)
-    for e in edges:
-        e.select_set(True)
-    for f in faces:
-        f.select_set(True)
-
-
-def view_coords(x_loc, y_loc, z_loc):
+    deselect_all(bm)
+    select_elements(verts, edges, faces)
+
+
+def move_objects(objects, delta=None, location=None):
+    """Moves Objects in World Space, all at once.
+
+    Note:
+        Either delta or location is given. Locations are read into one array, the
+        World Space move is taken into each Object's parent space with NumPy and
+        the results written back, so parented Objects move by the World amount.
+        Objects with a parent, or other ancestor, in objects are carried by it
+        and not moved themselves.
+
+        The View Layer is updated first when any Object has a parent, so parent
+        matrices are current even if the parents were moved since the last update.
+
+    Args:
+        objects: Objects to Move
+        delta: World Space offset to add to every Object's location
+        location: World Space location to move every Object to
+
+    Returns:
+        Nothing.
+    """
+
+    moving = set(objects)
+    objects = [ob for ob in objects if not _has_ancestor(ob, moving)]
+    if not objects:
+        return
+    locations = np.array([ob.location for ob in objects], dtype=np.float64)
+    # Parent Space of each Object, as matrix_world = parent_space @ matrix_basis
+    parent_space = np.tile(np.eye(4), (len(objects), 1, 1))
+    parented = [(index, ob) for index, ob in enumerate(objects) if ob.parent is not None]
+    if parented:
+        bpy.context.view_layer.update()
+    for index, ob in parented:
+        if ob.parent_type == "OBJECT":
+            parent_space[index] = ob.parent.matrix_world @ ob.matrix_parent_inverse
+        else:
+            # Bone and Vertex parents, matrix_world is current after the update.
+            parent_space[index] = ob.matrix_world @ ob.matrix_basis.inverted_safe()
+    to_local = np.linalg.pinv(parent_space[:, :3, :3])
+    if location is not None:
+        world = np.asarray(location, dtype=np.float64) - parent_space[:, :3, 3]
+        locations = np.einsum("nij,nj->ni", to_local, world)
+    else:
+        locations += to_local @ np.asarray(delta, dtype=np.float64)
+    for ob, ob_location in zip(objects, locations.tolist()):
+        ob.location = ob_location
+
+
+def _has_ancestor(ob, objects):
+    """Return whether any parent of an Object, at any level, is in objects.
+
+    Args:
+        ob: Object to check
+        objects: Set of Objects
+
+    Returns:
+        Boolean.
+    """
+
+    parent = ob.parent
+    while parent is not None:
+        if parent in objects:
+            return True
+        parent = parent.parent
+    return False
+
+
+class ViewFrame:
+    """Cached Rotation of a 3D View.
+
+    Note:
+        Holds the 3x3 rotation of a region's view_matrix and its inverse, as Matrices
+        and as NumPy arrays for the array transforms. They are only
+        recomputed when the region, or its view_matrix, changes, so repeated calls to
+        view_coords, view_coords_i & view_dir cost a comparison rather than a matrix
+        normalisation and inversion.
+    """
+
+    def __init__(self):
+        """Start with an Empty Frame.
+
+        Returns:
+            Nothing.
+        """
+
+        self.key = None
+        self.rotation = None
+        self.inverse = None
+        self.rotation_array = None
+        self.inverse_array = None
+
+    def update(self, region_3d):
+        """Refresh the Frame if the View has changed.
+
+        Args:
+            region_3d: RegionView3D to follow
+
+        Returns:
+            Self.
+        """
+
+        view_matrix = region_3d.view_matrix
+        key = (region_3d.as_pointer(), tuple(value for row in view_matrix for value in row))
+        if key != self.key:
+            self.key = key
+            self.rotation = view_matrix.to_3x3().normalized()
+            self.inverse = self.rotation.inverted()
+            self.rotation_array = np.array(self.rotation, dtype=np.float64)
+            self.inverse_array = np.array(self.inverse, dtype=np.float64)
+        return self
+
+
+_view_frame = ViewFrame()
+
+
+def view_frame(context=None):
+    """Return the View Frame of the 3D View a Command was issued from.
+
+    Note:
+        Uses the context's own 3D View when it has one, otherwise the first 3D View
+        on the screen.
+
+    Args:
+        context: Blender bpy.context instance, bpy.context if not given.
+
+    Returns:
+        ViewFrame, or None if there is no 3D View.
+    """
+
+    context = context or bpy.context
+    space = context.space_data
+    if space is None or space.type != "VIEW_3D":
+        areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
+        if not areas:
+            return None
+        space = areas[0].spaces.active
+    return _view_frame.update(space.region_3d)
+
+
+def view_coords(x_loc, y_loc, z_loc, frame=None):
     """Converts input Vector values to new Screen Oriented Vector.
 
     Args:
         x_loc: X coordinate from vector
         y_loc: Y coordinate from vector
         z_loc: Z coordinate from vector
+        frame: ViewFrame to use, the Command's 3D View if not given
 
     Returns:
         Vector adjusted to View's Inverted Transformation Matrix.
     """
 
-    areas = [a for a in bpy.context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        view_matrix = areas[0].spaces.active.region_3d.view_matrix
-        view_matrix = view_matrix.to_3x3().normalized().inverted()
-        view_location = Vector((x_loc, y_loc, z_loc))
-        new_view_location = view_matrix @ view_location
-        return new_view_location
+    if frame is None:
+        frame = view_frame()
+    if frame is not None:
+        return frame.inverse @ Vector((x_loc, y_loc, z_loc))
 
     return Vector((0, 0, 0))
 
 
-def view_coords_i(x_loc, y_loc, z_loc):
+def view_coords_i(x_loc, y_loc, z_loc, frame=None):
     """Converts Screen Oriented input Vector values to new World Vector.
 
     Note:
@@ -245,23 +588,63 @@ def view_coords_i(x_loc, y_loc, z_loc):
         x_loc: X coordinate from vector
         y_loc: Y coordinate from vector
         z_loc: Z coordinate from vector
+        frame: ViewFrame to use, the Command's 3D View if not given
 
     Returns:
         Vector adjusted to View's Transformation Matrix.
     """
 
-    areas = [a for a in bpy.context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        view_matrix = areas[0].spaces.active.region_3d.view_matrix
-        view_matrix = view_matrix.to_3x3().normalized()
-        view_location = Vector((x_loc, y_loc, z_loc))
-        new_view_location = view_matrix @ view_location
-        return new_view_location
+    if frame is None:
+        frame = view_frame()
+    if frame is not None:
+        return frame.rotation @ Vector((x_loc, y_loc, z_loc))
 
     return Vector((0, 0, 0))
 
 
-def view_dir(dis_v, ang_v):
+def view_coords_array(coords):
+    """Converts an Array of Vectors to Screen Oriented Vectors.
+
+    Note:
+        Array version of view_coords, all rows are transformed with one multiply.
+
+    Args:
+        coords: Float array (n, 3), or a list of Vectors
+
+    Returns:
+        Float array (n, 3) adjusted to View's Inverted Transformation Matrix.
+    """
+
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    frame = view_frame()
+    if frame is not None:
+        return coords @ frame.inverse_array.T
+
+    return np.zeros_like(coords)
+
+
+def view_coords_i_array(coords):
+    """Converts an Array of Screen Oriented Vectors to World Vectors.
+
+    Note:
+        Array version of view_coords_i, all rows are transformed with one multiply.
+
+    Args:
+        coords: Float array (n, 3), or a list of Vectors
+
+    Returns:
+        Float array (n, 3) adjusted to View's Transformation Matrix.
+    """
+
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    frame = view_frame()
+    if frame is not None:
+        return coords @ frame.rotation_array.T
+
+    return np.zeros_like(coords)
+
+
+def view_dir(dis_v, ang_v, frame=None):
     """Converts Distance and Angle to View Oriented Vector.
 
     Note:
@@ -271,20 +654,19 @@ def view_dir(dis_v, ang_v):
     Args:
         dis_v: Scene PDT distance
         ang_v: Scene PDT angle
+        frame: ViewFrame to use, the Command's 3D View if not given
 
     Returns:
         World Vector.
     """
 
-    areas = [a for a in bpy.context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        view_matrix = areas[0].spaces.active.region_3d.view_matrix
-        view_matrix = view_matrix.to_3x3().normalized().inverted()
+    if frame is None:
+        frame = view_frame()
+    if frame is not None:
         view_location = Vector((0, 0, 0))
         view_location.x = dis_v * cos(ang_v * pi / 180)
         view_location.y = dis_v * sin(ang_v * pi / 180)
-        new_view_location = view_matrix @ view_location
-        return new_view_location
+        return frame.inverse @ view_location
 
     return Vector((0, 0, 0))
 
@@ -351,12 +733,132 @@ def arc_centre(vector_a, vector_b, vector_c):
     return Vector((intersect_coord[0], intersect_coord[1], intersect_coord[2])), radius
 
 
-def intersection(vertex_a, vertex_b, vertex_c, vertex_d, plane):
+def fit_circle(coords, plane=None):
+    """Fits a Circle to 3 or more Vector Locations by Algebraic Least Squares.
+
+    Note:
+        Uses the Kasa fit on coordinates centred on their mean, so every vertex
+        of an Arc contributes in one Numpy pass. Points are projected to the
+        working plane, or to their own best fit plane if plane is None.
+        Collinear points return an infinite Radius, as arc_centre does.
+
+    Args:
+        coords: Float array (n, 3), or a list of Vectors
+        plane: Working Plane, one of "XY", "XZ", "YZ", "LO", or None
+
+    Returns:
+        Vector representing Arc Centre, Float representing Arc Radius and
+        Float representing the RMS distance of the points from the Circle.
+    """
+
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 3)
+    if plane == "LO":
+        coords = view_coords_i_array(coords)
+    mean = coords.mean(axis=0)
+    centred = coords - mean
+    if plane is None:
+        # Rows of basis are the in-plane axes and the plane normal, smallest spread last.
+        basis = np.linalg.svd(centred, full_matrices=False)[2]
+    else:
+        basis = np.eye(3)[list(set_mode(plane))]
+    flat = centred @ basis[:2].T
+    scale = np.abs(flat).max()
+    if scale == 0.0:
+        return Vector(mean), float("inf"), 0.0
+    flat = flat / scale
+    design = np.column_stack((flat, np.ones(len(flat))))
+    solution, _residual, rank, _sv = np.linalg.lstsq(
+        design, (flat * flat).sum(axis=1), rcond=None
+    )
+    if rank < 3:
+        return Vector(mean), float("inf"), 0.0
+    centre_2d = solution[:2] / 2
+    radius = np.sqrt(solution[2] + centre_2d @ centre_2d)
+    residual = np.linalg.norm(flat - centre_2d, axis=1) - radius
+    rms = np.sqrt(np.mean(residual * residual)) * scale
+    centre = mean + (centre_2d * scale) @ basis[:2]
+    if plane == "LO":
+        centre = view_coords_array(centre)[0]
+    return Vector(centre), float(radius * scale), float(rms)
+
+
+def line_intersections(lines):
+    """Calculates Intersection Points of Pairs of 2D Lines using Homogeneous Coordinates.
+
+    Note:
+        Each pair is solved with the cross products written out per column, so
+        any number of pairs costs one pass over the arrays. Lines are not
+        convergent when they are parallel, their point is left at (0, 0).
+
+    Args:
+        lines: Float array (m, 4, 2), points 0 & 1 lie on the first line of each pair,
+            points 2 & 3 on the second
+
+    Returns:
+        Float array (m, 2) of Intersection Points and Boolean array (m,) for convergent state.
+    """
+
+    lines = np.asarray(lines, dtype=np.float64).reshape(-1, 4, 2)
+    x_loc = lines[:, :, 0]
+    y_loc = lines[:, :, 1]
+    # Line through (x_i, y_i, 1) and (x_j, y_j, 1) is their cross product.
+    a_1 = y_loc[:, 0] - y_loc[:, 1]
+    b_1 = x_loc[:, 1] - x_loc[:, 0]
+    c_1 = x_loc[:, 0] * y_loc[:, 1] - x_loc[:, 1] * y_loc[:, 0]
+    a_2 = y_loc[:, 2] - y_loc[:, 3]
+    b_2 = x_loc[:, 3] - x_loc[:, 2]
+    c_2 = x_loc[:, 2] * y_loc[:, 3] - x_loc[:, 3] * y_loc[:, 2]
+    # Meeting point of the two lines is the cross product of the lines.
+    points = np.column_stack((b_1 * c_2 - c_1 * b_2, c_1 * a_2 - a_1 * c_2))
+    scale = a_1 * b_2 - b_1 * a_2
+    converged = scale != 0
+    np.divide(points, scale[:, None], out=points, where=converged[:, None])
+    points[~converged] = 0.0
+    return points, converged
+
+
+def plane_line_intersections(coords, plane):
+    """Calculates Intersection Points of Pairs of Lines projected to the Working Plane.
+
+    Note:
+        Batched form of intersection, the depth of each result is taken from its
+        first point. Points of non convergent pairs are left at (0, 0, 0).
+
+    Args:
+        coords: Float array (m, 4, 3), points 0 & 1 lie on the first line of each pair,
+            points 2 & 3 on the second
+        plane: Working Plane
+
+    Returns:
+        Float array (m, 3) of Intersection Points and Boolean array (m,) for convergent state.
+    """
+
+    coords = np.asarray(coords, dtype=np.float64).reshape(-1, 4, 3)
+    if plane == "LO":
+        offsets = coords - coords[:, :1]
+        flat = view_coords_i_array(offsets.reshape(-1, 3)).reshape(-1, 4, 3)
+        points, converged = line_intersections(flat[:, :, :2])
+        view_points = np.column_stack((points, np.zeros(len(points))))
+        result = view_coords_array(view_points) + coords[:, 0]
+    else:
+        a1, a2, a3 = set_mode(plane)
+        points, converged = line_intersections(coords[:, :, [a1, a2]])
+        result = np.empty((len(points), 3))
+        result[:, a1] = points[:, 0]
+        result[:, a2] = points[:, 1]
+        result[:, a3] = coords[:, 0, a3]
+    result[~converged] = 0.0
+    return result, converged
+
+
+def intersection(vertex_a, vertex_b, vertex_c, vertex_d, plane, frame=None):
     """Calculates Intersection Point of 2 Imagined Lines from 4 Vectors.
 
     Note:
        Calculates Converging Intersect Location and indication of
-       whether the lines are convergent using standard Numpy Routines
+       whether the lines are convergent, with the same homogeneous
+       coordinates sums as line_intersections written for a single pair.
+       Use plane_line_intersections for more than one pair.
 
     Args:
         vertex_a: Active vector location of first line
@@ -364,56 +866,45 @@ def intersection(vertex_a, vertex_b, vertex_c, vertex_d, plane):
         vertex_c: Third vector location of 2nd line
         vertex_d: Fourth vector location of 2nd line
         plane: Working Plane 4 Vector Locations representing 2 lines and Working Plane
+        frame: ViewFrame to use for the LO plane, the Command's 3D View if not given
 
     Returns:
         Intersection Vector and Boolean for convergent state.
     """
 
     if plane == "LO":
-        vertex_offset = vertex_b - vertex_a
-        vertex_b = view_coords_i(vertex_offset.x, vertex_offset.y, vertex_offset.z)
-        vertex_offset = vertex_d - vertex_a
-        vertex_d = view_coords_i(vertex_offset.x, vertex_offset.y, vertex_offset.z)
-        vertex_offset = vertex_c - vertex_a
-        vertex_c = view_coords_i(vertex_offset.x, vertex_offset.y, vertex_offset.z)
-        vector_ref = Vector((0, 0, 0))
-        coord_a = (vertex_c.x, vertex_c.y)
-        coord_b = (vertex_d.x, vertex_d.y)
-        coord_c = (vertex_b.x, vertex_b.y)
-        coord_d = (vector_ref.x, vector_ref.y)
+        if frame is None:
+            frame = view_frame()
+        if frame is None:
+            return Vector((0, 0, 0)), False
+        a1, a2 = 0, 1
+        flat = [frame.rotation @ (vertex - vertex_a) for vertex in (vertex_b, vertex_c, vertex_d)]
+        flat.insert(0, Vector((0, 0, 0)))
     else:
         a1, a2, a3 = set_mode(plane)
-        coord_a = (vertex_c[a1], vertex_c[a2])
-        coord_b = (vertex_d[a1], vertex_d[a2])
-        coord_c = (vertex_a[a1], vertex_a[a2])
-        coord_d = (vertex_b[a1], vertex_b[a2])
-    v_stack = np.vstack([coord_a, coord_b, coord_c, coord_d])
-    h_stack = np.hstack((v_stack, np.ones((4, 1))))
-    line_a = np.cross(h_stack[0], h_stack[1])
-    line_b = np.cross(h_stack[2], h_stack[3])
-    x_loc, y_loc, z_loc = np.cross(line_a, line_b)
-    if z_loc == 0:
+        flat = (vertex_a, vertex_b, vertex_c, vertex_d)
+    (x_a, y_a), (x_b, y_b), (x_c, y_c), (x_d, y_d) = ((v[a1], v[a2]) for v in flat)
+    a_1 = y_a - y_b
+    b_1 = x_b - x_a
+    c_1 = x_a * y_b - x_b * y_a
+    a_2 = y_c - y_d
+    b_2 = x_d - x_c
+    c_2 = x_c * y_d - x_d * y_c
+    scale = a_1 * b_2 - b_1 * a_2
+    if scale == 0:
         return Vector((0, 0, 0)), False
-    new_x_loc = x_loc / z_loc
-    new_z_loc = y_loc / z_loc
+    x_loc = (b_1 * c_2 - c_1 * b_2) / scale
+    y_loc = (c_1 * a_2 - a_1 * c_2) / scale
     if plane == "LO":
-        new_y_loc = 0
-    else:
-        new_y_loc = vertex_a[a3]
-    # Order Vector Delta
-    if plane == "XZ":
-        vector_delta = Vector((new_x_loc, new_y_loc, new_z_loc))
-    elif plane == "XY":
-        vector_delta = Vector((new_x_loc, new_z_loc, new_y_loc))
-    elif plane == "YZ":
-        vector_delta = Vector((new_y_loc, new_x_loc, new_z_loc))
-    else:
-        # Must be Local View Plane
-        vector_delta = view_coords(new_x_loc, new_z_loc, new_y_loc) + vertex_a
+        return frame.inverse @ Vector((x_loc, y_loc, 0)) + vertex_a, True
+    vector_delta = Vector((0, 0, 0))
+    vector_delta[a1] = x_loc
+    vector_delta[a2] = y_loc
+    vector_delta[a3] = vertex_a[a3]
     return vector_delta, True
 
 
-def get_percent(obj, flip_percent, per_v, data, scene):
+def get_percent(obj, flip_percent, per_v, data, scene, cmd=None):
     """Calculates a Percentage Distance between 2 Vectors.
 
     Note:
@@ -429,6 +920,7 @@ def get_percent(obj, flip_percent, per_v, data, scene):
         per_v: Percentage Input Value
         data: pg.flip, pg.percent scene variables & Operational Mode
         scene: Context Scene
+        cmd: CommandContext of the running Command, if any
 
     Returns:
         World Vector.
@@ -437,18 +929,21 @@ def get_percent(obj, flip_percent, per_v, data, scene):
     pg = scene.pdt_pg
 
     if obj.mode == "EDIT":
-        bm = bmesh.from_edit_mesh(obj.data)
-        verts = [v for v in bm.verts if v.select]
+        if cmd is not None:
+            verts = cmd.sel_verts
+        else:
+            bm = edit_bmesh(obj.data)
+            verts = [v for v in bm.verts if v.select]
         if len(verts) == 2:
             vector_a = verts[0].co
             vector_b = verts[1].co
             if vector_a is None:
                 pg.error = PDT_ERR_VERT_MODE
-                bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                error_popup(bpy.context)
                 return None
         else:
             pg.error = PDT_ERR_SEL_2_V_1_E + str(len(verts)) + " Vertices"
-            bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(bpy.context)
             return None
         coord_a = np.array([vector_a.x, vector_a.y, vector_a.z])
         coord_b = np.array([vector_b.x, vector_b.y, vector_b.z])
@@ -456,22 +951,10 @@ def get_percent(obj, flip_percent, per_v, data, scene):
         objs = bpy.context.view_layer.objects.selected
         if len(objs) != 2:
             pg.error = PDT_ERR_SEL_2_OBJS + str(len(objs)) + ")"
-            bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(bpy.context)
             return None
-        coord_a = np.array(
-            [
-                objs[-1].matrix_world.decompose()[0].x,
-                objs[-1].matrix_world.decompose()[0].y,
-                objs[-1].matrix_world.decompose()[0].z,
-            ]
-        )
-        coord_b = np.array(
-            [
-                objs[-2].matrix_world.decompose()[0].x,
-                objs[-2].matrix_world.decompose()[0].y,
-                objs[-2].matrix_world.decompose()[0].z,
-            ]
-        )
+        coord_a = np.array(objs[-1].matrix_world.translation)
+        coord_b = np.array(objs[-2].matrix_world.translation)
     coord_c = coord_b - coord_a
     coord_d = np.array([0, 0, 0])
     _per_v = per_v
@@ -481,13 +964,14 @@ def get_percent(obj, flip_percent, per_v, data, scene):
     return Vector((coord_out[0], coord_out[1], coord_out[2]))
 
 
-def obj_check(obj, scene, operation):
+def obj_check(obj, scene, operation, cmd=None):
     """Check Object & Selection Validity.
 
     Args:
         obj: Active Object
         scene: Active Scene
         operation: The Operation e.g. Create New Vertex
+        cmd: CommandContext of the running Command, if any
 
     Returns:
         Object Bmesh
@@ -499,14 +983,14 @@ def obj_check(obj, scene, operation):
 
     if obj is None:
         pg.error = PDT_ERR_NO_ACT_OBJ
-        bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(bpy.context)
         return None, False
     if obj.mode == "EDIT":
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = cmd.bm if cmd is not None else edit_bmesh(obj.data)
         if _operation == "S":
             if len(bm.edges) < 1:
                 pg.error = f"{PDT_ERR_SEL_1_EDGEM} {len(bm.edges)})"
-                bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                error_popup(bpy.context)
                 return None, False
             return bm, True
         if len(bm.select_history) >= 1:
@@ -514,12 +998,15 @@ def obj_check(obj, scene, operation):
             if _operation not in {"D", "E", "F", "G", "N", "S"}:
                 vector_a = check_selection(1, bm, obj)
             else:
-                verts = [v for v in bm.verts if v.select]
+                if cmd is not None:
+                    verts = cmd.sel_verts
+                else:
+                    verts = [v for v in bm.verts if v.select]
                 if len(verts) > 0:
                     vector_a = verts[0]
             if vector_a is None:
                 pg.error = PDT_ERR_VERT_MODE
-                bpy.context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+                error_popup(bpy.context)
                 return None, False
         return bm, True
     return None, True
@@ -539,8 +1026,8 @@ def dis_ang(values, flip_angle, plane, scene):
     """
 
     pg = scene.pdt_pg
-    dis_v = float(values[0])
-    ang_v = float(values[1])
+    dis_v = values[0]
+    ang_v = values[1]
     if flip_angle:
         if ang_v > 0:
             ang_v = ang_v - 180
@@ -561,44 +1048,131 @@ def dis_ang(values, flip_angle, plane, scene):
 
 # Shader for displaying the Pivot Point as Graphics.
 #
-SHADER = gpu.shader.from_builtin("3D_UNIFORM_COLOR") if not bpy.app.background else None
+SHADER = gpu.shader.from_builtin("3D_SMOOTH_COLOR") if not bpy.app.background else None
 
 
-def draw_3d(coords, gtype, rgba, context):
-    """Draw Pivot Point Graphics.
+def pivot_geometry(width, alpha):
+    """Create Unit Size Coordinates and Colours for the Pivot Point Graphic.
 
     Note:
-        Draws either Lines Points, or Tris using defined shader
+        Creates coordinates for Pivot Point Graphic consisting of 6 Tris, 3 Lines
+        and one Point colour coded Red; X axis, Green; Y axis, Blue; Z axis
+        and a yellow point. Arrows are 1 unit long and centred on the origin,
+        the Graphic is moved and scaled when drawn.
 
     Args:
-        coords: Input Coordinates List
-        gtype: Graphic Type
-        rgba: Colour in RGBA format
-        context: Blender bpy.context instance.
+        width: Pivot Point Width
+        alpha: Pivot Point Alpha
 
     Returns:
-        Nothing.
+        Dictionary of Graphic Type to (coordinates, colours) Lists.
+    """
+
+    dim_b = 0.65
+    dim_c = 0.05 + (width * 0.02)
+    dim_o = dim_c / 3
+    # Arrow outline as (along axis, across axis) pairs.
+    profile = (
+        (0.0, 0.0), (dim_b, -dim_o), (dim_b, dim_o),
+        (1.0, 0.0), (dim_b, dim_c), (dim_b, -dim_c),
+    )
+    # Axis, Axis the Arrow is drawn across and Colour.
+    axes = (
+        (0, 1, (1.0, 0.0, 0.0, alpha)),
+        (1, 0, (0.0, 1.0, 0.0, alpha)),
+        (2, 0, (0.2, 0.5, 1.0, alpha)),
+    )
+    geometry = {
+        "TRIS": ([], []),
+        "LINES": ([], []),
+        "POINTS": ([(0.0, 0.0, 0.0)], [(1.0, 1.0, 0.0, alpha)]),
+    }
+    for axis, side, colour in axes:
+        for along, across in profile:
+            point = [0.0, 0.0, 0.0]
+            point[axis] = along
+            point[side] = across
+            geometry["TRIS"][0].append(tuple(point))
+        line_end = [0.0, 0.0, 0.0]
+        line_end[axis] = 1.0
+        geometry["TRIS"][1].extend([colour] * len(profile))
+        geometry["LINES"][0].extend([(0.0, 0.0, 0.0), tuple(line_end)])
+        geometry["LINES"][1].extend([colour] * 2)
+    return geometry
+
+
+class PivotGraphic:
+    """Persistent GPU Batches for the Pivot Point Graphic.
+
+    Note:
+        Batches are built once at unit size with per vertex colours and only
+        rebuilt when the Pivot Point Width or Alpha change. Each redraw then
+        only sets the model matrix for the location and size.
     """
 
-    batch = batch_for_shader(SHADER, gtype, {"pos": coords})
+    def __init__(self):
+        """Start with no Batches.
+
+        Returns:
+            Nothing.
+        """
+
+        self.key = None
+        self.batches = ()
+
+    def update(self, width, alpha):
+        """Rebuild the Batches if the Graphic's appearance has changed.
+
+        Args:
+            width: Pivot Point Width
+            alpha: Pivot Point Alpha
+
+        Returns:
+            Self.
+        """
+
+        key = (width, alpha)
+        if key != self.key:
+            self.key = key
+            self.batches = tuple(
+                batch_for_shader(SHADER, gtype, {"pos": coords, "color": colours})
+                for gtype, (coords, colours) in pivot_geometry(width, alpha).items()
+            )
+        return self
+
+    def draw(self, location, size):
+        """Draw the Batches at a Location and Size.
+
+        Args:
+            location: Pivot Point Location
+            size: Length of the Arrows
 
-    try:
-        if coords is not None:
-            bgl.glEnable(bgl.GL_BLEND)
-            SHADER.bind()
-            SHADER.uniform_float("color", rgba)
-            batch.draw(SHADER)
-    except:
-        raise PDT_ShaderError
+        Returns:
+            Nothing.
+        """
+
+        try:
+            gpu.state.blend_set("ALPHA")
+            with gpu.matrix.push_pop():
+                gpu.matrix.translate(location)
+                gpu.matrix.scale_uniform(size)
+                SHADER.bind()
+                for batch in self.batches:
+                    batch.draw(SHADER)
+            gpu.state.blend_set("NONE")
+        except:
+            raise PDT_ShaderError
+
+
+_pivot_graphic = PivotGraphic()
 
 
 def draw_callback_3d(self, context):
-    """Create Coordinate List for Pivot Point Graphic.
+    """Draw the Pivot Point Graphic in the 3D View being redrawn.
 
     Note:
-        Creates coordinates for Pivot Point Graphic consisting of 6 Tris
-        and one Point colour coded Red; X axis, Green; Y axis, Blue; Z axis
-        and a yellow point based upon screen scale
+        Sizes the Graphic from the drawn region's own window matrix, so it is
+        correct in every 3D View.
 
     Args:
         context: Blender bpy.context instance.
@@ -607,75 +1181,18 @@ def draw_callback_3d(self, context):
         Nothing.
     """
 
-    scene = context.scene
-    pg = scene.pdt_pg
-    region_width = context.region.width
-    x_loc = pg.pivot_loc.x
-    y_loc = pg.pivot_loc.y
-    z_loc = pg.pivot_loc.z
-    # Scale it from view
-    areas = [a for a in context.screen.areas if a.type == "VIEW_3D"]
-    if len(areas) > 0:
-        scale_factor = abs(areas[0].spaces.active.region_3d.window_matrix.decompose()[2][1])
+    pg = context.scene.pdt_pg
+    region_3d = context.region_data
+    if region_3d is None:
+        return
+    scale_factor = abs(region_3d.window_matrix.decompose()[2][1])
     # Check for orhtographic view and resize
-    #if areas[0].spaces.active.region_3d.is_orthographic_side_view:
+    #if region_3d.is_orthographic_side_view:
     #    dim_a = region_width / sf / 60000 * pg.pivot_size
     #else:
     #    dim_a = region_width / sf / 5000 * pg.pivot_size
-    dim_a = region_width / scale_factor / 50000 * pg.pivot_size
-    dim_b = dim_a * 0.65
-    dim_c = dim_a * 0.05 + (pg.pivot_width * dim_a * 0.02)
-    dim_o = dim_c / 3
-
-    # fmt: off
-    # X Axis
-    coords = [
-        (x_loc, y_loc, z_loc),
-        (x_loc+dim_b, y_loc-dim_o, z_loc),
-        (x_loc+dim_b, y_loc+dim_o, z_loc),
-        (x_loc+dim_a, y_loc, z_loc),
-        (x_loc+dim_b, y_loc+dim_c, z_loc),
-        (x_loc+dim_b, y_loc-dim_c, z_loc),
-    ]
-    # fmt: on
-    colour = (1.0, 0.0, 0.0, pg.pivot_alpha)
-    draw_3d(coords, "TRIS", colour, context)
-    coords = [(x_loc, y_loc, z_loc), (x_loc+dim_a, y_loc, z_loc)]
-    draw_3d(coords, "LINES", colour, context)
-    # fmt: off
-    # Y Axis
-    coords = [
-        (x_loc, y_loc, z_loc),
-        (x_loc-dim_o, y_loc+dim_b, z_loc),
-        (x_loc+dim_o, y_loc+dim_b, z_loc),
-        (x_loc, y_loc+dim_a, z_loc),
-        (x_loc+dim_c, y_loc+dim_b, z_loc),
-        (x_loc-dim_c, y_loc+dim_b, z_loc),
-    ]
-    # fmt: on
-    colour = (0.0, 1.0, 0.0, pg.pivot_alpha)
-    draw_3d(coords, "TRIS", colour, context)
-    coords = [(x_loc, y_loc, z_loc), (x_loc, y_loc + dim_a, z_loc)]
-    draw_3d(coords, "LINES", colour, context)
-    # fmt: off
-    # Z Axis
-    coords = [
-        (x_loc, y_loc, z_loc),
-        (x_loc-dim_o, y_loc, z_loc+dim_b),
-        (x_loc+dim_o, y_loc, z_loc+dim_b),
-        (x_loc, y_loc, z_loc+dim_a),
-        (x_loc+dim_c, y_loc, z_loc+dim_b),
-        (x_loc-dim_c, y_loc, z_loc+dim_b),
-    ]
-    # fmt: on
-    colour = (0.2, 0.5, 1.0, pg.pivot_alpha)
-    draw_3d(coords, "TRIS", colour, context)
-    coords = [(x_loc, y_loc, z_loc), (x_loc, y_loc, z_loc + dim_a)]
-    draw_3d(coords, "LINES", colour, context)
-    # Centre
-    coords = [(x_loc, y_loc, z_loc)]
-    colour = (1.0, 1.0, 0.0, pg.pivot_alpha)
-    draw_3d(coords, "POINTS", colour, context)
+    dim_a = context.region.width / scale_factor / 50000 * pg.pivot_size
+    _pivot_graphic.update(pg.pivot_width, pg.pivot_alpha).draw(pg.pivot_loc, dim_a)
 
 
 def scale_set(self, context):
@@ -34,7 +34,7 @@ class PDT_OT_LibShow(Operator):
         file_path = pg.pdt_library_path
         pg.error = str(Path(file_path))
         debug("PDT Parts Library:")
-        debug(f"{pg.error}")
+        debug(pg.error)
         bpy.context.window_manager.popup_menu(
             oops, title="Information - Parts Library File", icon="INFO"
         )
@@ -0,0 +1,355 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Maths Expressions for the PDT "M" Command and Drawing Macros.
+#
+# Expressions are parsed once and checked node by node against a small
+# grammar: numbers, names, arithmetic and calls of the functions in the
+# math module. The checked code objects are cached per expression.
+# Integer literals stay integers, so factorial, gcd, comb etc. work. Powers
+# and the integer functions whose results grow with their arguments are
+# evaluated by checked versions, which refuse integer results too large to
+# become a float, so an expression such as 9**9**9 or factorial(10**7) fails
+# at once rather than building a huge integer.
+#
+# Expressions can use the PDT variables in VARIABLES. evaluate_range()
+# evaluates an expression for every value of RANGE_NAME in a NumPy range,
+# using the NumPy versions of the functions, e.g. to build a coordinate table.
+
+import ast
+import math
+import numpy as np
+from functools import lru_cache
+from . import pdt_exception
+PDT_MathsError = pdt_exception.MathsError
+
+# Number of compiled expressions kept for re-use.
+#
+EXPRESSION_CACHE_SIZE = 512
+# PDT variables available to expressions: distance, angle, percent, the
+# cartesian coordinates and the last maths result.
+#
+VARIABLES = ("d", "a", "p", "x", "y", "z", "ans")
+# Name bound to the range values by evaluate_range.
+#
+RANGE_NAME = "t"
+# Largest integer result of a power or integer function, in bits, larger ones
+# would not fit in a float.
+#
+MAX_INTEGER_BITS = 1024
+# Below this argument size lgamma is precise enough to size factorials exactly,
+# above it comb and perm are sized by an upper bound.
+#
+LGAMMA_LIMIT = 2**40
+# Name checked_power is bound to in compiled expressions, it can not be typed in
+# an expression as it is not in the allowed names.
+#
+POWER_NAME = "_pdt_power"
+
+MATHS_NAMES = {name: value for name, value in vars(math).items() if not name.startswith("_")}
+# NumPy versions of the math functions & constants, used over ranges.
+#
+NUMPY_NAMES = {
+    "acos": np.arccos,
+    "acosh": np.arccosh,
+    "asin": np.arcsin,
+    "asinh": np.arcsinh,
+    "atan": np.arctan,
+    "atan2": np.arctan2,
+    "atanh": np.arctanh,
+    "ceil": np.ceil,
+    "copysign": np.copysign,
+    "cos": np.cos,
+    "cosh": np.cosh,
+    "degrees": np.degrees,
+    "e": np.e,
+    "exp": np.exp,
+    "expm1": np.expm1,
+    "fabs": np.fabs,
+    "floor": np.floor,
+    "fmod": np.fmod,
+    "hypot": np.hypot,
+    "inf": np.inf,
+    "isclose": np.isclose,
+    "log": np.log,
+    "log10": np.log10,
+    "log1p": np.log1p,
+    "log2": np.log2,
+    "nan": np.nan,
+    "pi": np.pi,
+    "pow": np.float_power,
+    "radians": np.radians,
+    "sin": np.sin,
+    "sinh": np.sinh,
+    "sqrt": np.sqrt,
+    "tan": np.tan,
+    "tanh": np.tanh,
+    "tau": 2 * np.pi,
+    "trunc": np.trunc,
+}
+
+_ALLOWED_NAMES = set(MATHS_NAMES) | set(VARIABLES) | {RANGE_NAME}
+_ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.Call,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.UAdd,
+    ast.USub,
+)
+
+
+def checked_power(base, exponent):
+    """Raise base to exponent, refusing integer results too large for a float.
+
+    Args:
+        base: Number
+        exponent: Number
+
+    Returns:
+        Number.
+    """
+
+    if (
+        isinstance(base, int)
+        and isinstance(exponent, int)
+        and exponent > 0
+        and abs(base) > 1
+        and exponent * math.log2(abs(base)) > MAX_INTEGER_BITS
+    ):
+        raise OverflowError("integer power too large")
+    return base ** exponent
+
+
+def _check_bits(bits):
+    """Refuse an integer result of the given size in bits if it is too large for a float."""
+
+    if bits > MAX_INTEGER_BITS:
+        raise OverflowError("integer result too large")
+
+
+def _factorial_bits(number):
+    """Return the size of number! in bits."""
+
+    return math.lgamma(number + 1) / math.log(2)
+
+
+def checked_factorial(number):
+    """math.factorial, refusing results too large for a float.
+
+    Args:
+        number: Integer
+
+    Returns:
+        Integer.
+    """
+
+    if number > 1:
+        _check_bits(_factorial_bits(number))
+    return math.factorial(number)
+
+
+def checked_comb(number, count):
+    """math.comb, refusing results too large for a float.
+
+    Args:
+        number: Integer number of items
+        count: Integer number of items chosen
+
+    Returns:
+        Integer.
+    """
+
+    if isinstance(number, int) and isinstance(count, int) and 0 < count < number:
+        fewer = min(count, number - count)
+        if number < LGAMMA_LIMIT:
+            bits = (
+                _factorial_bits(number)
+                - _factorial_bits(fewer)
+                - _factorial_bits(number - fewer)
+            )
+        else:
+            bits = fewer * math.log2(number) - _factorial_bits(fewer)
+        _check_bits(bits)
+    return math.comb(number, count)
+
+
+def checked_perm(number, count=None):
+    """math.perm, refusing results too large for a float.
+
+    Args:
+        number: Integer number of items
+        count: Integer number of items chosen, all of them if not given
+
+    Returns:
+        Integer.
+    """
+
+    chosen = number if count is None else count
+    if isinstance(number, int) and isinstance(chosen, int) and 0 < chosen <= number:
+        if number < LGAMMA_LIMIT:
+            bits = _factorial_bits(number) - _factorial_bits(number - chosen)
+        else:
+            bits = chosen * math.log2(number)
+        _check_bits(bits)
+    return math.perm(number, count)
+
+
+def checked_isqrt(number):
+    """math.isqrt, refusing results too large for a float.
+
+    Args:
+        number: Integer
+
+    Returns:
+        Integer.
+    """
+
+    if isinstance(number, int):
+        _check_bits(number.bit_length() / 2)
+    return math.isqrt(number)
+
+
+def checked_lcm(*integers):
+    """math.lcm, refusing results too large for a float.
+
+    Note:
+        The multiple is built one argument at a time and checked after each.
+
+    Args:
+        integers: Integers
+
+    Returns:
+        Integer.
+    """
+
+    result = 1
+    for integer in integers:
+        result = math.lcm(result, integer)
+        _check_bits(result.bit_length())
+    return result
+
+
+# Globals of evaluated expressions, the variables are passed separately as locals.
+#
+_MATHS_GLOBALS = {
+    "__builtins__": {},
+    **MATHS_NAMES,
+    "comb": checked_comb,
+    "factorial": checked_factorial,
+    "isqrt": checked_isqrt,
+    "lcm": checked_lcm,
+    "perm": checked_perm,
+    POWER_NAME: checked_power,
+}
+_RANGE_GLOBALS = {"__builtins__": {}, **NUMPY_NAMES, POWER_NAME: checked_power}
+
+
+class _CheckedPowers(ast.NodeTransformer):
+    """Compile a ** b as a call of checked_power."""
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if not isinstance(node.op, ast.Pow):
+            return node
+        call = ast.Call(
+            func=ast.Name(id=POWER_NAME, ctx=ast.Load()),
+            args=[node.left, node.right],
+            keywords=[],
+        )
+        return ast.copy_location(call, node)
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression):
+    """Check a Maths Expression and compile it.
+
+    Note:
+        Only numbers, the names in MATHS_NAMES, VARIABLES and RANGE_NAME, arithmetic
+        operators and plain calls of named functions are accepted.
+
+    Args:
+        expression: Maths Expression e.g. sqrt(d**2 + 4)
+
+    Returns:
+        Code object.
+    """
+
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError:
+        raise PDT_MathsError
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise PDT_MathsError
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float)):
+            raise PDT_MathsError
+        if isinstance(node, ast.Name) and node.id not in _ALLOWED_NAMES:
+            raise PDT_MathsError
+        if isinstance(node, ast.Call) and (
+            not isinstance(node.func, ast.Name) or node.keywords
+        ):
+            raise PDT_MathsError
+    tree = ast.fix_missing_locations(_CheckedPowers().visit(tree))
+    return compile(tree, "<pdt maths>", "eval")
+
+
+def evaluate(expression, variables=None):
+    """Evaluate a Maths Expression.
+
+    Args:
+        expression: Maths Expression e.g. degrees(atan(3/4))
+        variables: Dictionary of values for VARIABLES
+
+    Returns:
+        Float.
+    """
+
+    code = compile_expression(expression)
+    try:
+        return float(eval(code, _MATHS_GLOBALS, variables or {}))
+    except (ArithmeticError, ValueError, TypeError, NameError):
+        raise PDT_MathsError
+
+
+def evaluate_range(expression, start, stop, step=1.0, variables=None):
+    """Evaluate a Maths Expression for every value of RANGE_NAME in a NumPy range.
+
+    Note:
+        Functions without a NumPy version in NUMPY_NAMES can not be used.
+        Invalid results, such as sqrt(-1), are nan.
+
+    Args:
+        expression: Maths Expression e.g. sin(radians(t)) * d
+        start: First value of the range
+        stop: End of the range, not included
+        step: Step between values
+        variables: Dictionary of values for VARIABLES
+
+    Returns:
+        Float array of the results, one for each range value.
+    """
+
+    code = compile_expression(expression)
+    values = np.arange(start, stop, step, dtype=np.float64)
+    namespace = dict(variables or {})
+    namespace[RANGE_NAME] = values
+    try:
+        with np.errstate(all="ignore"):
+            result = eval(code, _RANGE_GLOBALS, namespace)
+        return np.broadcast_to(np.asarray(result, dtype=np.float64), values.shape).copy()
+    except (ArithmeticError, ValueError, TypeError, NameError):
+        raise PDT_MathsError
@@ -6,6 +6,7 @@
 #
 import bpy
 from bpy.types import Panel
+from . import pdt_timing
 from .pdt_msg_strings import (
     PDT_LAB_ABS,
     PDT_LAB_AD2D,
@@ -193,6 +194,8 @@ class PDT_PT_PanelTools(Panel):
         row = layout.row()
         row.operator("pdt.edge_to_face", text=PDT_LAB_EDGETOEFACE)
         row.operator("pdt.intersectall", text=PDT_LAB_INTERSETALL)
+        row = layout.row()
+        row.prop(pdt_pg, "intersect_mode", expand=True)
         #
         # Taper tool
         box = layout.box()
@@ -402,6 +405,10 @@ class PDT_PT_PanelCommandLine(Panel):
         row.operator("pdt.command_rerun", text="", icon="LOOP_BACK")
         row = layout.row()
         row.prop(pdt_pg, "maths_output", text="Maths Output")
+        row = layout.row()
+        row.prop(pdt_pg, "command_script", text="Script")
+        row.operator("pdt.command_script", text="", icon="PLAY")
+        row.operator("pdt.command_script_file", text="", icon="FILE_FOLDER")
 
 class PDT_PT_PanelTangent(Panel):
     bl_idname = "PDT_PT_PanelTangent"
@@ -499,3 +506,41 @@ class PDT_PT_PanelTrig(Panel):
         row = layout.row()
         row.operator("pdt.wave_generator", icon="SEQ_LUMA_WAVEFORM")
         row.prop(pdt_pg, "trig_abs")
+
+class PDT_PT_PanelTiming(Panel):
+    bl_idname = "PDT_PT_PanelTiming"
+    bl_label = "PDT Command Timing"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_category = "PDT"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        return context.preferences.addons[__package__].preferences.pdt_timing
+
+    def draw(self, context):
+        layout = self.layout
+        remaining, path = pdt_timing.profile_status()
+        row = layout.row()
+        row.operator("pdt.timing_reset", icon="X")
+        row.operator("pdt.timing_profile", icon="REC")
+        if remaining:
+            layout.label(text=f"Profiling: {remaining} command(s) to go")
+        elif path:
+            layout.label(text=f"Profile: {path}")
+
+        rows = pdt_timing.statistics()
+        if not rows:
+            layout.label(text="No commands timed yet")
+            return
+        box = layout.box()
+        grid = box.grid_flow(row_major=True, columns=5, even_columns=True, align=True)
+        for heading in ("Command", "Runs", "Min ms", "Mean ms", "P95 ms"):
+            grid.label(text=heading)
+        for key, stage, count, least, mean, p95 in rows:
+            grid.label(text=f"{key} {stage}")
+            grid.label(text=str(count))
+            grid.label(text=f"{least * 1000:.2f}")
+            grid.label(text=f"{mean * 1000:.2f}")
+            grid.label(text=f"{p95 * 1000:.2f}")
@@ -89,6 +89,7 @@ PDT_ERR_SEL_2_VERTS = "Select Exactly 2 Vertices (Currently selected:"
 PDT_ERR_SEL_2_EDGES = "Select Only 2 Non-Intersecting Edges (Currently selected:"
 PDT_ERR_SEL_3_VERTS = "Select Exactly 3 Vertices (Currently selected:"
 PDT_ERR_SEL_3_VERTIO = "Select Exactly 3 Vertices Individually (Currently selected:"
+PDT_ERR_SEL_3_VERTM = "Select at least 3 Vertices (Currently selected:"
 PDT_ERR_SEL_2_V_1_E = "Select 2 Vertices Individually, or 1 Edge (Currently selected:"
 PDT_ERR_SEL_4_VERTS = "Select 4 Vertices Individually, or 2 Edges (Currently selected:"
 PDT_ERR_SEL_1_E_1_F = "Select 1 Face and 1 Detached Edge"
@@ -130,6 +131,7 @@ PDT_ERR_EXTEDIT = "Only Extrude Vertices in Edit Mode"
 PDT_ERR_DUPEDIT = "Only Duplicate Geometry in Edit Mode"
 PDT_ERR_FILEDIT = "Only Fillet Geometry in Edit Mode"
 PDT_ERR_NOCOMMAS = "No commas allowed in Maths Command"
+PDT_ERR_REPEAT = "Bad Repeat - *N needs a whole number of 1 or more, D & E Commands only"
 
 PDT_ERR_2CPNPE = "Select 2 Co-Planar Non-Parallel Edges"
 PDT_ERR_NCEDGES = "Edges must be Co-Planar Non-Parallel Edges, Selected Edges aren't"
@@ -138,6 +140,8 @@ PDT_ERR_NOINT = "No Intersection Found"
 PDT_ERR_BADDISTANCE = "Invalid Distance (Separtion) Error; Chosen Points too Close"
 PDT_ERR_MATHSERROR = "Maths Error - Check Working Plane"
 PDT_ERR_SAMERADII = "Circles have the same radius - Just offset the Edge between centres"
+PDT_ERR_NO_TARGETS = "Select other Mesh Objects to Intersect with"
+PDT_ERR_OFF_PLANE = "Edges off the Working Plane were not Cut (Edges off plane:"
 
 # Info messages
 #
@@ -187,3 +191,5 @@ PDT_DES_RADIUS2 = "Radius of Second Tangent Arc"
 PDT_DES_TPOINT = "Calculate Tangents From Point"
 PDT_DES_EXPCOLL = "Expand/Collapse Menu"
 PDT_DES_TANMODE = "Tangent Types"
+PDT_DES_INTMODE = "Intersect All Mode"
+PDT_DES_SCRIPT = "Text of PDT Command Lines run by Run Command Script"
@@ -6,22 +6,26 @@
 #
 import bpy
 import bmesh
-from math import sqrt, floor, asin, sin, cos, pi
+from math import sqrt, asin, sin, cos, pi
 from mathutils import Vector
 from bpy.types import Operator
 
 from .pdt_functions import (
     oops,
-    arc_centre,
+    deselect_all,
+    edit_bmesh,
+    error_popup,
+    fit_circle,
     set_mode,
-    view_coords,
-    view_coords_i,
+    update_sel,
+    view_coords_array,
+    view_coords_i_array,
 )
 
 from .pdt_msg_strings import (
     PDT_OBJ_MODE_ERROR,
     PDT_ERR_NO_ACT_OBJ,
-    PDT_ERR_SEL_3_VERTS,
+    PDT_ERR_SEL_3_VERTM,
     PDT_ERR_SEL_1_VERT,
     PDT_ERR_BADDISTANCE,
     PDT_ERR_MATHSERROR,
@@ -173,17 +177,11 @@ def make_vectors(coords, a1, a2, a3, pg):
     if pg.plane == "LO":
         # Reset coordinates from view local (Horiz, Vert, depth) to World XYZ.
         #
-        tangent_vector_o1 = view_coords(
-            tangent_vector_o1[a1], tangent_vector_o1[a2], tangent_vector_o1[a3]
+        world_coords = view_coords_array(
+            [tangent_vector_o1, tangent_vector_o2, tangent_vector_o3, tangent_vector_o4]
         )
-        tangent_vector_o2 = view_coords(
-            tangent_vector_o2[a1], tangent_vector_o2[a2], tangent_vector_o2[a3]
-        )
-        tangent_vector_o3 = view_coords(
-            tangent_vector_o3[a1], tangent_vector_o3[a2], tangent_vector_o3[a3]
-        )
-        tangent_vector_o4 = view_coords(
-            tangent_vector_o4[a1], tangent_vector_o4[a2], tangent_vector_o4[a3]
+        tangent_vector_o1, tangent_vector_o2, tangent_vector_o3, tangent_vector_o4 = (
+            Vector(co) for co in world_coords.tolist()
         )
 
     return (tangent_vector_o1, tangent_vector_o2, tangent_vector_o3, tangent_vector_o4)
@@ -212,9 +210,8 @@ def tangent_setup(context, pg, plane, obj_data, centre_0, centre_1, centre_2, ra
     if plane == "LO":
         # Translate world coordinates into view local (horiz, vert, depth)
         #
-        centre_0 = view_coords_i(centre_0[a1], centre_0[a2], centre_0[a3])
-        centre_1 = view_coords_i(centre_1[a1], centre_1[a2], centre_1[a3])
-        centre_2 = view_coords_i(centre_2[a1], centre_2[a2], centre_2[a3])
+        view_centres = view_coords_i_array([centre_0, centre_1, centre_2])
+        centre_0, centre_1, centre_2 = (Vector(co) for co in view_centres.tolist())
     if pg.tangent_mode == "point":
         vector_difference = centre_2 - centre_0
         distance = sqrt(vector_difference[a1] ** 2 + vector_difference[a2] ** 2)
@@ -262,12 +259,9 @@ def tangent_setup(context, pg, plane, obj_data, centre_0, centre_1, centre_2, ra
         if pg.plane == "LO":
             # Translate view local coordinates (horiz, vert, depth) into World XYZ
             #
-            centre_2 = view_coords(centre_2[a1], centre_2[a2], centre_2[a3])
-            tangent_vector_o1 = view_coords(
-                tangent_vector_o1[a1], tangent_vector_o1[a2], tangent_vector_o1[a3]
-            )
-            tangent_vector_o2 = view_coords(
-                tangent_vector_o2[a1], tangent_vector_o2[a2], tangent_vector_o2[a3]
+            world_coords = view_coords_array([centre_2, tangent_vector_o1, tangent_vector_o2])
+            centre_2, tangent_vector_o1, tangent_vector_o2 = (
+                Vector(co) for co in world_coords.tolist()
             )
         tangent_vectors = (centre_2, tangent_vector_o1, tangent_vector_o2)
         draw_tangents(tangent_vectors, obj_data)
@@ -415,8 +409,8 @@ def analyse_arc(context, pg):
     """Analyses an Arc inferred from Selected Vertices.
 
     Note:
-        Will work if more than 3 vertices are selected, taking the
-        first, the nearest to the middle and the last.
+        Will work if 3 or more vertices are selected, fitting a circle
+        to all of them in the working plane.
 
     Args:
         context: Blender bpy.context instance
@@ -429,22 +423,16 @@ def analyse_arc(context, pg):
     obj = context.view_layer.objects.active
     if obj is None:
         pg.error = PDT_ERR_NO_ACT_OBJ
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         raise PDT_ObjectModeError
     if obj.mode == "EDIT":
-        obj_loc = obj.matrix_world.decompose()[0]
-        bm = bmesh.from_edit_mesh(obj.data)
+        bm = edit_bmesh(obj.data)
         verts = [v for v in bm.verts if v.select]
         if len(verts) < 3:
-            pg.error = f"{PDT_ERR_SEL_3_VERTS} {len(verts)})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            pg.error = f"{PDT_ERR_SEL_3_VERTM} {len(verts)})"
+            error_popup(context)
             raise PDT_SelectionError
-        vector_a = verts[0].co
-        # Get the nearest to middle vertex of the arc
-        #
-        vector_b = verts[int(floor(len(verts) / 2))].co
-        vector_c = verts[-1].co
-        vector_delta, radius = arc_centre(vector_a, vector_b, vector_c)
+        vector_delta, radius, _rms = fit_circle([v.co for v in verts], pg.plane)
 
         return vector_delta, radius
 
@@ -578,36 +566,22 @@ class PDT_OT_TangentOperateSel(Operator):
             return {"FINISHED"}
         v1 = verts[0]
         vn = verts[-1]
-        for v in bm.verts:
-            v.select_set(False)
-        for e in bm.edges:
-            e.select_set(False)
-        v1.select_set(True)
+        update_sel(bm, [v1], [], [])
         bpy.ops.mesh.select_linked()
         verts1 = [v for v in bm.verts if v.select].copy()
         if len(verts1) < 3:
             pg.error = f"{PDT_ERR_VERT_MODE} or Less than 3 vertices in your Arc(s)"
             context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
             return {"FINISHED"}
-        for v in bm.verts:
-            v.select_set(False)
-        for e in bm.edges:
-            e.select_set(False)
-        vn.select_set(True)
+        update_sel(bm, [vn], [], [])
         bpy.ops.mesh.select_linked()
         vertsn = [v for v in bm.verts if v.select].copy()
-        for v in bm.verts:
-            v.select_set(False)
-        for e in bm.edges:
-            e.select_set(False)
+        deselect_all(bm)
         bmesh.update_edit_mesh(obj.data)
-        bm.select_history.clear()
-        # Select the nearest to middle vertex in the arc
+        # Fit each arc to all of its connected vertices
         #
-        verts1 = [verts1[0].co, verts1[int(floor(len(verts1) / 2))].co, verts1[-1].co]
-        vertsn = [vertsn[0].co, vertsn[int(floor(len(vertsn) / 2))].co, vertsn[-1].co]
-        centre_0, radius_0 = arc_centre(verts1[0], verts1[1], verts1[2])
-        centre_1, radius_1 = arc_centre(vertsn[0], vertsn[1], vertsn[2])
+        centre_0, radius_0, _rms = fit_circle([v.co for v in verts1], plane)
+        centre_1, radius_1, _rms = fit_circle([v.co for v in vertsn], plane)
         centre_2 = pg.tangent_point2
 
         tangent_setup(
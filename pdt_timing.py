@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Opt-in Timing of PDT Commands.
+#
+# command_run wraps each command in command(key). Inside it, stage(name)
+# blocks record wall time per stage. A stage's time excludes any stages nested
+# inside it, so "geometry" does not count the "vector" and "update" stages
+# run by the geometry functions. The last TIMING_WINDOW runs of every
+# command and stage are kept for the statistics panel. The next N commands can
+# also be captured with cProfile and written to disk.
+#
+# When no command is being timed, stage() hands back a shared null context,
+# which costs one test per call.
+
+import bpy
+import cProfile
+import os
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from bpy.types import Operator
+
+# Number of runs kept per command and stage.
+#
+TIMING_WINDOW = 100
+# Stages in display order, "total" is the whole command.
+#
+STAGES = ("parse", "vector", "geometry", "update", "total")
+
+_stats = {}
+_current = None
+_stack = []
+_null = nullcontext()
+_profile = {"remaining": 0, "profiler": None, "path": ""}
+
+
+def enabled():
+    """Return whether Command Timing is switched on in PDT's preferences.
+
+    Returns:
+        Boolean.
+    """
+
+    return bpy.context.preferences.addons[__package__].preferences.pdt_timing
+
+
+class Stage:
+    """Context Manager timing one Stage of the running Command."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        """Name the Stage.
+
+        Args:
+            name: Stage name, one of STAGES
+
+        Returns:
+            Nothing.
+        """
+
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        _stack.append(0.0)
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        nested = _stack.pop()
+        _current[self.name] = _current.get(self.name, 0.0) + elapsed - nested
+        if _stack:
+            _stack[-1] += elapsed
+        return False
+
+
+def stage(name):
+    """Time a Stage of the running Command.
+
+    Args:
+        name: Stage name, one of STAGES
+
+    Returns:
+        Context Manager, a shared null one if no Command is being timed.
+    """
+
+    if _current is None:
+        return _null
+    return Stage(name)
+
+
+def timed(name):
+    """Decorator timing every call of a function as a Stage.
+
+    Args:
+        name: Stage name, one of STAGES
+
+    Returns:
+        Decorator.
+    """
+
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if _current is None:
+                return function(*args, **kwargs)
+            with Stage(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def command(key):
+    """Time one Command, and profile it if a capture is pending.
+
+    Note:
+        Commands run from inside another timed Command are counted in the outer one.
+        Commands that raise are profiled, but not added to the statistics.
+
+    Args:
+        key: Statistics key, e.g. "Gd" for Grab Delta
+
+    Returns:
+        Context Manager.
+    """
+
+    global _current
+    if _current is not None or not (_profile["remaining"] or enabled()):
+        yield
+        return
+    profiler = _profile["profiler"] if _profile["remaining"] else None
+    _current = {}
+    start = time.perf_counter()
+    completed = False
+    try:
+        if profiler is not None:
+            profiler.enable()
+        yield
+        completed = True
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            finish_profile()
+        if completed:
+            _current["total"] = time.perf_counter() - start
+            runs = _stats.setdefault(key, {})
+            for name, seconds in _current.items():
+                runs.setdefault(name, deque(maxlen=TIMING_WINDOW)).append(seconds)
+        _current = None
+        _stack.clear()
+
+
+def statistics():
+    """Return Rolling Statistics for every timed Command and Stage.
+
+    Returns:
+        List of (key, stage, count, min, mean, p95) tuples, times in seconds,
+        sorted by key and in STAGES order.
+    """
+
+    rows = []
+    for key in sorted(_stats):
+        runs = _stats[key]
+        for name in STAGES:
+            if name not in runs:
+                continue
+            values = sorted(runs[name])
+            count = len(values)
+            p95 = values[min(count - 1, int(round(0.95 * (count - 1))))]
+            rows.append((key, name, count, values[0], sum(values) / count, p95))
+    return rows
+
+
+def reset():
+    """Forget all Statistics.
+
+    Returns:
+        Nothing.
+    """
+
+    _stats.clear()
+
+
+def start_profile(count, directory):
+    """Capture the next Commands with cProfile.
+
+    Args:
+        count: Number of Commands to capture
+        directory: Folder the .prof file is written to
+
+    Returns:
+        Path the profile will be written to.
+    """
+
+    stamp = time.strftime("%Y%m%d_%H%M%S")
+    _profile["remaining"] = count
+    _profile["profiler"] = cProfile.Profile()
+    _profile["path"] = os.path.join(directory, f"pdt_profile_{stamp}.prof")
+    return _profile["path"]
+
+
+def finish_profile():
+    """Count down a pending capture, writing it to disk after its last Command.
+
+    Returns:
+        Nothing.
+    """
+
+    _profile["remaining"] -= 1
+    if _profile["remaining"] <= 0:
+        _profile["remaining"] = 0
+        _profile["profiler"].dump_stats(_profile["path"])
+        _profile["profiler"] = None
+
+
+def profile_status():
+    """Return the pending capture count and the path of the last capture.
+
+    Returns:
+        Commands still to capture and the profile's file path, "" if none.
+    """
+
+    return _profile["remaining"], _profile["path"]
+
+
+class PDT_OT_TimingReset(Operator):
+    """Clear PDT Command Timings"""
+
+    bl_idname = "pdt.timing_reset"
+    bl_label = "Reset Timings"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        """Clear PDT Command Timings.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        reset()
+        return {"FINISHED"}
+
+
+class PDT_OT_TimingProfile(Operator):
+    """Profile the next PDT Commands with cProfile"""
+
+    bl_idname = "pdt.timing_profile"
+    bl_label = "Profile Next Commands"
+    bl_options = {"REGISTER"}
+
+    def execute(self, context):
+        """Profile the next PDT Commands with cProfile.
+
+        Note:
+            The number of Commands comes from PDT's preferences, the profile is
+            written to Blender's temporary folder.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        count = context.preferences.addons[__package__].preferences.pdt_profile_commands
+        path = start_profile(count, bpy.app.tempdir)
+        self.report({"INFO"}, f"Profiling next {count} command(s) to {path}")
+        return {"FINISHED"}
@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Debug Tracing for PDT, cheap enough to leave in hot paths.
+#
+# Messages are formatted lazily, %-style as in the logging module, so
+#   trace("obj: %s, bm: %s", obj, bm)
+# costs a few flag tests when tracing is off. When it is on, each record is
+# printed to the console and kept in a bounded ring buffer that can be written
+# to a file with dump(), or from PDT's preferences with the Save Debug Trace
+# operator.
+
+import bpy
+import sys
+import time
+from collections import deque
+from bpy.props import StringProperty
+from bpy.types import Operator
+from bpy_extras.io_utils import ExportHelper
+
+# Number of records kept in the ring buffer.
+#
+TRACE_SIZE = 4096
+
+_records = deque(maxlen=TRACE_SIZE)
+_pdt_debug = None
+
+
+def enabled():
+    """Return whether PDT's or Blender's debug flags are set.
+
+    Note:
+        Blender's flags are read on every call, so changing them while Blender runs
+        takes effect at once. The PDT debug preference is cached until invalidate()
+        is called, the preference does this whenever it is changed. Nothing is cached
+        until the add-on's preferences can be read.
+
+    Returns:
+        Boolean.
+    """
+
+    global _pdt_debug
+    if bpy.app.debug or bpy.app.debug_python:
+        return True
+    if _pdt_debug is None:
+        try:
+            _pdt_debug = bool(bpy.context.preferences.addons[__package__].preferences.debug)
+        except (AttributeError, KeyError):
+            # Preferences are not available yet, during register or early load.
+            return False
+    return _pdt_debug
+
+
+def invalidate():
+    """Forget the cached PDT debug preference so it is read again on the next trace.
+
+    Returns:
+        Nothing.
+    """
+
+    global _pdt_debug
+    _pdt_debug = None
+
+
+def trace_update(self, context):
+    """Preference update callback for the PDT debug flag.
+
+    Args:
+        context: Blender bpy.context instance.
+
+    Returns:
+        Nothing.
+    """
+
+    invalidate()
+
+
+def trace(msg, *args, prefix="", depth=1):
+    """Record a debug message if tracing is enabled.
+
+    Note:
+        The recorded message will be of the form:
+
+        {prefix}{caller file name:line number}| {msg % args}
+
+        Nothing is formatted, and the caller is not looked up, when tracing is off.
+
+    Args:
+        msg: Message, or %-style format string for args
+        args: Values for the format string
+        prefix: Text to put in front of the message
+        depth: Stack depth of the caller to report, 1 is the caller of trace
+
+    Returns:
+        Nothing.
+    """
+
+    if not enabled():
+        return
+    frame = sys._getframe(depth)
+    filename = frame.f_code.co_filename.replace("\\", "/").split("/")[-1]
+    text = (str(msg) % args) if args else str(msg)
+    line = f"{prefix}{filename}:{frame.f_lineno}| {text}"
+    _records.append((time.time(), line))
+    print(line)
+
+
+def records():
+    """Return the buffered trace records, oldest first.
+
+    Returns:
+        List of (time, line) tuples.
+    """
+
+    return list(_records)
+
+
+def clear():
+    """Empty the ring buffer.
+
+    Returns:
+        Nothing.
+    """
+
+    _records.clear()
+
+
+def dump(filepath):
+    """Write the buffered trace records to a file.
+
+    Args:
+        filepath: Path of the file to write
+
+    Returns:
+        Number of records written.
+    """
+
+    lines = records()
+    with open(filepath, "w", encoding="utf-8") as trace_file:
+        for stamp, line in lines:
+            clock = time.strftime("%H:%M:%S", time.localtime(stamp))
+            trace_file.write(f"{clock}.{int(stamp % 1 * 1000):03d} {line}\n")
+    return len(lines)
+
+
+class PDT_OT_TraceDump(Operator, ExportHelper):
+    """Save the buffered PDT Debug Trace to a Text File"""
+
+    bl_idname = "pdt.trace_dump"
+    bl_label = "Save Debug Trace"
+    bl_options = {"REGISTER"}
+
+    filename_ext = ".txt"
+    filter_glob: StringProperty(default="*.txt", options={"HIDDEN"})
+
+    def execute(self, context):
+        """Save the buffered PDT Debug Trace to a Text File.
+
+        Args:
+            context: Blender bpy.context instance.
+
+        Returns:
+            Status Set.
+        """
+
+        count = dump(self.filepath)
+        self.report({"INFO"}, f"Saved {count} trace record(s) to {self.filepath}")
+        return {"FINISHED"}
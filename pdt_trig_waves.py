@@ -6,11 +6,11 @@
 #
 import bpy
 import bmesh
-from math import sin, cos, tan, pi
-from mathutils import Vector
+import numpy as np
+from math import pi
 from .pdt_functions import (
     set_mode,
-    view_coords,
+    view_coords_array,
 )
 
 class PDT_OT_WaveGenerator(bpy.types.Operator):
@@ -72,60 +72,40 @@ class PDT_OT_WaveGenerator(bpy.types.Operator):
             bpy.ops.object.mode_set(mode='EDIT')
         bm = bmesh.from_edit_mesh(pg.trig_obj.data)
 
-        # Loop for each point in the number of cycles times the resolution value.
+        # One point for each step in the number of cycles times the resolution value.
         # Uses basic trigonomtry to calculate the wave locations.
         # If Absolute has been set, all values are made positive.
         # z_val is assumed to be the offset from the horizontal axis of the wave.
         # These values will be offset by the Offset Vector given in the UI.
         #
-        for i in range((pg.trig_res * pg.trig_cycles) + 1):
-            # Uses a calculation of trig function angle of imaginary object times maximum amplitude
-            # of wave. So with reolution at 9, angular increments are 20 degrees.
-            # Angles must be in Radians for this calcultion.
-            #
-            if pg.trig_type == "sin":
-                if pg.trig_abs:
-                    z_val = abs(sin((i / pg.trig_res) * pi) * pg.trig_amp)
-                else:
-                    z_val = sin((i / pg.trig_res) * pi) * pg.trig_amp
-            elif pg.trig_type == "cos":
-                if pg.trig_abs:
-                    z_val = abs(cos((i / pg.trig_res) * pi) * pg.trig_amp)
-                else:
-                    z_val = cos((i / pg.trig_res) * pi) * pg.trig_amp
-            else:
-                if pg.trig_abs:
-                    z_val = abs(tan((i / pg.trig_res) * pi) * pg.trig_amp)
-                else:
-                    z_val = tan((i / pg.trig_res) * pi) * pg.trig_amp
-
-                if abs(z_val) > pg.trig_tanmax:
-                    if z_val >= 0:
-                        z_val = pg.trig_tanmax
-                    else:
-                        if pg.trig_abs:
-                            z_val = pg.trig_tanmax
-                        else:
-                            z_val = -pg.trig_tanmax
-
-            # Start with Offset Vector from UI and add wave offsets to it.
-            # Axis a3 (depth) is never changed from offset vector in UI.
-            #
-            vert_loc = Vector(pg.trig_off)
-            vert_loc[a1] = vert_loc[a1] + (i * x_inc)
-            vert_loc[a2] = vert_loc[a2] + z_val
-            if plane == "LO":
-                # Translate view local coordinates (horiz, vert, depth) into World XYZ
-                #
-                vert_loc = view_coords(vert_loc[a1], vert_loc[a2], vert_loc[a3])
-            vertex_new = bm.verts.new(vert_loc)
-            # Refresh Vertices list in object data.
+        steps = np.arange((pg.trig_res * pg.trig_cycles) + 1)
+        # Uses a calculation of trig function angle of imaginary object times maximum amplitude
+        # of wave. So with reolution at 9, angular increments are 20 degrees.
+        # Angles must be in Radians for this calcultion.
+        #
+        trig_function = {"sin": np.sin, "cos": np.cos}.get(pg.trig_type, np.tan)
+        z_val = trig_function((steps / pg.trig_res) * pi) * pg.trig_amp
+        if pg.trig_abs:
+            z_val = np.abs(z_val)
+        if pg.trig_type == "tan":
+            z_val = np.clip(z_val, -pg.trig_tanmax, pg.trig_tanmax)
+
+        # Start with Offset Vector from UI and add wave offsets to it.
+        # Axis a3 (depth) is never changed from offset vector in UI.
+        #
+        vert_locs = np.tile(np.array(pg.trig_off, dtype=np.float64), (len(steps), 1))
+        vert_locs[:, a1] += steps * x_inc
+        vert_locs[:, a2] += z_val
+        if plane == "LO":
+            # Translate view local coordinates (horiz, vert, depth) into World XYZ
             #
-            bm.verts.ensure_lookup_table()
-            if i > 0:
-                # Make an edge from last two vertices in object data.
-                #
-                bm.edges.new([bm.verts[-2], vertex_new])
+            vert_locs = view_coords_array(vert_locs[:, (a1, a2, a3)])
+
+        # Make an edge between each pair of consecutive new vertices.
+        #
+        new_verts = [bm.verts.new(vert_loc) for vert_loc in vert_locs.tolist()]
+        for vertex_a, vertex_b in zip(new_verts[:-1], new_verts[1:]):
+            bm.edges.new([vertex_a, vertex_b])
 
         bmesh.update_edit_mesh(pg.trig_obj.data)
         bpy.ops.object.mode_set(mode='OBJECT')
@@ -247,23 +247,23 @@ class PDT_OT_Reset3DView(Operator):
         )
 
         view = context.region_data
-        debug(f"is_orthographic_side_view: {view.is_orthographic_side_view}")
+        debug("is_orthographic_side_view: %s", view.is_orthographic_side_view)
         if view.is_orthographic_side_view:
             # When the view is orthographic, reset the distance and location.
             # The rotation already fits.
-            debug(f"view_distance before reset: {view.view_distance}")
-            debug(f"view_location before reset: {view.view_location}")
+            debug("view_distance before reset: %s", view.view_distance)
+            debug("view_location before reset: %s", view.view_location)
             view.view_distance = default_view_distance
             view.view_location = (-0.0, -0.0, -0.0)
             view.update()
-            debug(f"view_distance AFTER reset: {view.view_distance}")
-            debug(f"view_location AFTER reset: {view.view_location}")
+            debug("view_distance AFTER reset: %s", view.view_distance)
+            debug("view_location AFTER reset: %s", view.view_location)
         else:
             # Otherwise, the view matrix needs to be reset.
-            debug(f"view_matrix before reset:\n{view.view_matrix}")
+            debug("view_matrix before reset:\n%s", view.view_matrix)
             view.view_matrix = default_view_matrix
             view.view_distance = default_view_distance
             view.update()
-            debug(f"view_matrix AFTER reset:\n{view.view_matrix}")
+            debug("view_matrix AFTER reset:\n%s", view.view_matrix)
 
         return {"FINISHED"}
@@ -9,16 +9,113 @@
 #
 import bpy
 import bmesh
-from mathutils.geometry import intersect_line_line as LineIntersect
-import itertools
-from collections import defaultdict
+import importlib.util
+import multiprocessing
+import sys
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+from bpy.app.handlers import persistent
+from collections import OrderedDict, defaultdict
 from . import pdt_cad_module as cm
-from .pdt_functions import oops
+from . import pdt_xall_kernel as xk
+from .pdt_functions import (
+    debug,
+    edit_bmesh,
+    error_popup,
+    refresh_edit_mesh,
+    set_mode,
+    view_frame,
+)
 from .pdt_msg_strings import (
-    PDT_ERR_EDOB_MODE
+    PDT_ERR_EDOB_MODE,
+    PDT_ERR_NO_TARGETS,
+    PDT_ERR_OFF_PLANE,
 )
 
 
+# Selections with fewer edges than this are always intersected in Blender's own process,
+# below it starting the worker processes costs more than it saves.
+PARALLEL_MIN_EDGES = 20000
+
+# Number of tiles given to each worker process, more tiles balance the load better.
+TILES_PER_PROCESS = 4
+
+# Split points closer than this share one vertex, as remove_doubles would weld them.
+WELD_DISTANCE = 0.0001
+
+# Name pdt_xall_kernel is loaded under, as a top level module, for the worker processes.
+WORKER_KERNEL_NAME = "pdt_xall_kernel"
+
+# Run by exec in each worker process before its first tile: loads the kernel from its
+# file, without the PDT package or any change to sys.path, and stores the edge snapshot.
+WORKER_BOOTSTRAP = """
+import importlib.util, sys
+spec = importlib.util.spec_from_file_location(name, path)
+kernel = importlib.util.module_from_spec(spec)
+sys.modules[name] = kernel
+spec.loader.exec_module(kernel)
+kernel.init_worker(*snapshot)
+"""
+
+# Decimal places edge end points are rounded to when used as keys of resolved_edges.
+EDGE_KEY_PLACES = 5
+
+# Number of objects resolved_edges keeps keys for, the least recently used are dropped.
+RESOLVED_OBJECTS = 4
+
+# Keys of the edges left by the last Intersect All on recent objects, by object name.
+# These edges are known not to cross each other, so a re-run only has to check pairs
+# involving an edge that has been added or moved since. Cleared when a file is loaded.
+resolved_edges = OrderedDict()
+
+
+def get_resolved_edges(name):
+    """Return the Resolved Edge Keys of an Object, marking them as recently used.
+
+    Args:
+        name: Object name
+
+    Returns:
+        Set of Tuples, or None.
+    """
+
+    keys = resolved_edges.get(name)
+    if keys is not None:
+        resolved_edges.move_to_end(name)
+    return keys
+
+
+def set_resolved_edges(name, keys):
+    """Store the Resolved Edge Keys of an Object, dropping the least recently used.
+
+    Args:
+        name: Object name
+        keys: Set of Tuples
+
+    Returns:
+        Nothing.
+    """
+
+    resolved_edges[name] = keys
+    resolved_edges.move_to_end(name)
+    while len(resolved_edges) > RESOLVED_OBJECTS:
+        resolved_edges.popitem(last=False)
+
+
+@persistent
+def clear_resolved_edges(*args):
+    """Forget all Resolved Edge Keys, used as a load_post handler.
+
+    Returns:
+        Nothing.
+    """
+
+    resolved_edges.clear()
+
+
 def order_points(edge, point_list):
     """Order these edges from distance to v1, then sandwich the sorted list with v1, v2."""
     v1, v2 = edge
@@ -32,75 +129,159 @@ def order_points(edge, point_list):
     return [v1] + point_list + [v2]
 
 
-def remove_permutations_that_share_a_vertex(bm, permutations):
-    """Get useful Permutations.
+def edge_arrays(bm, edge_indices):
+    """Return Vertex Indices and Coordinates of Edges as Arrays.
 
     Args:
         bm: Object's Bmesh
-        permutations: Possible Intersection Edges as a list
+        edge_indices: List of indices of Edges to consider, ascending
 
     Returns:
-        List of Edges.
+        Integer array (n, 2) of Vertex Indices and Float array (n, 2, 3) of Coordinates.
     """
 
-    final_permutations = []
-    for edges in permutations:
-        raw_vert_indices = cm.vertex_indices_from_edges_tuple(bm, edges)
-        if len(set(raw_vert_indices)) < 4:
-            continue
+    table = cm.EdgeTable.from_bmesh(bm, edge_indices)
+    return table.vert_indices, table.coords
 
-        # reaches this point if they do not share.
-        final_permutations.append(edges)
 
-    return final_permutations
+def edge_keys(coords):
+    """Return Cache Keys for Edges.
 
+    Note:
+        Keys are the rounded end point coordinates of each edge, in sorted order so
+        they do not depend on the direction of the edge or on its index. Coordinates
+        are taken at single precision first, as they will be stored in the mesh.
 
-def get_valid_permutations(bm, edge_indices):
-    """Get useful Permutations.
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+
+    Returns:
+        List of Tuples.
+    """
+
+    rounded = np.round(np.asarray(coords, dtype=np.float32), EDGE_KEY_PLACES).tolist()
+    return [tuple(sorted(map(tuple, edge))) for edge in rounded]
+
+
+def resolved_keys(bm, int_dict, edge_indices):
+    """Return the Cache Keys of the Edges an Intersect All will leave.
+
+    Note:
+        These are the new edges between consecutive points of int_dict and the
+        selected edges that intersect nothing. Must be called before update_mesh.
 
     Args:
-        bm: Object's Bmesh
-        edge_indices: List of indices of Edges to consider
+        bm, Object's Bmesh
+        int_dict: Dictionary of Intersection Points, by Edge Index
+        edge_indices: List of Edge Indices to consider
 
     Returns:
-        List of suitable Edges.
+        Set of Tuples.
     """
 
-    raw_permutations = itertools.permutations(edge_indices, 2)
-    permutations = [r for r in raw_permutations if r[0] < r[1]]
-    return remove_permutations_that_share_a_vertex(bm, permutations)
+    segments = [
+        (point_list[i], point_list[i + 1])
+        for point_list in int_dict.values()
+        for i in range(len(point_list) - 1)
+    ]
+    untouched = [edge for edge in edge_indices if edge not in int_dict]
+    _, coords = edge_arrays(bm, untouched)
+    keys = set(edge_keys(coords))
+    if segments:
+        keys.update(edge_keys(np.array(segments, dtype=np.float64)))
+    return keys
 
 
-def can_skip(closest_points, vert_vectors):
-    """Check if the intersection lies on both edges and return True
-    when criteria are not met, and thus this point can be skipped.
+def worker_kernel():
+    """Load pdt_xall_kernel from its File as a Top Level Module.
+
+    Note:
+        Worker processes run a plain Python interpreter without bpy, so they cannot
+        import the PDT package. Tiles are sent to them as functions of this top level
+        module, which each worker loads from the same file in WORKER_BOOTSTRAP. The
+        module is loaded by path, sys.path is left unchanged.
+
+    Returns:
+        The pdt_xall_kernel module.
+    """
+
+    spec = importlib.util.spec_from_file_location(WORKER_KERNEL_NAME, xk.__file__)
+    kernel = importlib.util.module_from_spec(spec)
+    sys.modules[WORKER_KERNEL_NAME] = kernel
+    spec.loader.exec_module(kernel)
+    return kernel
+
+
+def parallel_intersections(coords, vert_indices, processes, dirty=None):
+    """Find Intersections in a Pool of Worker Processes.
+
+    Note:
+        The edge pairs are split into tiles along the broad phase sweep, each worker
+        receives the coordinate snapshot once and returns the intersections of the
+        tiles it is given. The tiles are merged back in the serial order.
 
     Args:
-        closest_points: List of Coordinates of points to consider
-        vert_vectors: List of Coordinates of vertices to consider
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        vert_indices: Integer array of shape (n, 2) holding the vertex indices of each edge
+        processes: Number of worker processes
+        dirty: Optional Boolean array of shape (n,), False for already resolved edges
 
     Returns:
-        Boolean.
+        Integer array (k, 2) of intersecting pairs and Float array (k, 3) of the points.
     """
 
-    if not closest_points:
-        return True
-    if not isinstance(closest_points[0].x, float):
-        return True
-    if cm.num_edges_point_lies_on(closest_points[0], vert_vectors) < 2:
-        return True
+    kernel = worker_kernel()
+    tiles = kernel.split_tiles(len(coords), processes * TILES_PER_PROCESS)
+    bootstrap_globals = {
+        "name": WORKER_KERNEL_NAME,
+        "path": kernel.__file__,
+        "snapshot": (coords, vert_indices, kernel.INTERSECT_TOLERANCE, dirty),
+    }
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=exec,
+        initargs=(WORKER_BOOTSTRAP, bootstrap_globals),
+    ) as pool:
+        results = list(pool.map(kernel.intersect_tile, tiles))
+    return kernel.merge_results(results)
+
+
+def find_intersections(coords, vert_indices, processes=1, dirty=None):
+    """Find Intersections, in Worker Processes if worthwhile.
 
-    # if this distance is larger than than 1.0e-5, we can skip it.
-    cpa, cpb = closest_points
-    return (cpa - cpb).length > 1.0e-5
+    Note:
+        Falls back to the main process if the worker processes cannot be started.
 
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        vert_indices: Integer array of shape (n, 2) holding the vertex indices of each edge
+        processes: Maximum number of worker processes, 1 disables them
+        dirty: Optional Boolean array of shape (n,), False for already resolved edges
 
-def get_intersection_dictionary(bm, edge_indices):
+    Returns:
+        Integer array (k, 2) of intersecting pairs and Float array (k, 3) of the points.
+    """
+
+    if processes > 1 and len(coords) >= PARALLEL_MIN_EDGES:
+        try:
+            return parallel_intersections(coords, vert_indices, processes, dirty)
+        except (BrokenProcessPool, ImportError, OSError) as err:
+            debug("Intersect All worker processes failed (%s), running serially", err)
+    return xk.find_intersections(coords, vert_indices, dirty=dirty)
+
+
+def get_intersection_dictionary(bm, edge_indices, processes=1, resolved=None):
     """Return a dictionary of edge indices and points found on those edges.
 
+    Note:
+        Pairs of edges whose keys are both in resolved are not checked again.
+
     Args:
         bm, Object's Bmesh
         edge_indices: List of Edge Indices
+        processes: Maximum number of worker processes, 1 disables them
+        resolved: Optional Set of keys of edges known not to intersect each other
 
     Returns:
         Dictionary of Vectors.
@@ -109,23 +290,24 @@ def get_intersection_dictionary(bm, edge_indices):
     bm.verts.ensure_lookup_table()
     bm.edges.ensure_lookup_table()
 
-    permutations = get_valid_permutations(bm, edge_indices)
+    edge_indices = sorted(edge_indices)
+    vert_indices, coords = edge_arrays(bm, edge_indices)
+    dirty = None
+    if resolved:
+        dirty = np.fromiter(
+            (key not in resolved for key in edge_keys(coords)), dtype=bool, count=len(coords)
+        )
+        debug("Intersect All: %d of %d edges new or moved", dirty.sum(), len(coords))
+    pairs, points = find_intersections(coords, vert_indices, processes, dirty)
 
     list_k = defaultdict(list)
     list_d = defaultdict(list)
 
-    for edges in permutations:
-        raw_vert_indices = cm.vertex_indices_from_edges_tuple(bm, edges)
-        vert_vectors = cm.vectors_from_indices(bm, raw_vert_indices)
-
-        points = LineIntersect(*vert_vectors)
-
-        # some can be skipped.    (NaN, None, not on both edges)
-        if can_skip(points, vert_vectors):
-            continue
-
-        # reaches this point only when an intersection happens on both edges.
-        [list_k[edge].append(points[0]) for edge in edges]
+    # reaches this point only when an intersection happens on both edges.
+    for (pos_a, pos_b), point in zip(pairs.tolist(), points.tolist()):
+        point = Vector(point)
+        list_k[edge_indices[pos_a]].append(point)
+        list_k[edge_indices[pos_b]].append(point)
 
     # list_k will contain a dict of edge indices and points found on those edges.
     for edge_idx, unordered_points in list_k.items():
@@ -141,6 +323,12 @@ def get_intersection_dictionary(bm, edge_indices):
 def update_mesh(bm, int_dict):
     """Make new geometry (delete old first).
 
+    Note:
+        Each distinct split point gets one vertex shared by every edge it lies on, the
+        end points of the cut edges are reused. New edges are made in one pass, then
+        the cut edges are deleted, normals are updated once and only the vertices
+        involved are welded.
+
     Args:
         bm, Object's Bmesh
         int_dict: Dictionary of Indices of Vertices
@@ -149,22 +337,253 @@ def update_mesh(bm, int_dict):
         Nothing.
     """
 
-    orig_e = bm.edges
-    orig_v = bm.verts
+    bm.edges.ensure_lookup_table()
+    cut_edges = [bm.edges[edge_idx] for edge_idx in int_dict]
+
+    shared_verts = {}
+
+    def vert_key(coord):
+        return tuple(round(value / WELD_DISTANCE) for value in coord)
+
+    for edge in cut_edges:
+        for vert in edge.verts:
+            shared_verts.setdefault(vert_key(vert.co), vert)
+
+    new_pairs = {}
+    for edge, point_list in zip(cut_edges, int_dict.values()):
+        verts = [edge.verts[0]]
+        for point in point_list[1:-1]:
+            key = vert_key(point)
+            vert = shared_verts.get(key)
+            if vert is None:
+                vert = bm.verts.new(point)
+                shared_verts[key] = vert
+            verts.append(vert)
+        verts.append(edge.verts[1])
+
+        for vert_a, vert_b in zip(verts[:-1], verts[1:]):
+            if vert_a is not vert_b:
+                new_pairs.setdefault(frozenset((vert_a, vert_b)), (vert_a, vert_b))
+
+    # A segment may match an existing edge, even a cut edge that only met others at
+    # its ends, that edge is kept rather than made again.
+    kept_edges = set()
+    for pair in new_pairs.values():
+        edge = bm.edges.get(pair)
+        if edge is None:
+            bm.edges.new(pair)
+        else:
+            kept_edges.add(edge)
 
-    new_verts = []
-    collect = new_verts.extend
-    for _, point_list in int_dict.items():
-        num_edges_to_add = len(point_list) - 1
-        for i in range(num_edges_to_add):
-            coord_a = orig_v.new(point_list[i])
-            coord_b = orig_v.new(point_list[i + 1])
-            orig_e.new((coord_a, coord_b))
-            bm.normal_update()
-            collect([coord_a, coord_b])
+    old_edges = [edge for edge in cut_edges if edge not in kept_edges]
+    bmesh.ops.delete(bm, geom=old_edges, context="EDGES")
+    bm.normal_update()
+    affected = [vert for vert in shared_verts.values() if vert.is_valid]
+    bmesh.ops.remove_doubles(bm, verts=affected, dist=WELD_DISTANCE)
+
+
+def target_trees(target, depsgraph):
+    """Return BVH Trees of a Target Object's Faces and Edges.
+
+    Note:
+        Built once per target from its evaluated mesh, in the target's local space.
+        Edges are stored as degenerate triangles (v1, v2, v2), so that
+        find_nearest_range returns the edges near a point.
+
+    Args:
+        target: Mesh Object to intersect with
+        depsgraph: Evaluated Depsgraph
+
+    Returns:
+        Face BVHTree (None if there are no faces), Edge BVHTree (None if there are no
+        edges) and Float array (n, 2, 3) of the target's edge end points.
+    """
+
+    evaluated = target.evaluated_get(depsgraph)
+    mesh = evaluated.to_mesh()
+    verts = [vert.co.copy() for vert in mesh.vertices]
+    polygons = [polygon.vertices[:] for polygon in mesh.polygons]
+    table = cm.EdgeTable.from_mesh(mesh)
+    evaluated.to_mesh_clear()
+
+    face_tree = BVHTree.FromPolygons(verts, polygons) if polygons else None
+    edge_tree = None
+    if len(table):
+        edge_tree = BVHTree.FromPolygons(
+            verts, [(v1, v2, v2) for v1, v2 in table.vert_indices.tolist()]
+        )
+    return face_tree, edge_tree, table.coords
+
+
+def edge_crossings(start, end, face_tree, edge_tree, edge_coords):
+    """Return the Points where an Edge crosses a Target's Faces or Edges.
+
+    Note:
+        Faces are found by casting rays along the edge from each hit to the next, edges
+        near the edge are found in edge_tree and tested as Intersect All tests a pair.
+        Points at the ends of the edge are left out.
+
+    Args:
+        start: First Vertex of the Edge, in the target's local space
+        end: Second Vertex of the Edge, in the target's local space
+        face_tree: Face BVHTree of the target, or None
+        edge_tree: Edge BVHTree of the target, or None
+        edge_coords: Float array (n, 2, 3) of the target's edge end points
+
+    Returns:
+        List of Vectors.
+    """
+
+    vector = end - start
+    length = vector.length
+    if length <= xk.INTERSECT_TOLERANCE:
+        return []
+    direction = vector / length
+
+    points = []
+    if face_tree is not None:
+        travelled = 0.0
+        while travelled < length:
+            location, _, _, distance = face_tree.ray_cast(
+                start + direction * travelled, direction, length - travelled
+            )
+            if location is None:
+                break
+            points.append(location)
+            travelled += distance + xk.INTERSECT_TOLERANCE
+
+    if edge_tree is not None:
+        near = edge_tree.find_nearest_range(
+            (start + end) / 2, length / 2 + xk.INTERSECT_TOLERANCE
+        )
+        if near:
+            edge = np.array([(start[:], end[:])], dtype=np.float64)
+            coords = np.concatenate((edge, edge_coords[[index for _, _, index, _ in near]]))
+            pairs = np.column_stack(
+                (np.zeros(len(near), dtype=np.int64), np.arange(1, len(near) + 1))
+            )
+            _, hit_points = xk.intersect_pairs(coords, pairs)
+            points.extend(Vector(point) for point in hit_points.tolist())
+
+    return [
+        point
+        for point in points
+        if (point - start).length > WELD_DISTANCE and (point - end).length > WELD_DISTANCE
+    ]
+
+
+def get_object_intersection_dictionary(bm, edge_indices, obj, targets, depsgraph):
+    """Return a dictionary of edge indices and points where they cross other objects.
+
+    Args:
+        bm, Object's Bmesh
+        edge_indices: List of Edge Indices
+        obj: Object that owns bm
+        targets: List of Mesh Objects to intersect with
+        depsgraph: Evaluated Depsgraph
+
+    Returns:
+        Dictionary of Vectors.
+    """
+
+    bm.edges.ensure_lookup_table()
+    edges = [bm.edges[edge_idx] for edge_idx in sorted(edge_indices)]
+
+    list_k = defaultdict(list)
+    list_d = defaultdict(list)
+
+    for target in targets:
+        face_tree, edge_tree, edge_coords = target_trees(target, depsgraph)
+        if face_tree is None and edge_tree is None:
+            continue
+        to_target = target.matrix_world.inverted_safe() @ obj.matrix_world
+        to_object = to_target.inverted_safe()
+        for edge in edges:
+            start = to_target @ edge.verts[0].co
+            end = to_target @ edge.verts[1].co
+            for point in edge_crossings(start, end, face_tree, edge_tree, edge_coords):
+                list_k[edge.index].append(to_object @ point)
+
+    for edge_idx, unordered_points in list_k.items():
+        v1, v2 = (vert.co for vert in bm.edges[edge_idx].verts)
+        list_d[edge_idx].extend(order_points((v1, v2), unordered_points))
+
+    return list_d
+
+
+def plane_rotation(context, obj):
+    """Return the Rotation from an Object's Local Space to the Working Plane's Axes.
+
+    Note:
+        For the View plane, the axes are those of the 3D View, otherwise they are
+        the global axes.
+
+    Args:
+        context: Blender bpy.context instance.
+        obj: Object whose edges will be intersected
+
+    Returns:
+        Float array of shape (3, 3).
+    """
+
+    pg = context.scene.pdt_pg
+    rotation = obj.matrix_world.to_3x3()
+    if pg.plane == "LO":
+        frame = view_frame(context)
+        if frame is not None:
+            rotation = frame.rotation @ rotation
+    return np.array(rotation, dtype=np.float64)
+
+
+def get_plane_intersection_dictionary(bm, edge_indices, plane, rotation):
+    """Return a dictionary of edge indices and points where they cross in the working plane.
+
+    Note:
+        Edges are projected onto the working plane's (a1, a2) axes and intersected with
+        pdt_xall_kernel.sweep_intersections. The plane lies at the median depth (a3) of
+        the selection, edges with an end further than WELD_DISTANCE from it are off the
+        plane and are not cut.
+
+    Args:
+        bm, Object's Bmesh
+        edge_indices: List of Edge Indices
+        plane: Working Plane, as pg.plane
+        rotation: Float array (3, 3), see plane_rotation
+
+    Returns:
+        Dictionary of Vectors and List of the Indices of Edges off the plane.
+    """
+
+    bm.verts.ensure_lookup_table()
+    bm.edges.ensure_lookup_table()
+
+    edge_indices = sorted(edge_indices)
+    vert_indices, coords = edge_arrays(bm, edge_indices)
+    a1, a2, a3 = set_mode(plane)
+    plane_coords = coords @ rotation.T
+
+    depth = plane_coords[:, :, a3]
+    off_plane = np.zeros(len(coords), dtype=bool)
+    if len(coords):
+        off_plane = np.any(np.abs(depth - np.median(depth)) > WELD_DISTANCE, axis=1)
+    on_plane = np.flatnonzero(~off_plane)
+
+    pairs, points = xk.plane_intersections(
+        coords[on_plane], plane_coords[on_plane][:, :, (a1, a2)], vert_indices[on_plane]
+    )
+
+    list_k = defaultdict(list)
+    list_d = defaultdict(list)
+    for (pos_a, pos_b), point in zip(on_plane[pairs].tolist(), points.tolist()):
+        point = Vector(point)
+        list_k[edge_indices[pos_a]].append(point)
+        list_k[edge_indices[pos_b]].append(point)
+
+    for edge_idx, unordered_points in list_k.items():
+        v1, v2 = (vert.co for vert in bm.edges[edge_idx].verts)
+        list_d[edge_idx].extend(order_points((v1, v2), unordered_points))
 
-    bmesh.ops.delete(bm, geom=[edge for edge in bm.edges if edge.select], context="EDGES")
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+    return list_d, [edge_indices[pos] for pos in np.flatnonzero(off_plane).tolist()]
 
 
 def unselect_nonintersecting(bm, d_edges, edge_indices):
@@ -206,26 +625,51 @@ def intersect_all(context):
 
 
         if obj.mode == "EDIT":
-            bm = bmesh.from_edit_mesh(obj.data)
+            bm = edit_bmesh(obj.data)
 
             selected_edges = [edge for edge in bm.edges if edge.select]
             edge_indices = [i.index for i in selected_edges]
 
-            int_dict = get_intersection_dictionary(bm, edge_indices)
+            if pg.intersect_mode == "OBJECTS":
+                targets = [
+                    target
+                    for target in context.selected_objects
+                    if target.type == "MESH" and target is not obj
+                ]
+                if not targets:
+                    pg.error = PDT_ERR_NO_TARGETS
+                    error_popup(context)
+                    return
+                int_dict = get_object_intersection_dictionary(
+                    bm, edge_indices, obj, targets, context.evaluated_depsgraph_get()
+                )
+            elif pg.intersect_mode == "PLANE":
+                int_dict, off_plane = get_plane_intersection_dictionary(
+                    bm, edge_indices, pg.plane, plane_rotation(context, obj)
+                )
+            else:
+                processes = context.preferences.addons[__package__].preferences.pdt_xall_processes
+                int_dict = get_intersection_dictionary(
+                    bm, edge_indices, processes, get_resolved_edges(obj.name)
+                )
+                set_resolved_edges(obj.name, resolved_keys(bm, int_dict, edge_indices))
 
             unselect_nonintersecting(bm, int_dict.keys(), edge_indices)
             update_mesh(bm, int_dict)
 
-            bmesh.update_edit_mesh(obj.data)
+            refresh_edit_mesh(obj.data)
+            if pg.intersect_mode == "PLANE" and off_plane:
+                pg.error = f"{PDT_ERR_OFF_PLANE} {len(off_plane)})"
+                error_popup(context)
         else:
             pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-            context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+            error_popup(context)
             return
 
         return
     else:
         pg.error = f"{PDT_ERR_EDOB_MODE},{obj.mode})"
-        context.window_manager.popup_menu(oops, title="Error", icon="ERROR")
+        error_popup(context)
         return
 
 class PDT_OT_IntersectAllEdges(bpy.types.Operator):
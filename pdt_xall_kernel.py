@@ -0,0 +1,587 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# <pep8 compliant>
+#
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Array based geometry kernels used by Intersect All (pdt_xall).
+#
+# Nothing in here may import bpy, bmesh or mathutils, the functions only work on plain
+# NumPy arrays of edge coordinates so they can be used outside of Blender's main thread.
+#
+import heapq
+import math
+import numpy as np
+
+# Two edges are considered to meet when their closest points are nearer than this,
+# it matches the tolerance used by pdt_cad_module.point_on_edge.
+INTERSECT_TOLERANCE = 1.0e-5
+
+# Number of edge pairs generated and tested at once, bounds the temporary memory used.
+PAIR_BATCH_SIZE = 65536
+
+
+def edge_bounds(coords, tolerance=INTERSECT_TOLERANCE):
+    """Return the Axis Aligned Bounding Boxes of Edges.
+
+    Note:
+        Boxes are padded by tolerance on every side, so that edges which only come within
+        tolerance of each other are still reported as overlapping.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        tolerance: Padding added to each side of the boxes
+
+    Returns:
+        Minimum corners (n, 3) and Maximum corners (n, 3) as Float arrays.
+    """
+
+    return coords.min(axis=1) - tolerance, coords.max(axis=1) + tolerance
+
+
+def candidate_pairs(coords, tolerance=INTERSECT_TOLERANCE, tile=None):
+    """Return Pairs of Edges whose Bounding Boxes overlap.
+
+    Note:
+        All batches of iter_candidate_pairs in one array, pairs are returned with the
+        lower position first, sorted in the same order as itertools.combinations
+        would produce them.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        tolerance: Padding added to each side of the bounding boxes
+        tile: Optional (first, last) range of sweep positions
+
+    Returns:
+        Integer array of shape (m, 2).
+    """
+
+    batches = list(iter_candidate_pairs(coords, tolerance, tile))
+    if not batches:
+        return np.empty((0, 2), dtype=np.int64)
+    return sort_pairs(np.concatenate(batches))
+
+
+def iter_candidate_pairs(
+    coords, tolerance=INTERSECT_TOLERANCE, tile=None, batch_size=PAIR_BATCH_SIZE
+):
+    """Generate Pairs of Edges whose Bounding Boxes overlap, in Batches.
+
+    Note:
+        Broad phase for Intersect All, edges are sorted on the minimum of their bounding
+        boxes along the axis with the greatest spread, each edge is then only paired with
+        the edges whose boxes start before it ends on that axis (sort and sweep). The
+        remaining pairs are checked for overlap on all three axes.
+
+        Edges are expanded into pairs a run of sweep positions at a time, so that no
+        more than batch_size pairs are held at once. A single edge overlapping more
+        than batch_size others still forms one batch. Pairs have the lower position
+        first and are sorted within each batch.
+
+        If tile is given, only pairs whose first edge in sweep order lies in
+        range(*tile) are returned, tiles that cover range(len(coords)) without
+        overlapping give every pair exactly once.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        tolerance: Padding added to each side of the bounding boxes
+        tile: Optional (first, last) range of sweep positions
+        batch_size: Target number of pairs per batch
+
+    Yields:
+        Integer arrays of shape (m, 2).
+    """
+
+    num_edges = len(coords)
+    if num_edges < 2:
+        return
+
+    box_min, box_max = edge_bounds(coords, tolerance)
+    axis = int(np.argmax(box_max.max(axis=0) - box_min.min(axis=0)))
+    order = np.argsort(box_min[:, axis], kind="stable")
+    sorted_min = box_min[order, axis]
+
+    first, last = (0, num_edges) if tile is None else tile
+    rows = np.arange(first, last)
+
+    # For each edge in sweep order, the edges that follow it up to "stop" start
+    # before it ends along the sweep axis.
+    starts = rows + 1
+    stops = np.searchsorted(sorted_min, box_max[order[rows], axis], side="right")
+    counts = np.maximum(stops - starts, 0)
+    totals = np.cumsum(counts)
+
+    row = 0
+    done = 0
+    while row < len(rows):
+        end = max(int(np.searchsorted(totals, done + batch_size, side="right")), row + 1)
+        batch_counts = counts[row:end]
+        total = int(totals[end - 1]) - done
+        if total:
+            offsets = np.arange(total) - np.repeat(
+                np.cumsum(batch_counts) - batch_counts, batch_counts
+            )
+            edge_a = order[np.repeat(rows[row:end], batch_counts)]
+            edge_b = order[np.repeat(starts[row:end], batch_counts) + offsets]
+
+            overlap = np.all(
+                (box_min[edge_a] <= box_max[edge_b]) & (box_min[edge_b] <= box_max[edge_a]),
+                axis=1,
+            )
+            edge_a = edge_a[overlap]
+            edge_b = edge_b[overlap]
+            if len(edge_a):
+                yield sort_pairs(
+                    np.column_stack((np.minimum(edge_a, edge_b), np.maximum(edge_a, edge_b)))
+                )
+        done += total
+        row = end
+
+
+def sort_pairs(pairs):
+    """Sort Pairs of Edges by first, then second position.
+
+    Args:
+        pairs: Integer array of shape (m, 2)
+
+    Returns:
+        Sorted copy of pairs.
+    """
+
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
+def split_tiles(num_edges, num_tiles):
+    """Split the Sweep Positions of Edges into Tiles.
+
+    Args:
+        num_edges: Number of Edges
+        num_tiles: Number of Tiles wanted
+
+    Returns:
+        List of (first, last) ranges covering range(num_edges).
+    """
+
+    bounds = np.linspace(0, num_edges, max(1, num_tiles) + 1).astype(np.int64)
+    return [(int(a), int(b)) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def share_a_vertex(vert_indices, pairs):
+    """Return which Pairs of Edges share a Vertex.
+
+    Args:
+        vert_indices: Integer array of shape (n, 2) holding the vertex indices of each edge
+        pairs: Integer array of shape (m, 2) of positions into vert_indices
+
+    Returns:
+        Boolean array of shape (m,).
+    """
+
+    verts_a = vert_indices[pairs[:, 0]]
+    verts_b = vert_indices[pairs[:, 1]]
+    return (
+        (verts_a[:, 0] == verts_b[:, 0])
+        | (verts_a[:, 0] == verts_b[:, 1])
+        | (verts_a[:, 1] == verts_b[:, 0])
+        | (verts_a[:, 1] == verts_b[:, 1])
+    )
+
+
+def valid_pairs(coords, vert_indices, tolerance=INTERSECT_TOLERANCE, tile=None, dirty=None):
+    """Return Pairs of Edges that could Intersect.
+
+    Note:
+        All batches of iter_valid_pairs in one array, sorted as candidate_pairs.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        vert_indices: Integer array of shape (n, 2) holding the vertex indices of each edge
+        tolerance: Padding added to each side of the bounding boxes
+        tile: Optional (first, last) range of sweep positions, see candidate_pairs
+        dirty: Optional Boolean array of shape (n,), see iter_valid_pairs
+
+    Returns:
+        Integer array of shape (m, 2).
+    """
+
+    batches = list(iter_valid_pairs(coords, vert_indices, tolerance, tile, dirty))
+    if not batches:
+        return np.empty((0, 2), dtype=np.int64)
+    return sort_pairs(np.concatenate(batches))
+
+
+def iter_valid_pairs(
+    coords,
+    vert_indices,
+    tolerance=INTERSECT_TOLERANCE,
+    tile=None,
+    dirty=None,
+    batch_size=PAIR_BATCH_SIZE,
+):
+    """Generate Pairs of Edges that could Intersect, in Batches.
+
+    Note:
+        Pairs whose bounding boxes overlap (see iter_candidate_pairs) and which do not
+        share a vertex. If dirty is given, pairs of two clean edges are dropped as
+        well, their result is already known.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        vert_indices: Integer array of shape (n, 2) holding the vertex indices of each edge
+        tolerance: Padding added to each side of the bounding boxes
+        tile: Optional (first, last) range of sweep positions, see iter_candidate_pairs
+        dirty: Optional Boolean array of shape (n,), False for edges known not to
+            intersect each other
+        batch_size: Target number of pairs per batch
+
+    Yields:
+        Integer arrays of shape (m, 2).
+    """
+
+    for pairs in iter_candidate_pairs(coords, tolerance, tile, batch_size):
+        keep = ~share_a_vertex(vert_indices, pairs)
+        if dirty is not None:
+            keep &= dirty[pairs[:, 0]] | dirty[pairs[:, 1]]
+        if keep.any():
+            yield pairs[keep]
+
+
+def closest_points(coords, pairs):
+    """Return the Closest Points between the Lines through Pairs of Edges.
+
+    Note:
+        Array version of mathutils.geometry.intersect_line_line, the parameters s & t
+        give the position of each closest point along its own edge, 0 at the first
+        vertex and 1 at the second. Parallel and zero length edges have no closest
+        points and are flagged in the valid mask.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        pairs: Integer array of shape (m, 2) of positions into coords
+
+    Returns:
+        Closest points on the first edges (m, 3) and on the second edges (m, 3),
+        parameters s (m,) and t (m,) and the valid mask (m,).
+    """
+
+    start_a = coords[pairs[:, 0], 0]
+    start_b = coords[pairs[:, 1], 0]
+    dir_a = coords[pairs[:, 0], 1] - start_a
+    dir_b = coords[pairs[:, 1], 1] - start_b
+    offset = start_b - start_a
+
+    normal = np.cross(dir_a, dir_b)
+    denominator = np.einsum("ij,ij->i", normal, normal)
+    valid = denominator > 0.0
+    denominator = np.where(valid, denominator, 1.0)
+    param_s = np.einsum("ij,ij->i", np.cross(offset, dir_b), normal) / denominator
+    param_t = np.einsum("ij,ij->i", np.cross(offset, dir_a), normal) / denominator
+
+    point_a = start_a + param_s[:, None] * dir_a
+    point_b = start_b + param_t[:, None] * dir_b
+    return point_a, point_b, param_s, param_t, valid
+
+
+def intersect_pairs(coords, pairs, tolerance=INTERSECT_TOLERANCE, block_size=PAIR_BATCH_SIZE):
+    """Return which Pairs of Edges Intersect, and where.
+
+    Note:
+        Vectorised equivalent of running intersect_line_line and
+        pdt_cad_module.num_edges_point_lies_on over every pair. A pair intersects when the closest
+        points of the two lines are within tolerance of each other and lie on both
+        edges. Pairs are processed in blocks of block_size to bound temporary memory.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        pairs: Integer array of shape (m, 2) of positions into coords
+        tolerance: Maximum separation of the closest points
+        block_size: Number of pairs evaluated at once
+
+    Returns:
+        Boolean hit mask of shape (m,) and intersection points (k, 3) for the hits,
+        taken on the first edge of each pair.
+    """
+
+    hits = np.zeros(len(pairs), dtype=bool)
+    points = []
+    for first in range(0, len(pairs), block_size):
+        block = pairs[first:first + block_size]
+        point_a, point_b, param_s, param_t, valid = closest_points(coords, block)
+        separation = np.linalg.norm(point_a - point_b, axis=1)
+        hit = (
+            valid
+            & (separation < tolerance)
+            & (param_s >= 0.0)
+            & (param_s <= 1.0)
+            & (param_t >= 0.0)
+            & (param_t <= 1.0)
+        )
+        hits[first:first + block_size] = hit
+        points.append(point_a[hit])
+
+    if not points:
+        return hits, np.empty((0, 3), dtype=np.float64)
+    return hits, np.concatenate(points)
+
+
+def find_intersections(
+    coords, vert_indices, tolerance=INTERSECT_TOLERANCE, tile=None, dirty=None
+):
+    """Return the Pairs of Edges that Intersect, and where.
+
+    Note:
+        Pairs are streamed from iter_valid_pairs, only the hits of each batch are kept.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        vert_indices: Integer array of shape (n, 2) holding the vertex indices of each edge
+        tolerance: Intersection tolerance
+        tile: Optional (first, last) range of sweep positions, see candidate_pairs
+        dirty: Optional Boolean array of shape (n,), see valid_pairs
+
+    Returns:
+        Integer array (k, 2) of intersecting pairs and Float array (k, 3) of the points.
+    """
+
+    results = []
+    for pairs in iter_valid_pairs(coords, vert_indices, tolerance, tile, dirty):
+        hits, points = intersect_pairs(coords, pairs, tolerance)
+        results.append((pairs[hits], points))
+    return merge_results(results)
+
+
+# Edge snapshot held by each worker process, see init_worker.
+_worker_snapshot = None
+
+
+def init_worker(coords, vert_indices, tolerance, dirty=None):
+    """Store the Edge Snapshot in a Worker Process.
+
+    Note:
+        Used as the initializer of the process pool, so the arrays are only sent to
+        each worker once rather than with every tile.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        vert_indices: Integer array of shape (n, 2) holding the vertex indices of each edge
+        tolerance: Intersection tolerance
+        dirty: Optional Boolean array of shape (n,), see valid_pairs
+
+    Returns:
+        Nothing.
+    """
+
+    global _worker_snapshot
+    _worker_snapshot = (coords, vert_indices, tolerance, dirty)
+
+
+def intersect_tile(tile):
+    """Find the Intersections of one Tile in a Worker Process.
+
+    Args:
+        tile: (first, last) range of sweep positions
+
+    Returns:
+        Output of find_intersections for the tile.
+    """
+
+    coords, vert_indices, tolerance, dirty = _worker_snapshot
+    return find_intersections(coords, vert_indices, tolerance, tile, dirty)
+
+
+def merge_results(results):
+    """Merge the Intersections found in several Tiles or Batches.
+
+    Args:
+        results: List of find_intersections outputs
+
+    Returns:
+        Integer array (k, 2) of intersecting pairs, in the order find_intersections
+        would give for the whole selection, and Float array (k, 3) of the points.
+    """
+
+    results = [result for result in results if len(result[0])]
+    if not results:
+        return np.empty((0, 2), dtype=np.int64), np.empty((0, 3), dtype=np.float64)
+    pairs = np.concatenate([result[0] for result in results])
+    points = np.concatenate([result[1] for result in results])
+    order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    return pairs[order], points[order]
+
+
+def segment_params(flat, seg_a, seg_b):
+    """Return where the Lines through two 2D Edges cross.
+
+    Args:
+        flat: Nested list (n, 2, 2) of 2D edge end points
+        seg_a: Position of the first Edge
+        seg_b: Position of the second Edge
+
+    Returns:
+        Parameters s & t along each edge, 0 at its first vertex and 1 at its second,
+        or None if the edges are parallel.
+    """
+
+    (ax1, ay1), (ax2, ay2) = flat[seg_a]
+    (bx1, by1), (bx2, by2) = flat[seg_b]
+    rx, ry = ax2 - ax1, ay2 - ay1
+    sx, sy = bx2 - bx1, by2 - by1
+    denominator = rx * sy - ry * sx
+    if abs(denominator) <= 1.0e-12 * math.hypot(rx, ry) * math.hypot(sx, sy):
+        return None
+    qx, qy = bx1 - ax1, by1 - ay1
+    return (qx * sy - qy * sx) / denominator, (qx * ry - qy * rx) / denominator
+
+
+def sweep_intersections(flat, vert_indices, tolerance=INTERSECT_TOLERANCE):
+    """Return the Pairs of 2D Edges that Intersect, using a Sweep Line.
+
+    Note:
+        Bentley-Ottmann sweep in O((n + k) log n) comparisons for n edges and k
+        crossings. A vertical sweep line moves along x, the status holds the edges it
+        currently cuts ordered by y, and only edges that become neighbours in the status
+        are tested against each other. Points within tolerance of an event point are
+        treated as passing through it, vertical edges are kept at the event point's y
+        while the sweep line lies on them.
+
+        The status is a plain list searched by bisection, so insertions and removals
+        move list items in memory, which is fast in practice but linear in the worst case.
+
+        Like intersect_pairs, edges sharing a vertex and parallel edges are not reported,
+        and edges shorter than tolerance are ignored.
+
+    Args:
+        flat: Float array of shape (n, 2, 2) holding the 2D end points of each edge
+        vert_indices: Integer array of shape (n, 2) holding the vertex indices of each edge
+        tolerance: Intersection tolerance
+
+    Returns:
+        Integer array (k, 2) of intersecting pairs, sorted, and Float array (k,) of
+        the parameter of each intersection along the first edge of its pair.
+    """
+
+    flat = flat.tolist()
+    verts = vert_indices.tolist()
+    left, right, slope = {}, {}, {}
+    events = {}
+    queue = []
+
+    def add_event(point):
+        if point not in events:
+            events[point] = []
+            heapq.heappush(queue, point)
+
+    for seg, (start, end) in enumerate(flat):
+        start, end = tuple(start), tuple(end)
+        if math.dist(start, end) <= tolerance:
+            continue
+        if end < start:
+            start, end = end, start
+        left[seg], right[seg] = start, end
+        slope[seg] = (
+            (end[1] - start[1]) / (end[0] - start[0]) if end[0] != start[0] else math.inf
+        )
+        add_event(start)
+        events[start].append(seg)
+        add_event(end)
+
+    def y_at(seg, point):
+        (x1, y1), (x2, y2) = left[seg], right[seg]
+        if x1 == x2:
+            return min(max(point[1], y1), y2)
+        return y1 + (min(max(point[0], x1), x2) - x1) * slope[seg]
+
+    def lower_bound(point, value):
+        low, high = 0, len(status)
+        while low < high:
+            middle = (low + high) // 2
+            if y_at(status[middle], point) < value:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def crossing_params(seg_a, seg_b):
+        params = segment_params(flat, seg_a, seg_b)
+        if params is None:
+            return None
+        slack_a = tolerance / math.dist(left[seg_a], right[seg_a])
+        slack_b = tolerance / math.dist(left[seg_b], right[seg_b])
+        if -slack_a <= params[0] <= 1.0 + slack_a and -slack_b <= params[1] <= 1.0 + slack_b:
+            return params
+        return None
+
+    def check(seg_a, seg_b, point):
+        params = crossing_params(seg_a, seg_b)
+        if params is not None:
+            (x1, y1), (x2, y2) = flat[seg_a]
+            crossing = (x1 + params[0] * (x2 - x1), y1 + params[0] * (y2 - y1))
+            if crossing > point:
+                add_event(crossing)
+
+    found = {}
+
+    def report(group):
+        for seg_a in group:
+            for seg_b in group:
+                if seg_a >= seg_b or (seg_a, seg_b) in found:
+                    continue
+                if set(verts[seg_a]) & set(verts[seg_b]):
+                    continue
+                params = crossing_params(seg_a, seg_b)
+                if params is not None:
+                    found[(seg_a, seg_b)] = min(max(params[0], 0.0), 1.0)
+
+    status = []
+    while queue:
+        point = heapq.heappop(queue)
+        starting = events.pop(point)
+        first = lower_bound(point, point[1] - tolerance)
+        last = first
+        while last < len(status) and y_at(status[last], point) <= point[1] + tolerance:
+            last += 1
+        passing = status[first:last]
+        if len(starting) + len(passing) > 1:
+            report(starting + passing)
+
+        continuing = [seg for seg in passing if math.dist(right[seg], point) > tolerance]
+        inserted = sorted(starting + continuing, key=lambda seg: (slope[seg], seg))
+        status[first:last] = inserted
+
+        if not inserted:
+            if 0 < first < len(status):
+                check(status[first - 1], status[first], point)
+        else:
+            if first > 0:
+                check(status[first - 1], inserted[0], point)
+            after = first + len(inserted)
+            if after < len(status):
+                check(inserted[-1], status[after], point)
+
+    if not found:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.float64)
+    pairs = np.array(list(found), dtype=np.int64)
+    params = np.array(list(found.values()), dtype=np.float64)
+    order = np.lexsort((pairs[:, 1], pairs[:, 0]))
+    return pairs[order], params[order]
+
+
+def plane_intersections(coords, flat, vert_indices, tolerance=INTERSECT_TOLERANCE):
+    """Return the Pairs of Edges that Intersect in a Plane, and where.
+
+    Args:
+        coords: Float array of shape (n, 2, 3) holding the end points of each edge
+        flat: Float array of shape (n, 2, 2) holding the same end points in the plane
+        vert_indices: Integer array of shape (n, 2) holding the vertex indices of each edge
+        tolerance: Intersection tolerance
+
+    Returns:
+        Integer array (k, 2) of intersecting pairs and Float array (k, 3) of the points,
+        taken on the first edge of each pair.
+    """
+
+    pairs, params = sweep_intersections(flat, vert_indices, tolerance)
+    start = coords[pairs[:, 0], 0]
+    return pairs, start + params[:, None] * (coords[pairs[:, 0], 1] - start)
@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Tests for the batched EdgeTable queries in pdt_cad_module, run from the add-on
+# folder with
+#
+#   python -m pytest tests
+#
+# pdt_cad_module needs mathutils and, through pdt_functions, bpy, so these tests
+# are skipped unless they run under Blender's Python. The scalar point_on_edge and
+# closest_vector are used as the reference results.
+
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("bpy")
+mathutils = pytest.importorskip("mathutils")
+np = pytest.importorskip("numpy")
+
+ADDON_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "pdt_maths_test_package"
+
+if PACKAGE not in sys.modules:
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [ADDON_FOLDER]
+    sys.modules[PACKAGE] = package
+cm = importlib.import_module(f"{PACKAGE}.pdt_cad_module")
+
+Vector = mathutils.Vector
+
+
+def random_edges(seed, count=200):
+    """Return an EdgeTable of random Edges and Points on, near and off them."""
+
+    rng = np.random.default_rng(seed)
+    coords = rng.uniform(-10.0, 10.0, (count, 2, 3))
+    table = cm.EdgeTable.from_coords(coords)
+    params = rng.uniform(-0.5, 1.5, count)
+    points = coords[:, 0] + params[:, None] * table.vectors
+    # A third of the points are moved off their line.
+    points[::3] += rng.normal(scale=1.0e-2, size=(len(points[::3]), 3))
+    return table, points
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_point_on_edge(seed):
+    table, points = random_edges(seed)
+    rows = np.arange(len(table))
+    batched = table.point_on_edge(points, rows)
+    scalar = [
+        cm.point_on_edge(Vector(point), tuple(Vector(co) for co in edge))
+        for point, edge in zip(points, table.coords)
+    ]
+    assert batched.tolist() == scalar
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_closest_idx(seed):
+    table, points = random_edges(seed)
+    rows = np.arange(len(table))
+    batched = table.closest_idx(points, rows)
+    for point, edge, verts, idx in zip(points, table.coords, table.vert_indices, batched):
+        ends = tuple(Vector(co) for co in edge)
+        closest = cm.closest_vector(Vector(point), ends)
+        assert idx == (verts[0] if closest is ends[0] else verts[1])
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_num_edges_point_lies_on(seed):
+    table, points = random_edges(seed)
+    rng = np.random.default_rng(seed)
+    rows = np.column_stack((np.arange(len(table)), rng.integers(len(table), size=len(table))))
+    batched = table.num_edges_point_lies_on(points, rows)
+    for point, pair, count in zip(points, rows, batched):
+        edges = [Vector(co) for co in table.coords[pair].reshape(-1, 3)]
+        assert cm.num_edges_point_lies_on(Vector(point), edges) == count
+        scalar = [cm.point_on_edge(Vector(point), edge) for edge in (edges[:2], edges[2:])]
+        assert scalar.count(True) == count
+
+
+def test_rows_rejects_missing_edges():
+    table = cm.EdgeTable([2, 5, 9], np.zeros((3, 2)), np.zeros((3, 2, 3)))
+    assert table.rows([[9, 2], [5, 5]]).tolist() == [[2, 0], [1, 1]]
+    with pytest.raises(KeyError):
+        table.rows([5, 6])
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Tests for move_objects in pdt_functions, run from the add-on folder with
+#
+#   python -m pytest tests
+#
+# pdt_functions needs bpy, so these tests are skipped unless they run under
+# Blender's Python, or with the bpy module installed.
+
+import importlib
+import math
+import os
+import sys
+import types
+
+import pytest
+
+bpy = pytest.importorskip("bpy")
+Vector = pytest.importorskip("mathutils").Vector
+
+ADDON_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "pdt_maths_test_package"
+
+if PACKAGE not in sys.modules:
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [ADDON_FOLDER]
+    sys.modules[PACKAGE] = package
+pdt_functions = importlib.import_module(f"{PACKAGE}.pdt_functions")
+
+
+@pytest.fixture
+def parented():
+    """Yield a rotated, scaled Parent and a Child parented with an inverse matrix."""
+
+    scene = bpy.context.scene
+    parent = bpy.data.objects.new("pdt_test_parent", None)
+    child = bpy.data.objects.new("pdt_test_child", None)
+    for ob in (parent, child):
+        scene.collection.objects.link(ob)
+    parent.location = (1.0, 2.0, 3.0)
+    parent.rotation_euler = (0.0, 0.0, math.pi / 2)
+    parent.scale = (2.0, 2.0, 2.0)
+    bpy.context.view_layer.update()
+    child.parent = parent
+    child.matrix_parent_inverse = parent.matrix_world.inverted()
+    child.location = (4.0, 0.0, 1.0)
+    bpy.context.view_layer.update()
+    yield parent, child
+    for ob in (child, parent):
+        bpy.data.objects.remove(ob)
+
+
+def world_location(ob):
+    bpy.context.view_layer.update()
+    return ob.matrix_world.translation.copy()
+
+
+def test_move_parented_twice(parented):
+    _parent, child = parented
+    start = world_location(child)
+    pdt_functions.move_objects([child], delta=(1.0, 0.0, 0.0))
+    pdt_functions.move_objects([child], delta=(0.0, 1.0, 0.0))
+    assert tuple(world_location(child)) == pytest.approx(tuple(start + Vector((1, 1, 0))))
+
+
+def test_move_parented_to_location_twice(parented):
+    _parent, child = parented
+    pdt_functions.move_objects([child], location=(5.0, 5.0, 5.0))
+    pdt_functions.move_objects([child], location=(-1.0, 0.0, 2.0))
+    assert tuple(world_location(child)) == pytest.approx((-1.0, 0.0, 2.0))
+
+
+def test_move_parent_then_child(parented):
+    parent, child = parented
+    start = world_location(child)
+    pdt_functions.move_objects([parent], delta=(0.0, 0.0, 2.0))
+    pdt_functions.move_objects([child], delta=(3.0, 0.0, 0.0))
+    assert tuple(world_location(child)) == pytest.approx(tuple(start + Vector((3, 0, 2))))
+
+
+def test_move_parent_and_child_together(parented):
+    parent, child = parented
+    start = world_location(child)
+    pdt_functions.move_objects([child, parent], delta=(0.0, -1.0, 0.0))
+    assert tuple(world_location(child)) == pytest.approx(tuple(start + Vector((0, -1, 0))))
@@ -0,0 +1,151 @@
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# -----------------------------------------------------------------------
+# Author: Alan Odom (Clockmender), Rune Morling (ermo) Copyright (c) 2019
+# -----------------------------------------------------------------------
+#
+# Tests for pdt_maths, run from the add-on folder with
+#
+#   python -m pytest tests
+#
+# pytest.ini in this folder keeps pytest from treating the add-on folder as a
+# package, whose __init__ needs bpy. pdt_maths only needs NumPy and
+# pdt_exception, so the two modules are loaded as a package of their own instead.
+
+import importlib
+import math
+import os
+import sys
+import types
+
+import numpy as np
+import pytest
+
+ADDON_FOLDER = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = "pdt_maths_test_package"
+
+if PACKAGE not in sys.modules:
+    package = types.ModuleType(PACKAGE)
+    package.__path__ = [ADDON_FOLDER]
+    sys.modules[PACKAGE] = package
+pdt_maths = importlib.import_module(f"{PACKAGE}.pdt_maths")
+MathsError = importlib.import_module(f"{PACKAGE}.pdt_exception").MathsError
+
+
+@pytest.mark.parametrize(
+    "expression, result",
+    [
+        ("factorial(5)", 120.0),
+        ("gcd(12, 18)", 6.0),
+        ("comb(5, 2)", 10.0),
+        ("perm(5, 2)", 20.0),
+        ("isqrt(17)", 4.0),
+        ("2**10", 1024.0),
+        ("7 // 2", 3.0),
+        ("sqrt(16) + 1", 5.0),
+    ],
+)
+def test_evaluate(expression, result):
+    assert pdt_maths.evaluate(expression) == result
+
+
+def test_variables():
+    variables = {"d": 3.0, "a": 90.0, "ans": 2.0}
+    assert pdt_maths.evaluate("d * sin(radians(a)) + ans", variables) == pytest.approx(5.0)
+
+
+def test_variables_are_not_kept():
+    variables = {"d": 3.0}
+    assert pdt_maths.evaluate("d + 1", variables) == 4.0
+    assert variables == {"d": 3.0}
+    with pytest.raises(MathsError):
+        pdt_maths.evaluate("d + 1")
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "9**9**9",
+        "factorial(5.5)",
+        "1/0",
+        "__import__('os')",
+        "(1).real",
+        "[1, 2]",
+        "sqrt(x=4)",
+        "'text'",
+        "_pdt_power(2, 3)",
+        "unknown + 1",
+        "1 +",
+    ],
+)
+def test_rejected(expression):
+    with pytest.raises(MathsError):
+        pdt_maths.evaluate(expression)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "factorial(10**7)",
+        "comb(10**9, 5*10**8)",
+        "factorial(factorial(20))",
+        "perm(10**6, 10**5)",
+        "perm(10**6)",
+        "isqrt(2**1000 * 2**1000 * 2**1000)",
+        "lcm(2**600 + 1, 3**400 + 1)",
+        "comb(10**15, 10**3)",
+    ],
+)
+def test_integer_growth_rejected(expression):
+    with pytest.raises(MathsError):
+        pdt_maths.evaluate(expression)
+
+
+@pytest.mark.parametrize(
+    "expression, result",
+    [
+        ("factorial(170)", float(math.factorial(170))),
+        ("comb(1000, 500)", float(math.comb(1000, 500))),
+        ("comb(10**15, 3)", float(math.comb(10**15, 3))),
+        ("perm(100, 50)", float(math.perm(100, 50))),
+        ("perm(6)", 720.0),
+        ("isqrt(10**300)", 1e150),
+        ("lcm(4, 6, 10)", 60.0),
+    ],
+)
+def test_integer_growth_allowed(expression, result):
+    assert pdt_maths.evaluate(expression) == result
+
+
+def test_checked_power():
+    assert pdt_maths.checked_power(2, 1000) == 2**1000
+    assert pdt_maths.checked_power(-1, 10**12) == 1
+    assert pdt_maths.checked_power(2.0, 0.5) == math.sqrt(2.0)
+    with pytest.raises(OverflowError):
+        pdt_maths.checked_power(10, 10**6)
+
+
+def test_evaluate_range():
+    result = pdt_maths.evaluate_range("sin(radians(t)) * d", 0, 360, 90, {"d": 2.0})
+    assert result == pytest.approx([0.0, 2.0, 0.0, -2.0], abs=1e-12)
+    assert pdt_maths.evaluate_range("d", 0, 3, variables={"d": 5.0}).tolist() == [5.0] * 3
+    assert pdt_maths.evaluate_range("t**2 + pow(2, -1)", 0, 3).tolist() == [0.5, 1.5, 4.5]
+    assert np.isnan(pdt_maths.evaluate_range("sqrt(t)", -1, 0)).all()
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "9**9**9",
+        "factorial(t)",
+        "__import__('os')",
+        "t.real",
+        "[t, t]",
+        "sin(x=t)",
+        "_pdt_power(t, 2)",
+        "unknown * t",
+    ],
+)
+def test_range_rejected(expression):
+    with pytest.raises(MathsError):
+        pdt_maths.evaluate_range(expression, 0, 10)